@@ -0,0 +1,340 @@
+# ai_interview/completion_evaluation.py
+"""
+Scoring of a public AI interview once the candidate finishes.
+
+One structured AI call returns the overall score, summary, strengths,
+weaknesses, recommendation, every section score and which answers are
+correct as JSON, which is checked against EVALUATION_SCHEMA and sent back
+for repair when invalid. A session whose evaluation fails is marked FAILED
+and retried in the background with exponential backoff, up to
+INTERVIEW_EVALUATION_RETRIES times; a finish retried by the candidate, or
+a progress poll once the last attempt is INTERVIEW_EVALUATION_TIMEOUT_SECONDS
+old, queues it again after that.
+The job runs in the background and is claimed through the session's
+evaluation_status, so a repeated "finish" or a retry never scores the same
+interview twice at once; the results are written with update_or_create, so
+a rerun replaces rather than duplicates them.
+"""
+import json
+import logging
+import threading
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from ai_platform.interview_app.background import run_in_background
+from ai_platform.interview_app.llm_gateway import get_llm_gateway
+from ai_platform.interview_app.prompt_builder import Section, build_prompt
+from ai_platform.interview_app.question_generation import parse_json_response
+from evaluation.models import Evaluation
+
+from .models import AIInterviewQuestion, AIInterviewResponse, AIInterviewResult, AIInterviewSession
+
+logger = logging.getLogger(__name__)
+
+SECTIONS = ("technical", "behavioral", "coding", "communication", "problem_solving")
+RECOMMENDATIONS = ("Strong Yes", "Yes", "Maybe", "No")
+
+# Shown to the model verbatim; validate_evaluation() enforces it.
+EVALUATION_SCHEMA = {
+    "score": "integer from 0 to 100",
+    "evaluation": "string: a detailed evaluation of the performance",
+    "strengths": ["string"],
+    "weaknesses": ["string: an area for improvement"],
+    "recommendation": " | ".join(RECOMMENDATIONS),
+    "section_scores": {section: "number from 0 to 10" for section in SECTIONS},
+    "correct_answers": ["integer: the number of an answer that is correct"],
+}
+
+
+class EvaluationError(ValueError):
+    """The model did not return a valid evaluation within the attempt limit."""
+
+
+def _is_number(value, low, high):
+    return (
+        isinstance(value, (int, float))
+        and not isinstance(value, bool)
+        and low <= value <= high
+    )
+
+
+def validate_evaluation(data, answer_count):
+    """
+    Return a list of schema violations in data (empty when valid), for an
+    interview with answer_count numbered answers.
+    """
+    if not isinstance(data, dict):
+        return ["the response must be a JSON object"]
+    errors = []
+    if not _is_number(data.get("score"), 0, 100):
+        errors.append("'score' must be a number from 0 to 100")
+    if not isinstance(data.get("evaluation"), str) or not data["evaluation"].strip():
+        errors.append("'evaluation' must be a non-empty string")
+    for field in ("strengths", "weaknesses"):
+        items = data.get(field)
+        if not isinstance(items, list) or not all(isinstance(i, str) for i in items):
+            errors.append(f"'{field}' must be a list of strings")
+    if data.get("recommendation") not in RECOMMENDATIONS:
+        errors.append(f"'recommendation' must be one of {', '.join(RECOMMENDATIONS)}")
+    section_scores = data.get("section_scores")
+    if not isinstance(section_scores, dict):
+        errors.append("'section_scores' must be an object")
+    else:
+        for section in SECTIONS:
+            if not _is_number(section_scores.get(section), 0, 10):
+                errors.append(f"section_scores.{section} must be a number from 0 to 10")
+    correct = data.get("correct_answers")
+    if not isinstance(correct, list) or not all(
+        isinstance(n, int) and not isinstance(n, bool) and 1 <= n <= answer_count
+        for n in correct
+    ):
+        errors.append(
+            f"'correct_answers' must be a list of answer numbers from 1 to {answer_count}"
+        )
+    return errors
+
+
+def _evaluation_prompt(session, qa_text, total_responses, total_questions):
+    interview = session.interview
+    return build_prompt(
+        "interview_evaluation",
+        "You are an expert Talaro interviewer evaluating a candidate's performance.\n"
+        f"Job: {interview.job.job_title if interview.job else 'Technical Role'}\n"
+        f"Candidate: {interview.candidate.full_name}\n"
+        f"Questions Answered: {total_responses}/{total_questions}\n\n"
+        "Score the overall performance and each section, list key strengths and areas for "
+        "improvement, list the numbers of the answers that are correct, and give a hiring "
+        "recommendation. Respond with a single JSON object, "
+        "and nothing else, following this schema:\n"
+        f"{json.dumps(EVALUATION_SCHEMA, indent=2)}",
+        [Section("Questions and Answers:", qa_text)],
+    )
+
+
+def _repair_prompt(original_prompt, response_text, errors):
+    return (
+        f"{original_prompt}\n\n"
+        "--- YOUR PREVIOUS RESPONSE ---\n"
+        f"{response_text}\n\n"
+        "That response is invalid:\n- "
+        + "\n- ".join(errors)
+        + "\n\nReturn the corrected JSON object only."
+    )
+
+
+def generate_evaluation(prompt, answer_count):
+    """The validated evaluation dict; raises EvaluationError when every attempt was invalid."""
+    max_attempts = max(1, getattr(settings, "INTERVIEW_EVALUATION_MAX_ATTEMPTS", 2))
+    request_prompt, errors = prompt, []
+    for attempt in range(1, max_attempts + 1):
+        response_text = get_llm_gateway().generate_text(
+            "interview_evaluation",
+            request_prompt,
+            generation_config={"response_mime_type": "application/json"},
+        )
+        try:
+            data = parse_json_response(response_text)
+        except ValueError as e:
+            errors = [f"the response is not valid JSON ({e})"]
+        else:
+            errors = validate_evaluation(data, answer_count)
+        if not errors:
+            return data
+        logger.warning(f"Invalid evaluation (attempt {attempt}/{max_attempts}): {errors}")
+        request_prompt = _repair_prompt(prompt, response_text, errors)
+    raise EvaluationError(
+        f"No valid evaluation after {max_attempts} attempts: {'; '.join(errors)}"
+    )
+
+
+def _overall_rating(score):
+    if score >= 90:
+        return "excellent"
+    if score >= 75:
+        return "good"
+    if score >= 60:
+        return "average"
+    return "poor"
+
+
+def _claim(session_id):
+    """
+    Mark the session's evaluation RUNNING. Returns the claim's start time,
+    or None if it is done or running and not yet stale.
+    """
+    started_at = timezone.now()
+    stale_before = started_at - timedelta(
+        seconds=getattr(settings, "INTERVIEW_EVALUATION_TIMEOUT_SECONDS", 300)
+    )
+    updated = (
+        AIInterviewSession.objects.filter(id=session_id)
+        .exclude(evaluation_status=AIInterviewSession.EvaluationStatus.DONE)
+        .exclude(
+            evaluation_status=AIInterviewSession.EvaluationStatus.RUNNING,
+            evaluation_started_at__gte=stale_before,
+        )
+        .update(
+            evaluation_status=AIInterviewSession.EvaluationStatus.RUNNING,
+            evaluation_started_at=started_at,
+        )
+    )
+    return started_at if updated else None
+
+
+def _evaluate(session_id, claimed_at):
+    session = AIInterviewSession.objects.select_related(
+        "interview__candidate", "interview__job"
+    ).get(id=session_id)
+    responses = list(
+        AIInterviewResponse.objects.filter(session=session)
+        .select_related("question")
+        .order_by("response_submitted_at")
+    )
+    total_responses = len(responses)
+    total_questions = AIInterviewQuestion.objects.filter(session=session).count()
+    qa_text = "".join(
+        f"{number}. Question: {response.question.question_text}\n"
+        f"Answer: {response.response_text or 'No answer'}\n\n"
+        for number, response in enumerate(responses, start=1)
+    )
+
+    # Errors, an invalid evaluation included, leave the session FAILED, so
+    # finishing the interview again scores it anew.
+    result = generate_evaluation(
+        _evaluation_prompt(session, qa_text, total_responses, total_questions),
+        total_responses,
+    )
+
+    score = round(result["score"])
+    section_scores = {section: float(result["section_scores"][section]) for section in SECTIONS}
+    strengths = [s.strip() for s in result["strengths"] if s.strip()]
+    weaknesses = [w.strip() for w in result["weaknesses"] if w.strip()]
+    recommendation = result["recommendation"]
+    summary = result["evaluation"].strip()
+
+    total_response_time = sum(r.response_duration for r in responses if r.response_duration)
+    avg_response_time = total_response_time / total_responses if total_responses else 0
+    end_time = session.session_ended_at or timezone.now()
+    completion_time = int((end_time - session.created_at).total_seconds())
+    questions_correct = len(set(result["correct_answers"]))
+    overall_rating = _overall_rating(score)
+
+    claim = AIInterviewSession.objects.filter(
+        id=session_id,
+        evaluation_status=AIInterviewSession.EvaluationStatus.RUNNING,
+        evaluation_started_at=claimed_at,
+    )
+    with transaction.atomic():
+        # A run that was taken over must not overwrite the newer results.
+        if not claim.update(evaluation_status=AIInterviewSession.EvaluationStatus.DONE):
+            logger.info(f"Discarding superseded evaluation of AI session {session_id}")
+            return
+        AIInterviewResult.objects.update_or_create(
+            interview=session.interview,
+            defaults={
+                "session": session,
+                "total_score": score / 10,  # Convert 0-100 to 0-10 scale
+                "technical_score": section_scores["technical"],
+                "behavioral_score": section_scores["behavioral"],
+                "coding_score": section_scores["coding"],
+                "communication_score": section_scores["communication"],
+                "problem_solving_score": section_scores["problem_solving"],
+                "questions_attempted": total_responses,
+                "questions_correct": questions_correct,
+                "average_response_time": avg_response_time,
+                "completion_time": completion_time,
+                "ai_summary": summary,
+                "ai_recommendations": recommendation,
+                "strengths": strengths,
+                "weaknesses": weaknesses,
+                "overall_rating": overall_rating,
+                "hire_recommendation": recommendation in ("Strong Yes", "Yes"),
+                "confidence_level": min(10, score / 10),
+            },
+        )
+        Evaluation.objects.update_or_create(
+            interview=session.interview,
+            defaults={
+                "overall_score": score,  # Keep 0-100 scale
+                "traits": ", ".join(strengths),
+                "suggestions": ", ".join(weaknesses),
+                "details": {
+                    "total_questions": total_questions,
+                    "questions_attempted": total_responses,
+                    "questions_correct": questions_correct,
+                    "accuracy": (questions_correct / max(total_responses, 1)) * 100,
+                    "average_response_time": avg_response_time,
+                    "completion_time": completion_time,
+                    "section_scores": section_scores,
+                    "overall_rating": overall_rating,
+                    "ai_summary": summary,
+                    "ai_recommendations": recommendation,
+                    "strengths": strengths,
+                    "weaknesses": weaknesses,
+                    "hire_recommendation": recommendation,
+                },
+            },
+        )
+    logger.info(f"Saved AI evaluation for interview {session.interview_id}: score {score}")
+
+
+def _schedule_retry(session_id, retry):
+    retries = getattr(settings, "INTERVIEW_EVALUATION_RETRIES", 3)
+    if retry >= retries:
+        logger.error(f"Giving up on evaluating AI session {session_id} after {retry} retries")
+        return
+    delay = getattr(settings, "INTERVIEW_EVALUATION_RETRY_BACKOFF_SECONDS", 30) * 2**retry
+    logger.info(f"Retrying evaluation of AI session {session_id} in {delay}s")
+    timer = threading.Timer(
+        delay, run_in_background, args=(evaluate_completed_session, session_id, retry + 1)
+    )
+    timer.daemon = True
+    timer.start()
+
+
+def evaluate_completed_session(session_id, retry=0):
+    """
+    Score a finished session unless that is done or already running. A
+    failed attempt is retried with backoff; retry counts those attempts.
+    """
+    claimed_at = _claim(session_id)
+    if claimed_at is None:
+        return
+    try:
+        _evaluate(session_id, claimed_at)
+    except Exception as e:
+        logger.error(f"Evaluation of AI session {session_id} failed: {e}")
+        AIInterviewSession.objects.filter(
+            id=session_id, evaluation_started_at=claimed_at
+        ).update(evaluation_status=AIInterviewSession.EvaluationStatus.FAILED)
+        _schedule_retry(session_id, retry)
+        raise
+
+
+def start_completion_evaluation(session):
+    """Queue the evaluation of a finished session."""
+    return run_in_background(evaluate_completed_session, session.id)
+
+
+def resume_stalled_evaluation(session):
+    """
+    Queue the evaluation of a finished session whose last attempt failed or
+    stopped reporting more than INTERVIEW_EVALUATION_TIMEOUT_SECONDS ago,
+    e.g. after its retries ran out or the process running them restarted.
+    """
+    stalled = (
+        AIInterviewSession.EvaluationStatus.FAILED,
+        AIInterviewSession.EvaluationStatus.RUNNING,
+    )
+    if session.evaluation_status not in stalled or session.evaluation_started_at is None:
+        return None
+    stale_before = timezone.now() - timedelta(
+        seconds=getattr(settings, "INTERVIEW_EVALUATION_TIMEOUT_SECONDS", 300)
+    )
+    if session.evaluation_started_at >= stale_before:
+        return None
+    logger.info(f"Resuming the stalled evaluation of AI session {session.id}")
+    return start_completion_evaluation(session)
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.6 on 2026-10-17 07:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ai_interview', '0004_add_coding_details_to_ai_result'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='aiinterviewresponse',
+            name='feedback_status',
+            field=models.CharField(blank=True, choices=[('PENDING', 'Pending'), ('GENERATING', 'Generating'), ('READY', 'Ready'), ('FAILED', 'Failed')], help_text='Progress of the ai_feedback, generated in the background in batches', max_length=12, null=True),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.1.6 on 2026-10-17 07:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ai_interview', '0005_aiinterviewresponse_feedback_status'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='aiinterviewsession',
+            name='evaluation_started_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='aiinterviewsession',
+            name='evaluation_status',
+            field=models.CharField(blank=True, choices=[('pending', 'Pending'), ('running', 'Running'), ('done', 'Done'), ('failed', 'Failed')], max_length=10),
+        ),
+    ]
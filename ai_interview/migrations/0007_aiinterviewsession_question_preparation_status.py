@@ -0,0 +1,23 @@
+# Generated by Django 5.1.6 on 2026-10-17 12:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ai_interview', '0006_aiinterviewsession_evaluation_status'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='aiinterviewsession',
+            name='question_preparation_started_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='aiinterviewsession',
+            name='question_preparation_status',
+            field=models.CharField(blank=True, choices=[('preparing', 'Preparing'), ('ready', 'Ready'), ('failed', 'Failed')], max_length=10),
+        ),
+    ]
@@ -46,6 +46,31 @@ class AIInterviewSession(models.Model):
         default=0, help_text="Session duration in seconds"
     )
 
+    # Question Preparation (run in the background once the interview link
+    # is created; see AIInterviewService.prepare_questions)
+    class PreparationStatus(models.TextChoices):
+        PREPARING = "preparing", "Preparing"
+        READY = "ready", "Ready"
+        FAILED = "failed", "Failed"
+
+    question_preparation_status = models.CharField(
+        max_length=10, choices=PreparationStatus.choices, blank=True
+    )
+    question_preparation_started_at = models.DateTimeField(null=True, blank=True)
+
+    # Completion Evaluation (run in the background once the candidate
+    # finishes; see completion_evaluation)
+    class EvaluationStatus(models.TextChoices):
+        PENDING = "pending", "Pending"
+        RUNNING = "running", "Running"
+        DONE = "done", "Done"
+        FAILED = "failed", "Failed"
+
+    evaluation_status = models.CharField(
+        max_length=10, choices=EvaluationStatus.choices, blank=True
+    )
+    evaluation_started_at = models.DateTimeField(null=True, blank=True)
+
     # Error Handling
     error_message = models.TextField(blank=True)
     retry_count = models.PositiveIntegerField(default=0)
@@ -211,6 +236,19 @@ class AIInterviewResponse(models.Model):
         null=True, blank=True, help_text="AI score for this response (0-100)"
     )
     ai_feedback = models.TextField(blank=True, help_text="AI feedback on the response")
+    FEEDBACK_STATUS_CHOICES = [
+        ("PENDING", "Pending"),
+        ("GENERATING", "Generating"),
+        ("READY", "Ready"),
+        ("FAILED", "Failed"),
+    ]
+    feedback_status = models.CharField(
+        max_length=12,
+        choices=FEEDBACK_STATUS_CHOICES,
+        null=True,
+        blank=True,
+        help_text="Progress of the ai_feedback, generated in the background in batches",
+    )
 
     # Quality Metrics
     response_length = models.PositiveIntegerField(
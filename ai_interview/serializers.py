@@ -131,6 +131,7 @@ class AIInterviewResponseSerializer(serializers.ModelSerializer):
             "ai_evaluation",
             "ai_score",
             "ai_feedback",
+            "feedback_status",
             "response_length",
             "confidence_score",
             "question_text",
@@ -145,6 +146,7 @@ class AIInterviewResponseSerializer(serializers.ModelSerializer):
             "ai_evaluation",
             "ai_score",
             "ai_feedback",
+            "feedback_status",
             "response_length",
             "confidence_score",
             "question_text",
@@ -1,3 +1,52 @@
-from django.test import TestCase
+from django.test import SimpleTestCase
 
-# Create your tests here.
+from .completion_evaluation import SECTIONS, validate_evaluation
+
+
+class ValidateEvaluationTests(SimpleTestCase):
+    def valid(self, **overrides):
+        data = {
+            "score": 72,
+            "evaluation": "Solid fundamentals.",
+            "strengths": ["Clear answers"],
+            "weaknesses": ["Limited depth"],
+            "recommendation": "Yes",
+            "section_scores": {section: 7 for section in SECTIONS},
+            "correct_answers": [1, 3],
+        }
+        data.update(overrides)
+        return data
+
+    def test_valid_evaluation(self):
+        self.assertEqual(validate_evaluation(self.valid(), 3), [])
+
+    def test_not_an_object(self):
+        self.assertEqual(
+            validate_evaluation("72", 3), ["the response must be a JSON object"]
+        )
+
+    def test_score_out_of_range(self):
+        self.assertEqual(len(validate_evaluation(self.valid(score=120), 3)), 1)
+        self.assertEqual(len(validate_evaluation(self.valid(score=True), 3)), 1)
+
+    def test_unknown_recommendation(self):
+        self.assertEqual(
+            len(validate_evaluation(self.valid(recommendation="Hire"), 3)), 1
+        )
+
+    def test_missing_section_score(self):
+        scores = {section: 7 for section in SECTIONS[1:]}
+        self.assertEqual(
+            validate_evaluation(self.valid(section_scores=scores), 3),
+            [f"section_scores.{SECTIONS[0]} must be a number from 0 to 10"],
+        )
+
+    def test_correct_answers_must_number_real_answers(self):
+        for correct in ([0], [4], [True], ["1"], 2):
+            with self.subTest(correct=correct):
+                self.assertEqual(
+                    len(validate_evaluation(self.valid(correct_answers=correct), 3)), 1
+                )
+
+    def test_no_correct_answers(self):
+        self.assertEqual(validate_evaluation(self.valid(correct_answers=[]), 3), [])
@@ -5,6 +5,11 @@ from .models import (
     WarningLog,
     TestCase,
     CodeSubmission,
+    TranscriptionJob,
+    CachedResult,
+    EvaluationStage,
+    TTSAudio,
+    MediaFile,
 )
 
 
@@ -17,9 +22,16 @@ class InterviewSessionAdmin(admin.ModelAdmin):
         "status",
         "scheduled_at",
         "created_at",
+        "question_preparation_status",
         "is_evaluated",
     )
-    list_filter = ("status", "is_evaluated", "created_at", "scheduled_at")
+    list_filter = (
+        "status",
+        "question_preparation_status",
+        "is_evaluated",
+        "created_at",
+        "scheduled_at",
+    )
     search_fields = ("session_key", "candidate_name", "candidate_email")
     readonly_fields = ("session_key", "created_at")
     ordering = ("-created_at",)
@@ -27,7 +39,15 @@ class InterviewSessionAdmin(admin.ModelAdmin):
     fieldsets = (
         (
             "Session Information",
-            {"fields": ("session_key", "status", "scheduled_at", "created_at")},
+            {
+                "fields": (
+                    "session_key",
+                    "status",
+                    "scheduled_at",
+                    "created_at",
+                    "question_preparation_status",
+                )
+            },
         ),
         (
             "Candidate Information",
@@ -119,7 +139,11 @@ class InterviewQuestionAdmin(admin.ModelAdmin):
         (
             "Analysis",
             {
-                "fields": ("words_per_minute", "filler_word_count"),
+                "fields": (
+                    "speech_duration_seconds",
+                    "words_per_minute",
+                    "filler_word_count",
+                ),
                 "classes": ("collapse",),
             },
         ),
@@ -175,3 +199,73 @@ class CodeSubmissionAdmin(admin.ModelAdmin):
             },
         ),
     )
+
+
+@admin.register(TranscriptionJob)
+class TranscriptionJobAdmin(admin.ModelAdmin):
+    list_display = (
+        "id",
+        "session",
+        "status",
+        "wait_seconds",
+        "inference_seconds",
+        "created_at",
+    )
+    list_filter = ("status", "created_at")
+    search_fields = ("session__candidate_name",)
+    ordering = ("-created_at",)
+
+
+@admin.register(CachedResult)
+class CachedResultAdmin(admin.ModelAdmin):
+    list_display = (
+        "namespace",
+        "key",
+        "hit_count",
+        "created_at",
+        "last_accessed",
+        "expires_at",
+    )
+    list_filter = ("namespace",)
+    search_fields = ("key",)
+    ordering = ("-last_accessed",)
+
+
+@admin.register(EvaluationStage)
+class EvaluationStageAdmin(admin.ModelAdmin):
+    list_display = ("session", "stage", "status", "started_at", "finished_at")
+    list_filter = ("stage", "status")
+    search_fields = ("session__candidate_name",)
+
+
+@admin.register(TTSAudio)
+class TTSAudioAdmin(admin.ModelAdmin):
+    list_display = (
+        "key",
+        "engine",
+        "size_bytes",
+        "ref_count",
+        "hit_count",
+        "created_at",
+        "last_accessed",
+    )
+    list_filter = ("engine",)
+    search_fields = ("key",)
+    ordering = ("-last_accessed",)
+
+
+@admin.register(MediaFile)
+class MediaFileAdmin(admin.ModelAdmin):
+    list_display = (
+        "path",
+        "category",
+        "size_bytes",
+        "session",
+        "modified_at",
+        "last_swept",
+        "archived_at",
+    )
+    list_filter = ("category",)
+    search_fields = ("path",)
+    raw_id_fields = ("session", "question", "resume")
+    ordering = ("-modified_at",)
@@ -5,13 +5,23 @@ from django.core.serializers import serialize
 from django.core.paginator import Paginator
 from django.views.decorators.csrf import ensure_csrf_cookie
 import json
+import os
 from .models import (
     InterviewSession,
     InterviewQuestion,
     CodeSubmission,
     WarningLog,
     TestCase,
+    TranscriptionJob,
 )
+from .llm_cache import llm_cache
+from .llm_gateway import get_llm_gateway
+from .media_lifecycle import usage_report
+from .result_cache import transcription_cache
+from .transcription_pool import running_transcription_pool
+from .tts_cache import tts_cache
+from .tts_engines import get_tts_engines
+from .model_registry import registry
 from django.db import models
 
 
@@ -154,6 +164,7 @@ def interview_questions_api(request):
                     "audio_url": question.audio_url,
                     "transcribed_answer": question.transcribed_answer,
                     "response_time_seconds": question.response_time_seconds,
+                    "speech_duration_seconds": question.speech_duration_seconds,
                     "words_per_minute": question.words_per_minute,
                     "filler_word_count": question.filler_word_count,
                 }
@@ -436,6 +447,123 @@ def dashboard_stats_api(request):
         return response
 
 
+@csrf_exempt
+@require_http_methods(["GET"])
+def transcription_metrics_api(request):
+    """
+    API endpoint exposing transcription queue backpressure metrics; "pool"
+    is null while this web process has not started its pool
+    """
+    try:
+        pool = running_transcription_pool()
+        response = JsonResponse(
+            {
+                "success": True,
+                "data": {
+                    "pool": pool.metrics() if pool else None,
+                    "cache": transcription_cache.stats(),
+                    "jobs": {
+                        "queued": TranscriptionJob.objects.filter(
+                            status="QUEUED"
+                        ).count(),
+                        "done": TranscriptionJob.objects.filter(status="DONE").count(),
+                        "failed": TranscriptionJob.objects.filter(
+                            status="FAILED"
+                        ).count(),
+                    },
+                },
+            }
+        )
+    except Exception as e:
+        response = JsonResponse({"success": False, "error": str(e)}, status=500)
+    response["Access-Control-Allow-Origin"] = "*"
+    response["Access-Control-Allow-Methods"] = "GET, OPTIONS"
+    response["Access-Control-Allow-Headers"] = "Content-Type"
+    return response
+
+
+@csrf_exempt
+@require_http_methods(["GET"])
+def llm_metrics_api(request):
+    """API endpoint exposing LLM gateway call metrics and cache hit rates"""
+    try:
+        response = JsonResponse(
+            {
+                "success": True,
+                "data": {
+                    "gateway": get_llm_gateway().metrics(),
+                    "cache": llm_cache.stats(),
+                },
+            }
+        )
+    except Exception as e:
+        response = JsonResponse({"success": False, "error": str(e)}, status=500)
+    response["Access-Control-Allow-Origin"] = "*"
+    response["Access-Control-Allow-Methods"] = "GET, OPTIONS"
+    response["Access-Control-Allow-Headers"] = "Content-Type"
+    return response
+
+
+@csrf_exempt
+@require_http_methods(["GET"])
+def tts_metrics_api(request):
+    """API endpoint exposing TTS audio cache size and hit rate, and engine health"""
+    try:
+        response = JsonResponse(
+            {
+                "success": True,
+                "data": {
+                    "cache": tts_cache.stats(),
+                    "engines": get_tts_engines().metrics(),
+                },
+            }
+        )
+    except Exception as e:
+        response = JsonResponse({"success": False, "error": str(e)}, status=500)
+    response["Access-Control-Allow-Origin"] = "*"
+    response["Access-Control-Allow-Methods"] = "GET, OPTIONS"
+    response["Access-Control-Allow-Headers"] = "Content-Type"
+    return response
+
+
+@csrf_exempt
+@require_http_methods(["GET"])
+def media_usage_api(request):
+    """API endpoint reporting media disk usage per category"""
+    try:
+        response = JsonResponse({"success": True, "data": usage_report()})
+    except Exception as e:
+        response = JsonResponse({"success": False, "error": str(e)}, status=500)
+    response["Access-Control-Allow-Origin"] = "*"
+    response["Access-Control-Allow-Methods"] = "GET, OPTIONS"
+    response["Access-Control-Allow-Headers"] = "Content-Type"
+    return response
+
+
+@csrf_exempt
+@require_http_methods(["GET"])
+def model_registry_api(request):
+    """
+    API endpoint reporting loaded models and their memory: those of the web
+    process that served the request (each web worker has its own), and
+    those of its transcription pool's worker processes, where Whisper runs
+    """
+    pool = running_transcription_pool()
+    response = JsonResponse(
+        {
+            "success": True,
+            "data": {
+                "web_process": dict(registry.memory_report(), pid=os.getpid()),
+                "transcription_workers": pool.worker_registries() if pool else [],
+            },
+        }
+    )
+    response["Access-Control-Allow-Origin"] = "*"
+    response["Access-Control-Allow-Methods"] = "GET, OPTIONS"
+    response["Access-Control-Allow-Headers"] = "Content-Type"
+    return response
+
+
 @csrf_exempt
 @require_http_methods(["GET"])
 def test_api(request):
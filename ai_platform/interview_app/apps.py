@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class InterviewAppConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "ai_platform.interview_app"
+
+    def ready(self):
+        import ai_platform.interview_app.signals
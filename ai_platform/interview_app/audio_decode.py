@@ -0,0 +1,44 @@
+# interview_app/audio_decode.py
+import subprocess
+
+import numpy as np
+
+SAMPLE_RATE = 16000
+
+
+class AudioDecodeError(Exception):
+    """Raised when ffmpeg cannot decode an uploaded clip."""
+
+
+def decode_audio_bytes(audio_bytes, sample_rate=SAMPLE_RATE):
+    """
+    Decode an uploaded clip held in memory to a mono float32 array in
+    [-1, 1] at sample_rate, the input Whisper expects.
+
+    This is whisper.load_audio() with the file replaced by pipes: the bytes
+    go to ffmpeg on stdin and raw 16-bit PCM is read back from stdout, so no
+    temporary file is written. Container formats are probed from the stream,
+    which works for the WebM/Ogg/MP3/WAV uploads the portals produce.
+    """
+    cmd = [
+        "ffmpeg",
+        "-threads", "0",
+        "-i", "pipe:0",
+        "-f", "s16le",
+        "-ac", "1",
+        "-acodec", "pcm_s16le",
+        "-ar", str(sample_rate),
+        "pipe:1",
+    ]
+    try:
+        process = subprocess.run(
+            cmd, input=audio_bytes, capture_output=True, check=True
+        )
+    except FileNotFoundError:
+        raise AudioDecodeError("ffmpeg is not installed or not on PATH.")
+    except subprocess.CalledProcessError as e:
+        raise AudioDecodeError(
+            f"Failed to decode audio: {e.stderr.decode(errors='ignore').strip()[-500:]}"
+        )
+
+    return np.frombuffer(process.stdout, np.int16).flatten().astype(np.float32) / 32768.0
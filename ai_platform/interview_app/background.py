@@ -0,0 +1,47 @@
+# interview_app/background.py
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import close_old_connections
+
+logger = logging.getLogger(__name__)
+
+# Shared thread pool for short post-processing work that must not block a
+# request thread (saving results, follow-up generation, ...).
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    global _executor
+
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:  # Double-check locking
+                _executor = ThreadPoolExecutor(
+                    max_workers=getattr(settings, "BACKGROUND_TASK_WORKERS", 4),
+                    thread_name_prefix="interview-bg",
+                )
+    return _executor
+
+
+def run_in_background(func, *args, **kwargs):
+    """
+    Run func(*args, **kwargs) on the shared background thread pool.
+    Database connections are cleaned up around the call, as Django does for
+    requests. Returns the concurrent.futures.Future of the call.
+    """
+
+    def _task():
+        close_old_connections()
+        try:
+            return func(*args, **kwargs)
+        except Exception:
+            logger.exception(f"Background task {func.__name__} failed")
+            raise
+        finally:
+            close_old_connections()
+
+    return _get_executor().submit(_task)
@@ -0,0 +1,234 @@
+# interview_app/chunked_transcription.py
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.utils import timezone
+
+from .background import run_in_background
+from .models import TranscriptionJob
+from .transcription_pool import get_transcription_pool, QueueFullError
+
+logger = logging.getLogger(__name__)
+
+# Attempts, half a second apart, to queue the final pass of an answer while
+# the transcription queue is full.
+STREAM_FINAL_RETRIES = 10
+
+
+class ChunkOrderError(Exception):
+    """Raised when a chunk arrives out of sequence for its stream."""
+
+
+class AnswerStream:
+    """
+    The audio of one answer, uploaded in chunks while the candidate speaks.
+
+    Each new chunk schedules a background pass over the audio recorded since
+    the last committed segment. Every segment except the last (which may be
+    cut mid-word) is committed, so when the final chunk arrives only the
+    tail of the answer is left to transcribe.
+    """
+
+    def __init__(self, session_id, question_id, job, language=None):
+        self.session_id = session_id
+        self.question_id = question_id
+        self.language = language
+        self.job = job
+        self.audio = bytearray()
+        self.next_seq = 0
+        self.committed_text = []
+        self.committed_seconds = 0.0
+        self.speech_seconds = 0.0
+        self.in_flight = False
+        self.final_requested = False
+        self.response_time = None
+        self.last_activity = time.time()
+        self.lock = threading.Lock()
+
+    def append(self, seq, data, is_final, response_time=None):
+        with self.lock:
+            if seq != self.next_seq:
+                raise ChunkOrderError(
+                    f"Expected chunk {self.next_seq} for question {self.question_id}, got {seq}."
+                )
+            self.next_seq += 1
+            self.audio.extend(data)
+            self.last_activity = time.time()
+            if is_final:
+                self.final_requested = True
+                self.response_time = response_time
+                # From here on the job is only waiting for the pool.
+                TranscriptionJob.objects.filter(id=self.job.id).update(
+                    started_at=timezone.now()
+                )
+            if self.in_flight:
+                # The running pass re-checks the stream when it finishes.
+                return
+            self.in_flight = True
+        self._schedule_pass()
+
+    def _submit(self, audio, offset, final):
+        # Partial passes cover audio that is still growing, so they must not
+        # be stored in (or answered from) the transcription cache.
+        future = get_transcription_pool().submit(
+            audio, offset_seconds=offset, language=self.language, cache=final
+        )
+        future.add_done_callback(
+            lambda f: run_in_background(self._on_pass_done, f, final)
+        )
+
+    def _schedule_pass(self):
+        with self.lock:
+            audio = bytes(self.audio)
+            offset = self.committed_seconds
+            final = self.final_requested
+        try:
+            self._submit(audio, offset, final)
+        except QueueFullError:
+            if not final:
+                # Partial passes are opportunistic; try again on the next chunk.
+                with self.lock:
+                    self.in_flight = False
+                return
+            run_in_background(self._retry_final_pass)
+        except Exception as e:
+            with self.lock:
+                self.in_flight = False
+            if final:
+                self._fail(str(e))
+            else:
+                logger.warning(f"Partial transcription failed for {self.question_id}: {e}")
+
+    def _retry_final_pass(self):
+        for _ in range(STREAM_FINAL_RETRIES):
+            time.sleep(0.5)
+            try:
+                self._submit(bytes(self.audio), self.committed_seconds, True)
+            except QueueFullError:
+                continue
+            except Exception as e:
+                self._fail(str(e))
+            return
+        self._fail("Transcription queue is full.")
+
+    def _on_pass_done(self, future, final):
+        try:
+            result = future.result()
+        except Exception as e:
+            if final:
+                self._fail(str(e))
+            else:
+                with self.lock:
+                    self.in_flight = False
+                logger.warning(f"Partial transcription failed for {self.question_id}: {e}")
+            return
+
+        segments = result.get("segments", [])
+        with self.lock:
+            to_commit = segments if final else segments[:-1]
+            for segment in to_commit:
+                self.committed_text.append(segment["text"].strip())
+            # Count speech only up to what is committed; the rest of this
+            # pass is heard again by the next one.
+            window_end = float("inf") if final else (
+                to_commit[-1]["end"] if to_commit else self.committed_seconds
+            )
+            for start, end in result.get("speech_regions", []):
+                self.speech_seconds += max(
+                    0.0, min(end, window_end) - max(start, self.committed_seconds)
+                )
+            if to_commit:
+                self.committed_seconds = to_commit[-1]["end"]
+            # If the final chunk arrived while this partial pass was running,
+            # its append() left the tail for us to schedule.
+            run_final = not final and self.final_requested
+            self.in_flight = run_final
+        if final:
+            self._finish(result)
+        elif run_final:
+            self._schedule_pass()
+
+    def _finish(self, result):
+        from .views import save_transcribed_answer
+
+        transcribed_text = " ".join(t for t in self.committed_text if t)
+        _discard_stream(self.question_id)
+        # A job already failed as stale keeps the failure its client was given.
+        if not TranscriptionJob.objects.filter(id=self.job.id, status="QUEUED").update(
+            status="DONE",
+            transcribed_text=transcribed_text,
+            wait_seconds=result.get("wait_seconds"),
+            inference_seconds=result.get("inference_seconds"),
+            completed_at=timezone.now(),
+        ):
+            return
+        save_transcribed_answer(
+            self.session_id,
+            self.question_id,
+            transcribed_text,
+            self.response_time,
+            self.speech_seconds,
+        )
+
+    def _fail_job(self, error):
+        TranscriptionJob.objects.filter(id=self.job.id, status="QUEUED").update(
+            status="FAILED", error=error, completed_at=timezone.now()
+        )
+
+    def _fail(self, error):
+        logger.error(f"Streaming transcription failed for {self.question_id}: {error}")
+        self._fail_job(error)
+        _discard_stream(self.question_id)
+
+
+# Open streams of this process, keyed by question id. Chunks of one answer
+# must reach the same Django process (sticky routing or a single worker).
+_streams = {}
+_streams_lock = threading.Lock()
+
+
+def _discard_stream(question_id):
+    with _streams_lock:
+        _streams.pop(str(question_id), None)
+
+
+def _evict_stale_streams():
+    idle_limit = getattr(settings, "TRANSCRIPTION_STREAM_IDLE_SECONDS", 300)
+    now = time.time()
+    with _streams_lock:
+        stale = [
+            key
+            for key, stream in _streams.items()
+            if now - stream.last_activity > idle_limit and not stream.in_flight
+        ]
+        stale = [_streams.pop(key) for key in stale]
+    for stream in stale:
+        # Its final chunk never arrived, so the job has no started_at and
+        # fail_stale_transcription_jobs() would never fail it.
+        stream._fail_job("The answer upload was not finished; please record it again.")
+        logger.info(f"Discarded abandoned answer stream for question {stream.question_id}")
+
+
+def append_answer_chunk(session_id, question, seq, data, is_final, response_time=None):
+    """
+    Add one uploaded chunk to the answer stream of question, creating the
+    stream (and its TranscriptionJob) on the first chunk. Returns the job.
+    """
+    _evict_stale_streams()
+    key = str(question.id)
+    with _streams_lock:
+        stream = _streams.get(key)
+        if stream is None:
+            if seq != 0:
+                raise ChunkOrderError(f"No open stream for question {key}.")
+            job = TranscriptionJob.objects.create(
+                session_id=question.session_id, question=question
+            )
+            stream = AnswerStream(
+                session_id, question.id, job, question.session.language_code
+            )
+            _streams[key] = stream
+    stream.append(seq, data, is_final, response_time)
+    return stream.job
@@ -0,0 +1,261 @@
+# interview_app/evaluation_pipeline.py
+"""
+Background AI evaluation of a completed interview session.
+
+The resume-vs-JD and interview-answers evaluations do not depend on each
+other and run concurrently; the overall profile runs once both have
+finished. Every stage records its status in EvaluationStage, and writes only
+its own fields on InterviewSession, so the report view just reads stored
+results and can show progress while the pipeline runs.
+"""
+import logging
+import re
+from collections import Counter
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+from .background import run_in_background
+from .llm_cache import llm_cache
+from .models import EvaluationStage, InterviewQuestion, InterviewSession
+from .prompt_builder import (
+    Section,
+    build_prompt,
+    job_description_section,
+    resume_section,
+)
+
+logger = logging.getLogger(__name__)
+
+INDEPENDENT_STAGES = ("RESUME", "ANSWERS")
+STAGES = INDEPENDENT_STAGES + ("OVERALL",)
+
+
+def _generate(prompt, call_type):
+    return llm_cache.generate_text(call_type, prompt)
+
+
+def _score(pattern, text):
+    match = re.search(pattern, text)
+    return float(match.group(1)) if match else None
+
+
+def evaluate_resume(session):
+    prompt = build_prompt(
+        "resume_evaluation",
+        "You are an expert technical recruiter. Analyze the following resume against the provided job description. "
+        "Provide a score from 0.0 to 10.0 indicating how well the candidate's experience aligns with the job requirements. "
+        "Also provide a brief analysis. Format your response EXACTLY as follows:\n\n"
+        "SCORE: [Your score, e.g., 8.2]\n"
+        "ANALYSIS: [Your one-paragraph analysis here.]",
+        [
+            job_description_section("JOB DESCRIPTION:", session.job_description),
+            resume_section("RESUME:", session.resume_summary, session.resume_text),
+        ],
+    )
+    # Depends only on the resume and JD, so repeat rounds reuse the result.
+    text = _generate(prompt, call_type="resume_evaluation")
+    return {"resume_score": _score(r"SCORE:\s*([\d\.]+)", text), "resume_feedback": text}
+
+
+def evaluate_answers(session):
+    qa_text = "".join(
+        [
+            f"Question: {item.question_text}\nAnswer: {item.transcribed_answer or 'No answer provided.'}\n\n"
+            for item in session.questions.all().order_by("order")
+            if item.question_type != "CODING"
+        ]
+    )
+
+    code_text = ""
+    for submission in session.code_submissions.all():
+        # Get the question text from the question_id
+        try:
+            question_text = InterviewQuestion.objects.get(
+                id=submission.question_id
+            ).question_text
+        except InterviewQuestion.DoesNotExist:
+            question_text = f"Question ID: {submission.question_id}"
+
+        code_text += f"Coding Challenge: {question_text}\n"
+        code_text += f"Language: {submission.language}\n"
+        code_text += f"Test Case Results:\n{submission.output_log}\n"
+        code_text += f"Submitted Code:\n```\n{submission.submitted_code}\n```\n\n"
+
+    prompt = build_prompt(
+        "answers_evaluation",
+        "You are an expert technical hiring manager. Evaluate the candidate's complete interview performance, "
+        "which includes both spoken answers and a code submission. Provide an overall score from 0.0 to 10.0 "
+        "and a brief summary of their strengths and areas for improvement based on ALL provided materials.\n\n"
+        "Consider the following:\n"
+        "- For spoken answers, evaluate clarity, relevance, and communication skills.\n"
+        "- For the coding submission, evaluate correctness (did it pass the tests?), problem-solving, and code quality.\n"
+        "- A strong coding performance can significantly boost a score, even if spoken answers are weak. Conversely, failing coding tests is a major negative signal.\n\n"
+        "Format your response EXACTLY as follows:\n\n"
+        "SCORE: [Your score, e.g., 7.5]\n"
+        "FEEDBACK: [Your detailed, holistic feedback here.]",
+        [
+            Section(
+                "--- SPOKEN QUESTIONS & ANSWERS ---",
+                qa_text or "No spoken answers provided.",
+            ),
+            Section(
+                "--- CODING CHALLENGE SUBMISSION ---", code_text or "No code submitted."
+            ),
+        ],
+    )
+    text = _generate(prompt, call_type="answers_evaluation")
+    return {"answers_score": _score(r"SCORE:\s*([\d\.]+)", text), "answers_feedback": text}
+
+
+def evaluate_overall(session):
+    warning_counts = Counter(
+        [
+            log.warning_type.replace("_", " ").title()
+            for log in session.logs.all()
+            if log.warning_type != "excessive_movement"
+        ]
+    )
+    warning_summary = (
+        ", ".join([f"{count}x {name}" for name, count in warning_counts.items()])
+        or "None"
+    )
+    prompt = (
+        "You are a senior hiring manager. You have been provided with a holistic view of a candidate's interview, "
+        "including their resume fit, interview answer performance, and proctoring warnings. "
+        "Synthesize all this information into a final recommendation. "
+        "Provide a final 'Overall Score' from 0.0 to 10.0 and a concluding 'Hiring Recommendation' paragraph.\n\n"
+        "DATA PROVIDED:\n"
+        f"- Resume vs. Job Description Score: {session.resume_score or 'N/A'}/10\n"
+        f"- Interview Answers Score: {session.answers_score or 'N/A'}/10\n"
+        f"- Proctoring Warnings: {warning_summary}\n\n"
+        "Format your response EXACTLY as follows:\n\n"
+        "OVERALL SCORE: [Your final blended score, e.g., 7.8]\n"
+        "HIRING RECOMMENDATION: [Your final concluding paragraph on whether to proceed with the candidate and why.]"
+    )
+    text = _generate(prompt, call_type="overall_evaluation")
+    return {
+        "overall_performance_score": _score(r"OVERALL SCORE:\s*([\d\.]+)", text),
+        "overall_performance_feedback": text,
+    }
+
+
+# Stage -> (runner, fields saved when the stage fails)
+STAGE_RUNNERS = {
+    "RESUME": (
+        evaluate_resume,
+        {"resume_feedback": "An error occurred during resume evaluation."},
+    ),
+    "ANSWERS": (
+        evaluate_answers,
+        {"answers_feedback": "An error occurred during answers evaluation."},
+    ),
+    "OVERALL": (
+        evaluate_overall,
+        {"overall_performance_feedback": "An error occurred."},
+    ),
+}
+
+
+def _claim(session_id, stage):
+    """Atomically move a stage from PENDING to RUNNING; False if taken."""
+    return (
+        EvaluationStage.objects.filter(
+            session_id=session_id, stage=stage, status="PENDING"
+        ).update(status="RUNNING", started_at=timezone.now(), error=None)
+        == 1
+    )
+
+
+def run_stage(session_id, stage):
+    if not _claim(session_id, stage):
+        return
+    runner, fallback_fields = STAGE_RUNNERS[stage]
+    session = InterviewSession.objects.get(id=session_id)
+    logger.info(f"Running {stage} evaluation for session {session_id}")
+    try:
+        fields = runner(session)
+        status, error = "DONE", None
+    except Exception as e:
+        logger.error(f"{stage} evaluation failed for session {session_id}: {e}")
+        fields, status, error = fallback_fields, "FAILED", str(e)
+
+    # Update only this stage's columns: the other stage may be saving too.
+    InterviewSession.objects.filter(id=session_id).update(**fields)
+    EvaluationStage.objects.filter(session_id=session_id, stage=stage).update(
+        status=status, error=error, finished_at=timezone.now()
+    )
+
+    if stage in INDEPENDENT_STAGES:
+        _run_overall_when_ready(session_id)
+    else:
+        InterviewSession.objects.filter(id=session_id).update(is_evaluated=True)
+
+
+def _run_overall_when_ready(session_id):
+    finished = EvaluationStage.objects.filter(
+        session_id=session_id,
+        stage__in=INDEPENDENT_STAGES,
+        status__in=("DONE", "FAILED"),
+    ).count()
+    if finished == len(INDEPENDENT_STAGES):
+        # Both finishing stages may get here; _claim lets only one run it.
+        run_stage(session_id, "OVERALL")
+
+
+def _has_content_to_evaluate(session):
+    has_spoken_answers = session.questions.filter(
+        transcribed_answer__isnull=False, transcribed_answer__gt=""
+    ).exists()
+    return has_spoken_answers or session.code_submissions.exists()
+
+
+def start_session_evaluation(session):
+    """
+    Queue the evaluation of session in the background. Safe to call more
+    than once: stages already running or finished are left alone, and
+    stages stuck in RUNNING past EVALUATION_STAGE_TIMEOUT_SECONDS (e.g. after
+    a restart) are retried.
+    """
+    if (
+        session.language_code != "en"
+        or session.is_evaluated
+        or not _has_content_to_evaluate(session)
+    ):
+        return False
+
+    for stage in STAGES:
+        EvaluationStage.objects.get_or_create(session=session, stage=stage)
+    stale_before = timezone.now() - timedelta(
+        seconds=getattr(settings, "EVALUATION_STAGE_TIMEOUT_SECONDS", 300)
+    )
+    EvaluationStage.objects.filter(
+        session=session, status="RUNNING", started_at__lt=stale_before
+    ).update(status="PENDING")
+
+    pending = set(
+        EvaluationStage.objects.filter(session=session, status="PENDING").values_list(
+            "stage", flat=True
+        )
+    )
+    for stage in INDEPENDENT_STAGES:
+        if stage in pending:
+            run_in_background(run_stage, session.id, stage)
+    if "OVERALL" in pending and not pending & set(INDEPENDENT_STAGES):
+        run_in_background(_run_overall_when_ready, session.id)
+    return True
+
+
+def evaluation_progress(session):
+    """Stage statuses of a session for display, in pipeline order."""
+    stages = {s.stage: s for s in session.evaluation_stages.all()}
+    labels = dict(EvaluationStage.STAGE_CHOICES)
+    return [
+        {
+            "stage": stage,
+            "label": labels[stage],
+            "status": stages[stage].status if stage in stages else "PENDING",
+        }
+        for stage in STAGES
+    ]
@@ -0,0 +1,283 @@
+# interview_app/llm_backends.py
+"""
+Backends that the LLM gateway sends calls to, selected by settings.LLM_BACKEND.
+
+"gemini" calls Google Gemini. "offline" is a deterministic local stand-in
+for load tests and CI. It answers every call type the app makes in the
+format its call site parses, with content derived from a hash of the prompt.
+Artificial latency and injected errors are configurable, so the Django side
+can be benchmarked at scale on a machine with no network access.
+"""
+import hashlib
+import json
+import logging
+import random
+import re
+import threading
+import time
+from types import SimpleNamespace
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+class LLMBackendError(Exception):
+    """A failed call, with the HTTP status code the backend reported."""
+
+    def __init__(self, message, code=500):
+        super().__init__(message)
+        self.code = code
+
+
+class LLMResponse:
+    """The parts of a Gemini response the app uses."""
+
+    def __init__(self, text, prompt_tokens=0, output_tokens=0):
+        self.text = text
+        self.usage_metadata = SimpleNamespace(
+            prompt_token_count=prompt_tokens, candidates_token_count=output_tokens
+        )
+
+
+class GeminiBackend:
+    name = "gemini"
+
+    def __init__(self, model_name, api_key=None):
+        import google.generativeai as genai
+
+        self._genai = genai
+        self.model_name = model_name
+        if api_key:
+            genai.configure(api_key=api_key)
+        else:
+            logger.warning("GEMINI_API_KEY is not set; Gemini calls will fail.")
+        self._models = {}
+        self._lock = threading.Lock()
+
+    def _model(self, generation_config=None):
+        """GenerativeModel objects are reused; they share the configured client."""
+        key = tuple(sorted((generation_config or {}).items()))
+        with self._lock:
+            if key not in self._models:
+                self._models[key] = self._genai.GenerativeModel(
+                    self.model_name, generation_config=generation_config
+                )
+            return self._models[key]
+
+    def generate_content(self, call_type, contents, generation_config=None, timeout=None):
+        return self._model(generation_config).generate_content(
+            contents, request_options={"timeout": timeout}
+        )
+
+
+# --- Offline stand-in ---
+
+TOPICS = (
+    "REST API design",
+    "database indexing",
+    "unit testing",
+    "caching strategies",
+    "asynchronous processing",
+    "code review",
+)
+UNSURE_PHRASES = ("not sure", "don't know", "do not know", "only know the basics", "basic knowledge")
+
+
+def _prompt_text(contents):
+    """The text parts of contents (a prompt string or a list of parts)."""
+    if isinstance(contents, str):
+        return contents
+    return "\n".join(part for part in contents if isinstance(part, str))
+
+
+def _score(rng, low, high):
+    return round(rng.uniform(low, high), 1)
+
+
+def _question_set(prompt, rng):
+    role = re.search(r"for a '(.+?)' role", prompt)
+    role = role.group(1) if role else "Technical Role"
+    topics = rng.sample(TOPICS, 3)
+    data = {
+        "resume_summary": f"Experienced candidate for the {role} role with skills in {', '.join(topics)}.",
+        "questions": [
+            {
+                "type": "Ice-Breaker",
+                "text": f"Welcome! Your resume mentions {topics[0]}. Can you tell me about a project where you used it?",
+            },
+            {
+                "type": "Technical Questions",
+                "text": f"How would you approach {topics[1]} as a {role}?",
+            },
+            {
+                "type": "Technical Questions",
+                "text": f"What trade-offs do you consider when working on {topics[2]}?",
+            },
+            {
+                "type": "Behavioral Questions",
+                "text": "Describe a time you disagreed with a teammate and how you resolved it.",
+            },
+            {
+                "type": "Behavioral Questions",
+                "text": "Tell me about a deadline you nearly missed. What did you do?",
+            },
+        ],
+        "coding_question": None,
+    }
+    if "Include a short coding question" in prompt:
+        data["coding_question"] = {
+            "title": "Reverse String",
+            "description": "Read a line from stdin and print it reversed.",
+            "language": "PYTHON",
+            "starter_code": "s = input()\n# Your code here",
+            "test_cases": [
+                {"input": "hello", "output": "olleh"},
+                {"input": "world", "output": "dlrow"},
+                {"input": "python", "output": "nohtyp"},
+            ],
+        }
+    return json.dumps(data)
+
+
+def _follow_up(prompt, rng):
+    answer = re.search(r"transcribed answer:\n'(.*)'\n\n", prompt, re.DOTALL)
+    answer = answer.group(1).lower() if answer else ""
+    if not any(phrase in answer for phrase in UNSURE_PHRASES):
+        return "NO_FOLLOW_UP"
+    return (
+        "That's perfectly fine. Could you then explain the part of it you have "
+        f"worked with, for example in {rng.choice(TOPICS)}?"
+    )
+
+
+def _resume_evaluation(prompt, rng):
+    return (
+        f"SCORE: {_score(rng, 5, 9.5)}\n"
+        "ANALYSIS: The candidate's experience covers most of the core requirements "
+        "of the job description, with some gaps in the secondary skills."
+    )
+
+
+def _answers_evaluation(prompt, rng):
+    return (
+        f"SCORE: {_score(rng, 4, 9.5)}\n"
+        "FEEDBACK: Clear and relevant answers with good structure. The candidate "
+        "could go deeper on technical trade-offs."
+    )
+
+
+def _overall_evaluation(prompt, rng):
+    return (
+        f"OVERALL SCORE: {_score(rng, 4, 9.5)}\n"
+        "HIRING RECOMMENDATION: Proceed to the next round; the candidate's resume "
+        "fit and interview answers are solid."
+    )
+
+
+def _answer_feedback(prompt, rng):
+    answers = re.findall(r"^--- ANSWER (\d+) ---$", prompt, re.MULTILINE)
+    return json.dumps(
+        {
+            "feedback": [
+                {
+                    "answer": int(number),
+                    "feedback": "Thank you, that was a clear answer. An example from "
+                    f"your work with {rng.choice(TOPICS)} would make it stronger.",
+                }
+                for number in answers
+            ]
+        }
+    )
+
+
+def _interview_evaluation(prompt, rng):
+    score = rng.randint(50, 95)
+    return json.dumps(
+        {
+            "score": score,
+            "evaluation": "The candidate answered the questions with relevant examples "
+            "and communicated clearly.",
+            "strengths": ["Clear communication", "Relevant experience"],
+            "weaknesses": ["Technical depth", "Concise answers"],
+            "recommendation": "Strong Yes" if score >= 85 else "Yes" if score >= 70 else "Maybe",
+            "section_scores": {
+                section: _score(rng, 4, 10)
+                for section in ("technical", "behavioral", "coding", "communication", "problem_solving")
+            },
+        }
+    )
+
+
+def _summary(prompt, rng):
+    return f"Summary: experience with {', '.join(rng.sample(TOPICS, 3))}."
+
+
+class OfflineBackend:
+    """
+    Deterministic stand-in for Gemini: the same prompt always gets the same
+    response. latency (plus up to latency_jitter) seconds are slept per call,
+    and a fraction error_rate of calls fails with a retryable 503.
+    """
+
+    name = "offline"
+
+    def __init__(self, latency=0.0, latency_jitter=0.0, error_rate=0.0, id_name="Test Candidate"):
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.id_name = id_name
+        self._random = random.Random()
+        self._lock = threading.Lock()
+        self._responders = {
+            "question_set": _question_set,
+            "follow_up": _follow_up,
+            "resume_evaluation": _resume_evaluation,
+            "answers_evaluation": _answers_evaluation,
+            "overall_evaluation": _overall_evaluation,
+            "answer_feedback": _answer_feedback,
+            "interview_evaluation": _interview_evaluation,
+            "id_ocr": self._id_ocr,
+        }
+
+    def _id_ocr(self, prompt, rng):
+        # Verification checks the name against the candidate's, so load-test
+        # candidates should be registered under LLM_OFFLINE_ID_NAME.
+        return f"Name: {self.id_name}\nID Number: {rng.randint(10**8, 10**9 - 1)}"
+
+    def generate_content(self, call_type, contents, generation_config=None, timeout=None):
+        with self._lock:
+            delay = self.latency + self._random.uniform(0, self.latency_jitter)
+            fail = self._random.random() < self.error_rate
+        if timeout and delay > timeout:
+            time.sleep(timeout)
+            raise LLMBackendError(f"Offline {call_type} call timed out", code=504)
+        time.sleep(delay)
+        if fail:
+            raise LLMBackendError(f"Injected offline {call_type} failure", code=503)
+
+        prompt = _prompt_text(contents)
+        rng = random.Random(hashlib.sha256(prompt.encode("utf-8")).digest())
+        text = self._responders.get(call_type, _summary)(prompt, rng)
+        return LLMResponse(
+            text, prompt_tokens=len(prompt.split()), output_tokens=len(text.split())
+        )
+
+
+def get_llm_backend():
+    """The backend named by settings.LLM_BACKEND ("gemini" or "offline")."""
+    backend = getattr(settings, "LLM_BACKEND", "gemini")
+    if backend == "offline":
+        logger.warning("Using the offline LLM stand-in; responses are not generated by Gemini.")
+        return OfflineBackend(
+            latency=getattr(settings, "LLM_OFFLINE_LATENCY_SECONDS", 0.0),
+            latency_jitter=getattr(settings, "LLM_OFFLINE_LATENCY_JITTER_SECONDS", 0.0),
+            error_rate=getattr(settings, "LLM_OFFLINE_ERROR_RATE", 0.0),
+            id_name=getattr(settings, "LLM_OFFLINE_ID_NAME", "Test Candidate"),
+        )
+    if backend != "gemini":
+        raise ValueError(f"Unknown LLM_BACKEND {backend!r}; use 'gemini' or 'offline'")
+    return GeminiBackend(
+        model_name=getattr(settings, "AI_MODEL_NAME", "gemini-1.5-flash-latest"),
+        api_key=getattr(settings, "GEMINI_API_KEY", None),
+    )
@@ -0,0 +1,101 @@
+# interview_app/llm_cache.py
+"""
+Cache of Gemini responses, keyed on the model name, the generation config
+and a hash of the whitespace-normalized prompt. Whether and for how long a
+response is cached depends on its call type: deterministic work over shared
+inputs (condensed job descriptions, resume-vs-JD scoring) is cached,
+conversational calls such as follow-up questions never are.
+"""
+import json
+import logging
+import threading
+from collections import defaultdict
+
+from django.conf import settings
+
+from .llm_gateway import get_llm_gateway
+from .result_cache import ResultCache, content_key
+
+logger = logging.getLogger(__name__)
+
+DAY = 24 * 60 * 60
+
+# Seconds a response of each call type stays cached. Call types not listed
+# here (or with a TTL of 0) are not cached.
+DEFAULT_LLM_CACHE_TTLS = {
+    "resume_evaluation": 7 * DAY,
+    "job_description_summary": 30 * DAY,
+}
+
+
+def cache_ttl(call_type):
+    """TTL for a call type; settings.LLM_CACHE_TTLS overrides the defaults."""
+    ttls = dict(DEFAULT_LLM_CACHE_TTLS)
+    ttls.update(getattr(settings, "LLM_CACHE_TTLS", {}))
+    return ttls.get(call_type, 0)
+
+
+def normalize_prompt(prompt):
+    """Collapse whitespace so formatting-only differences share an entry."""
+    return " ".join(prompt.split())
+
+
+class LLMCache:
+    """ResultCache of response texts, with hit and miss counts per call type."""
+
+    def __init__(self, max_entries):
+        self._cache = ResultCache("llm", max_entries)
+        self._lock = threading.Lock()
+        self._counts = defaultdict(lambda: {"hits": 0, "misses": 0})
+
+    def _count(self, call_type, outcome):
+        with self._lock:
+            self._counts[call_type][outcome] += 1
+
+    def generate_text(self, call_type, prompt, generation_config=None):
+        """
+        The text the LLM returns for prompt (through the LLM gateway), served
+        from the cache when the call type is cacheable and the same backend
+        and model have answered the same prompt with the same
+        generation_config before.
+        """
+        gateway = get_llm_gateway()
+        ttl = cache_ttl(call_type)
+        if not ttl or not getattr(settings, "LLM_CACHE_ENABLED", True):
+            return gateway.generate_text(call_type, prompt, generation_config)
+
+        key = content_key(
+            gateway.backend.name,
+            gateway.model_name,
+            json.dumps(generation_config or {}, sort_keys=True),
+            normalize_prompt(prompt),
+        )
+        try:
+            cached = self._cache.get(key)
+        except Exception as e:
+            logger.warning(f"LLM cache lookup failed: {e}")
+            cached = None
+        if cached is not None:
+            self._count(call_type, "hits")
+            return cached["text"]
+
+        self._count(call_type, "misses")
+        text = gateway.generate_text(call_type, prompt, generation_config)
+        try:
+            self._cache.set(key, {"call_type": call_type, "text": text}, ttl=ttl)
+        except Exception as e:
+            logger.warning(f"Could not cache {call_type} response: {e}")
+        return text
+
+    def stats(self):
+        stats = self._cache.stats()
+        with self._lock:
+            counts = {call_type: dict(c) for call_type, c in self._counts.items()}
+        for c in counts.values():
+            lookups = c["hits"] + c["misses"]
+            c["hit_rate"] = round(c["hits"] / lookups, 3) if lookups else 0.0
+        stats["call_types"] = counts
+        return stats
+
+
+llm_cache = LLMCache(max_entries=getattr(settings, "LLM_CACHE_MAX_ENTRIES", 2000))
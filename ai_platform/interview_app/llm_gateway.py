@@ -0,0 +1,283 @@
+# interview_app/llm_gateway.py
+"""
+The single entry point for LLM calls, which it sends to the configured
+backend (Gemini, or the offline stand-in; see llm_backends).
+
+The gateway bounds every call: a global and an optional per-call-type concurrency limit, a
+per-call timeout, jittered exponential backoff on rate limiting (429) and
+server errors (5xx), and a circuit breaker that fails fast while the LLM is
+down instead of tying up request threads. Latency, token and error counts
+are recorded per call type (the name of the call site).
+"""
+import logging
+import random
+import threading
+import time
+from collections import defaultdict, deque
+
+from django.conf import settings
+
+from .llm_backends import get_llm_backend
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+LATENCY_SAMPLES = 200
+
+
+class LLMGatewayError(Exception):
+    """A Gemini call could not be made or did not succeed."""
+
+
+class LLMUnavailableError(LLMGatewayError):
+    """Rejected without calling Gemini: the circuit is open or the gateway is saturated."""
+
+
+def _is_retryable(error):
+    # Google API errors and LLMBackendError carry the HTTP status as .code.
+    code = getattr(error, "code", None)
+    if isinstance(code, int):
+        return code in RETRYABLE_STATUS_CODES
+    return isinstance(error, (TimeoutError, ConnectionError))
+
+
+class CircuitBreaker:
+    """
+    Opens after failure_threshold consecutive failed calls and rejects calls
+    for reset_seconds; then lets a single trial call through (half-open),
+    closing again if it succeeds.
+    """
+
+    def __init__(self, failure_threshold, reset_seconds, name="LLM"):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self):
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if time.monotonic() - self._opened_at < self.reset_seconds:
+                return "open"
+            return "half-open"
+
+    def allow(self):
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if time.monotonic() - self._opened_at < self.reset_seconds:
+                return False
+            if self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._trial_in_flight or (
+                self._opened_at is None and self._failures >= self.failure_threshold
+            ):
+                logger.warning(f"Opening the {self.name} circuit after {self._failures} failures")
+                self._opened_at = time.monotonic()
+                self._trial_in_flight = False
+
+
+class LLMGateway:
+    def __init__(
+        self,
+        backend,
+        model_name,
+        max_concurrency=8,
+        call_type_concurrency=None,
+        timeout=30.0,
+        max_retries=3,
+        backoff_base=0.5,
+        backoff_max=8.0,
+        queue_timeout=10.0,
+        breaker=None,
+    ):
+        self.backend = backend
+        self.model_name = model_name
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.queue_timeout = queue_timeout
+        self.breaker = breaker or CircuitBreaker(failure_threshold=5, reset_seconds=30)
+
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._max_concurrency = max_concurrency
+        self._call_type_slots = {
+            call_type: threading.BoundedSemaphore(limit)
+            for call_type, limit in (call_type_concurrency or {}).items()
+        }
+        self._lock = threading.Lock()
+        self._stats = defaultdict(
+            lambda: {
+                "calls": 0,
+                "errors": 0,
+                "retries": 0,
+                "rejected": 0,
+                "prompt_tokens": 0,
+                "output_tokens": 0,
+                "latencies": deque(maxlen=LATENCY_SAMPLES),
+            }
+        )
+
+    def _record(self, call_type, **counts):
+        with self._lock:
+            stats = self._stats[call_type]
+            latency = counts.pop("latency", None)
+            if latency is not None:
+                stats["latencies"].append(latency)
+            for name, value in counts.items():
+                stats[name] += value
+
+    def _backoff(self, attempt):
+        # Full jitter: spreads out the retries of concurrent callers.
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+
+    def _acquire(self, call_type):
+        """Take a global slot and the call type's slot; returns what to release."""
+        deadline = time.monotonic() + self.queue_timeout
+        if not self._slots.acquire(timeout=self.queue_timeout):
+            raise LLMUnavailableError("Too many concurrent LLM calls")
+        held = [self._slots]
+        call_type_slots = self._call_type_slots.get(call_type)
+        if call_type_slots is not None:
+            if not call_type_slots.acquire(timeout=max(0, deadline - time.monotonic())):
+                self._slots.release()
+                raise LLMUnavailableError(f"Too many concurrent {call_type} calls")
+            held.append(call_type_slots)
+        return held
+
+    def generate(self, call_type, contents, generation_config=None, timeout=None):
+        """
+        The backend's generate_content(contents) under the gateway's limits.
+        Returns the response; raises LLMUnavailableError when the call was
+        rejected and the last error when every attempt failed.
+        """
+        timeout = timeout or self.timeout
+        for attempt in range(self.max_retries + 1):
+            try:
+                held = self._acquire(call_type)
+            except LLMUnavailableError:
+                self._record(call_type, rejected=1)
+                raise
+            try:
+                if not self.breaker.allow():
+                    self._record(call_type, rejected=1)
+                    raise LLMUnavailableError("LLM circuit is open")
+                started_at = time.monotonic()
+                try:
+                    response = self.backend.generate_content(
+                        call_type, contents, generation_config, timeout
+                    )
+                except Exception as e:
+                    error = e
+                else:
+                    error = None
+            finally:
+                for slots in reversed(held):
+                    slots.release()
+            latency = time.monotonic() - started_at
+
+            if error is None:
+                self.breaker.record_success()
+                usage = getattr(response, "usage_metadata", None)
+                self._record(
+                    call_type,
+                    calls=1,
+                    latency=latency,
+                    prompt_tokens=getattr(usage, "prompt_token_count", 0) or 0,
+                    output_tokens=getattr(usage, "candidates_token_count", 0) or 0,
+                )
+                return response
+
+            retryable = _is_retryable(error)
+            if retryable:
+                self.breaker.record_failure()
+            else:
+                # The LLM answered (e.g. 400 for a bad request): it is up.
+                self.breaker.record_success()
+            self._record(call_type, calls=1, errors=1, latency=latency)
+            if not retryable or attempt == self.max_retries:
+                logger.error(f"LLM {call_type} call failed: {error}")
+                raise error
+            delay = self._backoff(attempt)
+            logger.warning(
+                f"LLM {call_type} call failed ({error}); retrying in {delay:.1f}s"
+            )
+            self._record(call_type, retries=1)
+            time.sleep(delay)
+
+    def generate_text(self, call_type, contents, generation_config=None, timeout=None):
+        return self.generate(call_type, contents, generation_config, timeout).text
+
+    def metrics(self):
+        with self._lock:
+            call_types = {}
+            for call_type, stats in self._stats.items():
+                latencies = sorted(stats["latencies"])
+                call_types[call_type] = {
+                    name: value for name, value in stats.items() if name != "latencies"
+                }
+                call_types[call_type]["latency_p50_seconds"] = (
+                    round(latencies[len(latencies) // 2], 3) if latencies else None
+                )
+                call_types[call_type]["latency_p95_seconds"] = (
+                    round(latencies[int(len(latencies) * 0.95)], 3)
+                    if latencies
+                    else None
+                )
+        return {
+            "backend": self.backend.name,
+            "model": self.model_name,
+            "max_concurrency": self._max_concurrency,
+            "circuit": self.breaker.state,
+            "call_types": call_types,
+        }
+
+
+_gateway = None
+_gateway_lock = threading.Lock()
+
+
+def get_llm_gateway():
+    global _gateway
+
+    if _gateway is None:
+        with _gateway_lock:
+            if _gateway is None:  # Double-check locking
+                _gateway = LLMGateway(
+                    backend=get_llm_backend(),
+                    model_name=getattr(
+                        settings, "AI_MODEL_NAME", "gemini-1.5-flash-latest"
+                    ),
+                    max_concurrency=getattr(settings, "LLM_MAX_CONCURRENCY", 8),
+                    call_type_concurrency=getattr(
+                        settings, "LLM_CALL_TYPE_CONCURRENCY", {}
+                    ),
+                    timeout=getattr(settings, "LLM_TIMEOUT_SECONDS", 30),
+                    max_retries=getattr(settings, "LLM_MAX_RETRIES", 3),
+                    queue_timeout=getattr(settings, "LLM_QUEUE_TIMEOUT_SECONDS", 10),
+                    breaker=CircuitBreaker(
+                        failure_threshold=getattr(
+                            settings, "LLM_CIRCUIT_FAILURE_THRESHOLD", 5
+                        ),
+                        reset_seconds=getattr(settings, "LLM_CIRCUIT_RESET_SECONDS", 30),
+                    ),
+                )
+    return _gateway
@@ -0,0 +1 @@
+# Management commands for interview_app
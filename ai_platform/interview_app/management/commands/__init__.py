@@ -0,0 +1 @@
+# Interview app management commands
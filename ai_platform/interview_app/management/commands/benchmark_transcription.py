@@ -0,0 +1,235 @@
+import json
+import subprocess
+import threading
+import time
+from concurrent.futures import wait
+from pathlib import Path
+
+import psutil
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from ai_platform.interview_app.audio_decode import decode_audio_bytes, SAMPLE_RATE
+from ai_platform.interview_app.transcription_pool import TranscriptionPool
+
+AUDIO_EXTENSIONS = {".mp3", ".wav", ".webm", ".ogg", ".m4a", ".flac"}
+STAGES = ("decode", "vad", "model", "postprocess")
+
+
+def _percentile(samples, percentile):
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(percentile / 100 * (len(ordered) - 1))))
+    return round(ordered[index], 3)
+
+
+def _distribution(samples):
+    return {
+        "p50": _percentile(samples, 50),
+        "p95": _percentile(samples, 95),
+        "max": round(max(samples), 3) if samples else 0.0,
+    }
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=settings.BASE_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class RssSampler(threading.Thread):
+    """Tracks the peak resident memory of this process plus its workers."""
+
+    def __init__(self, interval=0.1):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.peak_bytes = 0
+        self._stop_event = threading.Event()
+
+    def run(self):
+        process = psutil.Process()
+        while not self._stop_event.is_set():
+            total = process.memory_info().rss
+            for child in process.children(recursive=True):
+                try:
+                    total += child.memory_info().rss
+                except psutil.Error:
+                    pass
+            self.peak_bytes = max(self.peak_bytes, total)
+            self._stop_event.wait(self.interval)
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the transcription pipeline (decode, VAD, model, "
+        "post-processing) on a directory of audio files and report latency, "
+        "real-time factor, throughput and peak memory as JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "audio_dir",
+            nargs="?",
+            default=str(settings.BASE_DIR),
+            help="Directory of fixture audio files (default: project root)",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=1,
+            help="Requests kept in flight at once (default: 1)",
+        )
+        parser.add_argument(
+            "--repeat", type=int, default=1, help="Passes over the fixture set"
+        )
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=getattr(settings, "TRANSCRIPTION_WORKER_PROCESSES", 2),
+            help="Worker processes in the benchmark pool",
+        )
+        parser.add_argument("--language", default=None, help="Pin the language")
+        parser.add_argument("--profile", default=None, help="Decode profile")
+        parser.add_argument("--output", help="Write the JSON report to this file")
+
+    def handle(self, *args, **options):
+        audio_dir = Path(options["audio_dir"])
+        if not audio_dir.is_dir():
+            raise CommandError(f"{audio_dir} is not a directory")
+        files = sorted(
+            path
+            for path in audio_dir.iterdir()
+            if path.is_file() and path.suffix.lower() in AUDIO_EXTENSIONS
+        )
+        if not files:
+            raise CommandError(f"No audio files found in {audio_dir}")
+
+        clips = []
+        for path in files:
+            audio_bytes = path.read_bytes()
+            duration = len(decode_audio_bytes(audio_bytes)) / SAMPLE_RATE
+            clips.append({"name": path.name, "bytes": audio_bytes, "duration": duration})
+        self.stderr.write(f"Loaded {len(clips)} clip(s) from {audio_dir}")
+
+        concurrency = max(1, options["concurrency"])
+        pool = TranscriptionPool(
+            processes=options["processes"],
+            max_queue=concurrency,
+            batch_window=getattr(settings, "TRANSCRIPTION_BATCH_WINDOW_MS", 100) / 1000,
+            max_batch_size=getattr(settings, "TRANSCRIPTION_MAX_BATCH_SIZE", 8),
+        )
+        sampler = RssSampler()
+        sampler.start()
+        try:
+            # Warm-up: worker start-up and model loading are not measured.
+            self.stderr.write("Warming up workers...")
+            warmups = [
+                pool.submit(clips[0]["bytes"], cache=False)
+                for _ in range(min(options["processes"], concurrency))
+            ]
+            for future in warmups:
+                future.result()
+
+            requests = [clip for _ in range(options["repeat"]) for clip in clips]
+            results, wall_seconds = self._run(pool, requests, concurrency, options)
+        finally:
+            sampler.stop()
+            pool.shutdown()
+
+        report = self._report(
+            results, wall_seconds, concurrency, options, sampler.peak_bytes
+        )
+        output = json.dumps(report, indent=2)
+        if options["output"]:
+            Path(options["output"]).write_text(output)
+            self.stderr.write(f"Report written to {options['output']}")
+        self.stdout.write(output)
+
+    def _run(self, pool, requests, concurrency, options):
+        """Keep up to concurrency requests in flight until all have finished."""
+        results, in_flight = [], {}
+        pending = list(requests)
+        started_at = time.time()
+        while pending or in_flight:
+            while pending and len(in_flight) < concurrency:
+                clip = pending.pop(0)
+                future = pool.submit(
+                    clip["bytes"],
+                    language=options["language"],
+                    profile=options["profile"],
+                    cache=False,
+                )
+                in_flight[future] = (clip, time.time())
+            done, _ = wait(list(in_flight), return_when="FIRST_COMPLETED")
+            for future in done:
+                clip, submitted_at = in_flight.pop(future)
+                latency = time.time() - submitted_at
+                try:
+                    result = future.result()
+                except Exception as e:
+                    results.append({"clip": clip["name"], "error": str(e)})
+                    continue
+                results.append(
+                    {
+                        "clip": clip["name"],
+                        "duration": clip["duration"],
+                        "latency": latency,
+                        "wait": result.get("wait_seconds", 0.0),
+                        "batch_size": result.get("batch_size", 1),
+                        "stages": result.get("stage_seconds", {}),
+                    }
+                )
+        return results, time.time() - started_at
+
+    def _report(self, results, wall_seconds, concurrency, options, peak_rss_bytes):
+        ok = [r for r in results if "error" not in r]
+        audio_seconds = sum(r["duration"] for r in ok)
+        latencies = [r["latency"] for r in ok]
+        return {
+            "git_commit": _git_commit(),
+            "run_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "config": {
+                "backend": getattr(settings, "TRANSCRIPTION_BACKEND", "openai-whisper"),
+                "model": settings.WHISPER_MODEL_NAME,
+                "profile": options["profile"]
+                or getattr(settings, "TRANSCRIPTION_DEFAULT_PROFILE", "fast"),
+                "language": options["language"],
+                "vad_enabled": getattr(settings, "VAD_ENABLED", True),
+                "processes": options["processes"],
+                "concurrency": concurrency,
+                "requests": len(results),
+            },
+            "latency_seconds": _distribution(latencies),
+            "queue_wait_seconds": _distribution([r["wait"] for r in ok]),
+            "stage_seconds": {
+                stage: _distribution([r["stages"].get(stage, 0.0) for r in ok])
+                for stage in STAGES
+            },
+            "rtf": {
+                "per_clip": _distribution(
+                    [r["latency"] / r["duration"] for r in ok if r["duration"]]
+                ),
+                "aggregate": round(wall_seconds / audio_seconds, 3)
+                if audio_seconds
+                else None,
+            },
+            "throughput": {
+                "requests_per_second": round(len(ok) / wall_seconds, 3),
+                "audio_seconds_per_second": round(audio_seconds / wall_seconds, 3),
+            },
+            "batch_size": _distribution([r["batch_size"] for r in ok]),
+            "peak_rss_mb": round(peak_rss_bytes / (1024 * 1024), 1),
+            "errors": [r for r in results if "error" in r],
+        }
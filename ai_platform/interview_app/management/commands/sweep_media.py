@@ -0,0 +1,56 @@
+import json
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from ai_platform.interview_app.media_lifecycle import restore, sweep, usage_report
+from ai_platform.interview_app.models import MediaFile
+
+
+class Command(BaseCommand):
+    help = (
+        "Apply the media retention policies to the next batch of files under "
+        "MEDIA_ROOT (delete expired and orphaned files, archive cold unreferenced "
+        "ones) and "
+        "report disk usage per category as JSON. Run it periodically, e.g. "
+        "from cron; each run picks up where the last one stopped."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=getattr(settings, "MEDIA_SWEEP_BATCH_SIZE", 500),
+            help="Files registered and swept per run (default: MEDIA_SWEEP_BATCH_SIZE)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report what would be deleted or archived without changing anything",
+        )
+        parser.add_argument(
+            "--report", action="store_true", help="Only print the disk usage report"
+        )
+        parser.add_argument(
+            "--restore", metavar="PATH", help="Restore an archived file (path under MEDIA_ROOT)"
+        )
+
+    def handle(self, *args, **options):
+        if options["restore"]:
+            try:
+                path = restore(options["restore"])
+            except MediaFile.DoesNotExist:
+                raise CommandError(f"{options['restore']} is not archived")
+            self.stderr.write(f"Restored {path}")
+            return
+
+        report = {}
+        if not options["report"]:
+            report["sweep"] = sweep(max(1, options["batch_size"]), dry_run=options["dry_run"])
+            self.stderr.write(
+                f"Swept {report['sweep']['swept']} file(s), freed "
+                f"{report['sweep']['bytes_freed']} bytes"
+                + (" (dry run)" if options["dry_run"] else "")
+            )
+        report["usage"] = usage_report()
+        self.stdout.write(json.dumps(report, indent=2))
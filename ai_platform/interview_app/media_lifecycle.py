@@ -0,0 +1,409 @@
+# interview_app/media_lifecycle.py
+"""
+Retention of the files under MEDIA_ROOT.
+
+Every file is recorded as a MediaFile with its category and owner (the
+interview session, question or resume it belongs to) the first time a
+sweep sees it. Each sweep then visits a batch of files, least recently
+swept first, and applies its category's policy:
+
+- tts: cached question audio is deleted once no question references it
+  and it has not been used for the retention period. Questions of sessions
+  older than that release their references first. Audio files from before
+  the cache go with their session.
+- id_card: deleted the retention period after the session.
+- resume / upload: compressed into MEDIA_ARCHIVE_ROOT once cold, when
+  MEDIA_ARCHIVE_AFTER_DAYS gives the category a period (none does by
+  default) and no model's file field points at the file, since nothing
+  restores it on access; restore() brings a file back.
+- temp: partial files left by interrupted writes.
+
+Files whose owner has been deleted are removed after a grace period.
+Sweeps are incremental (run the sweep_media command periodically), and
+usage_report() gives the disk usage per category.
+"""
+import gzip
+import logging
+import os
+import re
+import shutil
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from functools import lru_cache
+
+from django.apps import apps
+from django.conf import settings
+from django.db import models
+from django.db.models import Count, F, Q, Sum
+from django.utils import timezone
+
+from .models import InterviewQuestion, InterviewSession, MediaFile, TTSAudio
+from .result_cache import ResultCache
+from .tts_cache import CACHE_DIR, tts_cache
+
+logger = logging.getLogger(__name__)
+
+# Days a file is kept; "orphan" is the grace period for files whose owner is
+# gone (or was never saved). settings.MEDIA_RETENTION_DAYS overrides these.
+DEFAULT_RETENTION_DAYS = {
+    "tts": 7,
+    "id_card": 30,
+    "temp": 1,
+    "orphan": 1,
+}
+# Days after which a file is moved to the archive, from
+# settings.MEDIA_ARCHIVE_AFTER_DAYS; files a model refers to never are.
+DEFAULT_ARCHIVE_AFTER_DAYS = {}
+
+# Where the incremental scan of MEDIA_ROOT stopped. Losing it only makes
+# the next scan start from the top again.
+scan_state = ResultCache("media_scan", max_entries=1)
+
+LEGACY_QUESTION_AUDIO = re.compile(r"^tts/q_\d+_([0-9a-f]+)\.mp3$")
+LEGACY_FOLLOW_UP_AUDIO = re.compile(r"^tts/followup_(\d+)_\d+\.mp3$")
+
+
+def _days(defaults, setting, category):
+    days = dict(defaults)
+    days.update(getattr(settings, setting, {}))
+    return days.get(category)
+
+
+def retention_days(category):
+    return _days(DEFAULT_RETENTION_DAYS, "MEDIA_RETENTION_DAYS", category)
+
+
+def archive_after_days(category):
+    return _days(DEFAULT_ARCHIVE_AFTER_DAYS, "MEDIA_ARCHIVE_AFTER_DAYS", category)
+
+
+def _older_than(moment, days, now):
+    return days is not None and moment is not None and moment < now - timedelta(days=days)
+
+
+def _media_path(path):
+    return os.path.join(settings.MEDIA_ROOT, path)
+
+
+def _archive_path(path):
+    archive_root = getattr(
+        settings, "MEDIA_ARCHIVE_ROOT", os.path.join(settings.BASE_DIR, "media_archive")
+    )
+    return os.path.join(archive_root, f"{path}.gz")
+
+
+def _category(path):
+    if os.path.basename(path).endswith(".tmp"):
+        return "temp"
+    top = path.split("/", 1)[0]
+    return {"tts": "tts", "id_cards": "id_card", "resumes": "resume"}.get(top, "upload")
+
+
+def _owners(path, category):
+    """The session, question and resume that path belongs to, as model fields."""
+    if category == "id_card":
+        return {"session": InterviewSession.objects.filter(id_card_image=path).first()}
+    if category == "resume":
+        from resumes.models import Resume
+
+        return {"resume": Resume.objects.filter(file=path).first()}
+    if category == "tts":
+        match = LEGACY_QUESTION_AUDIO.match(path)
+        if match:
+            return {"session": InterviewSession.objects.filter(session_key=match.group(1)).first()}
+        match = LEGACY_FOLLOW_UP_AUDIO.match(path)
+        if match:
+            question = InterviewQuestion.objects.filter(id=match.group(1)).first()
+            return {"question": question, "session": question.session if question else None}
+    return {}
+
+
+def _has_owner(media_file):
+    if media_file.category == "id_card":
+        return media_file.session_id is not None
+    if media_file.category == "resume":
+        return media_file.resume_id is not None
+    if media_file.category == "tts" and not media_file.path.startswith(f"{CACHE_DIR}/"):
+        return media_file.session_id is not None or media_file.question_id is not None
+    # Cached audio is owned through TTSAudio; other files are not tracked.
+    return True
+
+
+@lru_cache(maxsize=None)
+def _file_fields():
+    """(model, field name) of every FileField and ImageField in the project."""
+    return [
+        (model, field.name)
+        for model in apps.get_models()
+        for field in model._meta.get_fields()
+        if isinstance(field, models.FileField)
+    ]
+
+
+def _referenced(path):
+    """Whether a model's file field (a resume, a JD, a draft, ...) points at path."""
+    return any(
+        model._default_manager.filter(**{name: path}).exists()
+        for model, name in _file_fields()
+    )
+
+
+def _session_time(session):
+    return session.scheduled_at or session.created_at
+
+
+def _files_after(cursor):
+    """
+    (path, DirEntry) of the files under MEDIA_ROOT whose path sorts after
+    cursor, in path order. Directories wholly before the cursor are skipped
+    without being listed.
+    """
+
+    def walk(directory, prefix):
+        try:
+            entries = list(os.scandir(directory))
+        except FileNotFoundError:
+            return
+        # A directory sorts as "name/", so the walk visits paths in string order.
+        entries.sort(key=lambda e: e.name + "/" if e.is_dir(follow_symlinks=False) else e.name)
+        for entry in entries:
+            path = f"{prefix}{entry.name}"
+            if entry.is_dir(follow_symlinks=False):
+                subtree = f"{path}/"
+                if subtree < cursor and not cursor.startswith(subtree):
+                    continue
+                yield from walk(entry.path, subtree)
+            elif path > cursor:
+                yield path, entry
+
+    yield from walk(settings.MEDIA_ROOT, "")
+
+
+def scan(limit):
+    """
+    Visit the next limit files under MEDIA_ROOT, continuing from where the
+    last scan stopped, and record those no MediaFile covers yet. A scan
+    that reaches the end starts over from the top next time, so each run
+    costs O(limit) however much media there is.
+    """
+    cursor = scan_state.get("cursor") or ""
+    visited = []
+    for path, entry in _files_after(cursor):
+        visited.append((path, entry))
+        if len(visited) >= limit:
+            break
+    scan_state.set("cursor", visited[-1][0] if len(visited) >= limit else "")
+
+    registered = set(
+        MediaFile.objects.filter(path__in=[path for path, _ in visited]).values_list(
+            "path", flat=True
+        )
+    )
+    new_files = []
+    for path, entry in visited:
+        if path in registered:
+            continue
+        try:
+            stat = entry.stat()
+        except FileNotFoundError:
+            continue
+        category = _category(path)
+        new_files.append(
+            MediaFile(
+                path=path,
+                category=category,
+                size_bytes=stat.st_size,
+                modified_at=datetime.fromtimestamp(stat.st_mtime, tz=dt_timezone.utc),
+                **_owners(path, category),
+            )
+        )
+    MediaFile.objects.bulk_create(new_files, ignore_conflicts=True)
+    return len(new_files)
+
+
+def release_expired_question_audio(limit, now=None):
+    """
+    Drop the cached-audio references of questions from sessions older than
+    the tts retention period, so their audio can be deleted once unused.
+    """
+    from ai_interview.models import AIInterviewQuestion
+
+    now = now or timezone.now()
+    cutoff = now - timedelta(days=retention_days("tts"))
+    cached = f"{settings.MEDIA_URL}{CACHE_DIR}/"
+    released = 0
+    for questions in (
+        InterviewQuestion.objects.filter(audio_url__startswith=cached).filter(
+            Q(session__scheduled_at__lt=cutoff)
+            | Q(session__scheduled_at__isnull=True, session__created_at__lt=cutoff)
+        ),
+        AIInterviewQuestion.objects.filter(
+            audio_url__startswith=cached, session__created_at__lt=cutoff
+        ),
+    ):
+        for question in questions.only("pk", "audio_url")[: limit - released]:
+            # Cleared first, so a concurrent sweep cannot release it twice.
+            if questions.model.objects.filter(
+                pk=question.pk, audio_url=question.audio_url
+            ).update(audio_url=None):
+                tts_cache.release(question.audio_url)
+                released += 1
+    return released
+
+
+def _delete(media_file):
+    try:
+        os.remove(_media_path(media_file.path))
+    except FileNotFoundError:
+        pass
+    media_file.delete()
+
+
+def archive(media_file):
+    """Compress the file into MEDIA_ARCHIVE_ROOT and remove the original."""
+    archive_path = _archive_path(media_file.path)
+    os.makedirs(os.path.dirname(archive_path), exist_ok=True)
+    with open(_media_path(media_file.path), "rb") as src, gzip.open(archive_path, "wb") as dst:
+        shutil.copyfileobj(src, dst)
+    os.remove(_media_path(media_file.path))
+    media_file.archived_at = timezone.now()
+    media_file.save(update_fields=["archived_at"])
+
+
+def restore(path):
+    """Bring an archived file back to its place under MEDIA_ROOT."""
+    media_file = MediaFile.objects.get(path=path, archived_at__isnull=False)
+    os.makedirs(os.path.dirname(_media_path(path)), exist_ok=True)
+    with gzip.open(_archive_path(path), "rb") as src, open(_media_path(path), "wb") as dst:
+        shutil.copyfileobj(src, dst)
+    os.remove(_archive_path(path))
+    media_file.archived_at = None
+    media_file.modified_at = timezone.now()
+    media_file.save(update_fields=["archived_at", "modified_at"])
+    return _media_path(path)
+
+
+def _decide(media_file, now):
+    """The action for a file ("delete", "archive" or None) and why."""
+    category = media_file.category
+    if category == "temp":
+        if _older_than(media_file.modified_at, retention_days("temp"), now):
+            return "delete", "stale temporary file"
+        return None, None
+    if not _has_owner(media_file):
+        if _older_than(media_file.modified_at, retention_days("orphan"), now):
+            return "delete", "orphaned"
+        return None, None
+
+    if category == "tts":
+        if media_file.path.startswith(f"{CACHE_DIR}/"):
+            key = os.path.splitext(os.path.basename(media_file.path))[0]
+            entry = TTSAudio.objects.filter(key=key).first()
+            if entry is None:
+                if _older_than(media_file.modified_at, retention_days("orphan"), now):
+                    return "delete", "not in the TTS cache"
+                return None, None
+            if entry.ref_count == 0 and _older_than(
+                entry.last_accessed, retention_days("tts"), now
+            ):
+                return "delete", "unused cached audio"
+            return None, None
+        session = media_file.session or media_file.question.session
+        if _older_than(_session_time(session), retention_days("tts"), now):
+            return "delete", "session audio past retention"
+        return None, None
+
+    if category == "id_card":
+        if _older_than(_session_time(media_file.session), retention_days("id_card"), now):
+            return "delete", "ID card past retention"
+        return None, None
+
+    if _older_than(
+        media_file.modified_at, archive_after_days(category), now
+    ) and not _referenced(media_file.path):
+        return "archive", "cold and unreferenced"
+    return None, None
+
+
+def _apply(media_file, action):
+    if action == "archive":
+        # Skip files a model started to refer to since the decision.
+        if not _referenced(media_file.path):
+            archive(media_file)
+        return
+    if media_file.category == "tts" and media_file.path.startswith(f"{CACHE_DIR}/"):
+        key = os.path.splitext(os.path.basename(media_file.path))[0]
+        # Skip audio referenced again since the decision.
+        if TTSAudio.objects.filter(key=key).exclude(ref_count=0).exists():
+            return
+        TTSAudio.objects.filter(key=key, ref_count=0).delete()
+    elif media_file.category == "id_card":
+        InterviewSession.objects.filter(
+            id=media_file.session_id, id_card_image=media_file.path
+        ).update(id_card_image=None)
+    _delete(media_file)
+
+
+def sweep(batch_size, dry_run=False):
+    """
+    Register new files, release the audio of expired sessions, and apply
+    the retention policies to the batch_size least recently swept files.
+    Returns counts of what was (or, with dry_run, would be) done; a dry run
+    only registers files.
+    """
+    now = timezone.now()
+    summary = {
+        "registered": 0,
+        "released": 0,
+        "swept": 0,
+        "deleted": {},
+        "archived": {},
+        "bytes_freed": 0,
+    }
+    # Recording new files changes nothing on disk, so dry runs do it too.
+    summary["registered"] = scan(batch_size)
+    if not dry_run:
+        summary["released"] = release_expired_question_audio(batch_size, now)
+
+    batch = list(
+        MediaFile.objects.filter(archived_at__isnull=True)
+        .select_related("session", "question__session")
+        .order_by(F("last_swept").asc(nulls_first=True), "id")[:batch_size]
+    )
+    for media_file in batch:
+        summary["swept"] += 1
+        if not os.path.exists(_media_path(media_file.path)):
+            # Removed by something else.
+            if not dry_run:
+                media_file.delete()
+            continue
+        action, reason = _decide(media_file, now)
+        if action:
+            verb = f"Would {action}" if dry_run else action.capitalize()
+            logger.info(f"{verb} {media_file.path}: {reason}")
+            counts = summary["deleted" if action == "delete" else "archived"]
+            counts[media_file.category] = counts.get(media_file.category, 0) + 1
+            summary["bytes_freed"] += media_file.size_bytes
+            if not dry_run:
+                _apply(media_file, action)
+    if not dry_run:
+        MediaFile.objects.filter(pk__in=[f.pk for f in batch]).update(last_swept=now)
+    return summary
+
+
+def usage_report():
+    """Files and bytes per category, on disk and in the archive."""
+    report = {}
+    rows = MediaFile.objects.values("category").annotate(
+        files=Count("id", filter=Q(archived_at__isnull=True)),
+        bytes=Sum("size_bytes", filter=Q(archived_at__isnull=True)),
+        archived_files=Count("id", filter=Q(archived_at__isnull=False)),
+        archived_source_bytes=Sum("size_bytes", filter=Q(archived_at__isnull=False)),
+    )
+    for row in rows:
+        category = row.pop("category")
+        report[category] = {name: value or 0 for name, value in row.items()}
+    totals = {
+        name: sum(counts[name] for counts in report.values()) for name in ("files", "bytes")
+    }
+    return {"categories": report, "total": totals}
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.6 on 2026-10-17 07:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interview_app', '0004_transcriptionjob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='interviewquestion',
+            name='speech_duration_seconds',
+            field=models.FloatField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.1.6 on 2026-10-17 07:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interview_app', '0005_interviewquestion_speech_duration_seconds'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CachedResult',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('namespace', models.CharField(max_length=50)),
+                ('key', models.CharField(max_length=64)),
+                ('value', models.JSONField()),
+                ('hit_count', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('last_accessed', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['namespace', 'last_accessed'], name='interview_a_namespa_d1a2e9_idx')],
+                'unique_together': {('namespace', 'key')},
+            },
+        ),
+    ]
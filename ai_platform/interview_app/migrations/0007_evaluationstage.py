@@ -0,0 +1,29 @@
+# Generated by Django 5.1.6 on 2026-10-17 07:34
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interview_app', '0006_cachedresult'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EvaluationStage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('stage', models.CharField(choices=[('RESUME', 'Resume vs. Job Description'), ('ANSWERS', 'Interview Answers'), ('OVERALL', 'Overall Profile')], max_length=10)),
+                ('status', models.CharField(choices=[('PENDING', 'Pending'), ('RUNNING', 'Running'), ('DONE', 'Done'), ('FAILED', 'Failed')], default='PENDING', max_length=10)),
+                ('error', models.TextField(blank=True, null=True)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('session', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='evaluation_stages', to='interview_app.interviewsession')),
+            ],
+            options={
+                'unique_together': {('session', 'stage')},
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.6 on 2026-10-17 07:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interview_app', '0008_interviewsession_question_preparation_started_at_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cachedresult',
+            name='expires_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
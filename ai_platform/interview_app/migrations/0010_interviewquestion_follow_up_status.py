@@ -0,0 +1,22 @@
+# Generated by Django 5.1.6 on 2026-10-17 07:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interview_app', '0009_cachedresult_expires_at'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='transcriptionjob',
+            name='follow_up_question',
+        ),
+        migrations.AddField(
+            model_name='interviewquestion',
+            name='follow_up_status',
+            field=models.CharField(blank=True, choices=[('PENDING', 'Pending'), ('READY', 'Ready'), ('NONE', 'No follow-up')], max_length=10, null=True),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.1.6 on 2026-10-17 07:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interview_app', '0010_interviewquestion_follow_up_status'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TTSAudio',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=64, unique=True)),
+                ('engine', models.CharField(max_length=20)),
+                ('file_path', models.CharField(max_length=255)),
+                ('size_bytes', models.PositiveIntegerField(default=0)),
+                ('ref_count', models.PositiveIntegerField(default=0)),
+                ('hit_count', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('last_accessed', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['ref_count', 'last_accessed'], name='interview_a_ref_cou_ca4fc1_idx')],
+            },
+        ),
+    ]
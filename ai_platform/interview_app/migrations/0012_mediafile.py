@@ -0,0 +1,34 @@
+# Generated by Django 5.1.6 on 2026-10-17 08:04
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interview_app', '0011_ttsaudio'),
+        ('resumes', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MediaFile',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('path', models.CharField(max_length=500, unique=True)),
+                ('category', models.CharField(choices=[('tts', 'TTS audio'), ('id_card', 'ID card'), ('resume', 'Resume'), ('upload', 'Other upload'), ('temp', 'Temporary')], max_length=10)),
+                ('size_bytes', models.PositiveBigIntegerField(default=0)),
+                ('modified_at', models.DateTimeField()),
+                ('registered_at', models.DateTimeField(auto_now_add=True)),
+                ('last_swept', models.DateTimeField(blank=True, null=True)),
+                ('archived_at', models.DateTimeField(blank=True, null=True)),
+                ('question', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='media_files', to='interview_app.interviewquestion')),
+                ('resume', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='media_files', to='resumes.resume')),
+                ('session', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='media_files', to='interview_app.interviewsession')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['last_swept'], name='interview_a_last_sw_5d0943_idx'), models.Index(fields=['category'], name='interview_a_categor_1afa67_idx')],
+            },
+        ),
+    ]
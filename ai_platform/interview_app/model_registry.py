@@ -0,0 +1,177 @@
+# interview_app/model_registry.py
+import gc
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+import psutil
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _estimate_model_bytes(model, rss_delta):
+    """
+    Size of a loaded model in bytes: parameters and buffers for torch modules
+    (Whisper, or the .model of an ultralytics YOLO), else the RSS growth
+    observed while loading it.
+    """
+    module = model if hasattr(model, "parameters") else getattr(model, "model", None)
+    if module is not None and hasattr(module, "parameters"):
+        try:
+            total = sum(p.numel() * p.element_size() for p in module.parameters())
+            total += sum(b.numel() * b.element_size() for b in module.buffers())
+            if total:
+                return total
+        except Exception:
+            pass
+    return max(rss_delta, 0)
+
+
+class ModelRegistry:
+    """
+    Process-wide registry of heavy ML models. Models are registered by name
+    with a loader, loaded on first use, and evicted least-recently-used first
+    when the loaded total exceeds the memory budget.
+    """
+
+    def __init__(self, memory_budget_mb=0):
+        self.memory_budget_bytes = int(memory_budget_mb * 1024 * 1024)
+        self._loaders = {}
+        self._loaded = OrderedDict()  # name -> {"model", "bytes", "last_used"}
+        self._lock = threading.RLock()
+
+    def register(self, name, loader):
+        with self._lock:
+            self._loaders[name] = loader
+
+    def get(self, name):
+        """Return the model registered under name, loading it if needed."""
+        with self._lock:
+            entry = self._loaded.get(name)
+            if entry is None:
+                entry = self._load(name)
+            entry["last_used"] = time.time()
+            self._loaded.move_to_end(name)
+            return entry["model"]
+
+    def _load(self, name):
+        if name not in self._loaders:
+            raise KeyError(f"No model registered under '{name}'.")
+        process = psutil.Process()
+        rss_before = process.memory_info().rss
+        started_at = time.time()
+        model = self._loaders[name]()
+        rss_delta = process.memory_info().rss - rss_before
+        entry = {
+            "model": model,
+            "bytes": _estimate_model_bytes(model, rss_delta),
+            "last_used": time.time(),
+        }
+        self._loaded[name] = entry
+        logger.info(
+            f"Loaded model '{name}' in {time.time() - started_at:.1f}s "
+            f"({entry['bytes'] / (1024 * 1024):.0f} MB)"
+        )
+        self._evict_over_budget(keep=name)
+        return entry
+
+    def _evict_over_budget(self, keep):
+        if not self.memory_budget_bytes:
+            return
+        while self._total_bytes() > self.memory_budget_bytes:
+            victim = next((n for n in self._loaded if n != keep), None)
+            if victim is None:
+                logger.warning(
+                    f"Model '{keep}' alone exceeds the memory budget of "
+                    f"{self.memory_budget_bytes // (1024 * 1024)} MB"
+                )
+                return
+            logger.info(f"Evicting model '{victim}' to stay within memory budget")
+            self.unload(victim)
+
+    def _total_bytes(self):
+        return sum(entry["bytes"] for entry in self._loaded.values())
+
+    def unload(self, name):
+        """Drop a loaded model; it is reloaded on the next get()."""
+        with self._lock:
+            entry = self._loaded.pop(name, None)
+        if entry is not None:
+            del entry
+            gc.collect()
+            return True
+        return False
+
+    def is_loaded(self, name):
+        with self._lock:
+            return name in self._loaded
+
+    def memory_report(self):
+        with self._lock:
+            models = {
+                name: {
+                    "loaded": name in self._loaded,
+                    "memory_mb": (
+                        round(self._loaded[name]["bytes"] / (1024 * 1024), 1)
+                        if name in self._loaded
+                        else 0
+                    ),
+                    "last_used": (
+                        self._loaded[name]["last_used"]
+                        if name in self._loaded
+                        else None
+                    ),
+                }
+                for name in self._loaders
+            }
+            return {
+                "budget_mb": self.memory_budget_bytes // (1024 * 1024),
+                "total_mb": round(self._total_bytes() / (1024 * 1024), 1),
+                "models": models,
+            }
+
+
+def _load_whisper():
+    import whisper
+
+    return whisper.load_model(settings.WHISPER_MODEL_NAME)
+
+
+def _load_whisper_int8():
+    import torch
+    import whisper
+
+    model = whisper.load_model(settings.WHISPER_MODEL_NAME, device="cpu")
+    return torch.quantization.quantize_dynamic(
+        model, {torch.nn.Linear}, dtype=torch.qint8
+    )
+
+
+def _load_faster_whisper():
+    from faster_whisper import WhisperModel
+
+    return WhisperModel(
+        settings.WHISPER_MODEL_NAME, device="cpu", compute_type="int8"
+    )
+
+
+def _load_yolo():
+    from ultralytics import YOLO
+
+    return YOLO(settings.YOLO_MODEL_PATH)
+
+
+registry = ModelRegistry(
+    memory_budget_mb=getattr(settings, "MODEL_MEMORY_BUDGET_MB", 0)
+)
+registry.register("whisper", _load_whisper)
+registry.register("whisper-int8", _load_whisper_int8)
+registry.register("faster-whisper", _load_faster_whisper)
+registry.register("yolo", _load_yolo)
+
+
+def get_model(name):
+    """Shortcut for registry.get(name)."""
+    return registry.get(name)
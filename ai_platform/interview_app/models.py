@@ -34,6 +34,18 @@ class InterviewSession(models.Model):
     id_verification_status = models.CharField(max_length=50, default="Pending")
     id_card_image = models.ImageField(upload_to="id_cards/", null=True, blank=True)
     extracted_id_details = models.TextField(null=True, blank=True)
+    # Questions and their audio are prepared in the background when the
+    # session is created (see question_preparation).
+    QUESTION_PREPARATION_CHOICES = [
+        ("PENDING", "Pending"),
+        ("PREPARING", "Preparing"),
+        ("READY", "Ready"),
+        ("FAILED", "Failed"),
+    ]
+    question_preparation_status = models.CharField(
+        max_length=10, choices=QUESTION_PREPARATION_CHOICES, default="PENDING"
+    )
+    question_preparation_started_at = models.DateTimeField(null=True, blank=True)
 
     def save(self, *args, **kwargs):
         if not self.session_key:
@@ -85,6 +97,18 @@ class InterviewQuestion(models.Model):
     words_per_minute = models.IntegerField(null=True, blank=True)
     filler_word_count = models.IntegerField(null=True, blank=True)
     response_time_seconds = models.FloatField(null=True, blank=True)
+    # Seconds of actual speech in the answer, measured by voice activity detection
+    speech_duration_seconds = models.FloatField(null=True, blank=True)
+    # Follow-up generation after this (MAIN) question was answered: PENDING
+    # while it runs in the background, then READY or NONE.
+    FOLLOW_UP_STATUS_CHOICES = [
+        ("PENDING", "Pending"),
+        ("READY", "Ready"),
+        ("NONE", "No follow-up"),
+    ]
+    follow_up_status = models.CharField(
+        max_length=10, choices=FOLLOW_UP_STATUS_CHOICES, null=True, blank=True
+    )
 
     # --- NEW FIELD: To specify the language for a coding question ---
     LANGUAGE_CHOICES = [
@@ -148,3 +172,177 @@ class CodeSubmission(models.Model):
 
     def __str__(self):
         return f"Code submission by {self.session.candidate_name} for Q: {self.question_id}"
+
+
+# --- NEW MODEL: Tracks an audio answer queued for background transcription ---
+class TranscriptionJob(models.Model):
+    STATUS_CHOICES = [
+        ("QUEUED", "Queued"),
+        ("DONE", "Done"),
+        ("FAILED", "Failed"),
+    ]
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    session = models.ForeignKey(
+        InterviewSession,
+        related_name="transcription_jobs",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+    )
+    question = models.ForeignKey(
+        InterviewQuestion,
+        related_name="transcription_jobs",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+    )
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default="QUEUED")
+    transcribed_text = models.TextField(null=True, blank=True)
+    error = models.TextField(null=True, blank=True)
+    wait_seconds = models.FloatField(null=True, blank=True)
+    inference_seconds = models.FloatField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    # When the audio was handed to the worker pool.
+    started_at = models.DateTimeField(null=True, blank=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"Transcription job {self.id} ({self.status})"
+
+
+class CachedResult(models.Model):
+    """
+    A persisted, content-addressed result (e.g. a transcript), stored under
+    a namespace and a hash of everything that determines it.
+    """
+
+    namespace = models.CharField(max_length=50)
+    key = models.CharField(max_length=64)
+    value = models.JSONField()
+    hit_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    last_accessed = models.DateTimeField(auto_now_add=True)
+    # Entries without an expiry live until evicted for space.
+    expires_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        unique_together = ("namespace", "key")
+        indexes = [models.Index(fields=["namespace", "last_accessed"])]
+
+    def __str__(self):
+        return f"{self.namespace}:{self.key[:12]}"
+
+
+class TTSAudio(models.Model):
+    """
+    Synthesized speech stored once under MEDIA_ROOT and shared by every
+    question with the same text, voice and engine (see tts_cache).
+    """
+
+    key = models.CharField(max_length=64, unique=True)
+    engine = models.CharField(max_length=20)
+    # Relative to MEDIA_ROOT.
+    file_path = models.CharField(max_length=255)
+    size_bytes = models.PositiveIntegerField(default=0)
+    # Questions whose audio_url points at the file; only unreferenced files
+    # are evicted.
+    ref_count = models.PositiveIntegerField(default=0)
+    hit_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    last_accessed = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [models.Index(fields=["ref_count", "last_accessed"])]
+
+    def __str__(self):
+        return f"{self.engine}:{self.key[:12]}"
+
+
+class MediaFile(models.Model):
+    """
+    A file under MEDIA_ROOT and what owns it, recorded when a media sweep
+    first sees it, so that media_lifecycle can apply its category's
+    retention policy. A file whose owner is deleted becomes an orphan.
+    """
+
+    CATEGORY_CHOICES = [
+        ("tts", "TTS audio"),
+        ("id_card", "ID card"),
+        ("resume", "Resume"),
+        ("upload", "Other upload"),
+        ("temp", "Temporary"),
+    ]
+    # Relative to MEDIA_ROOT.
+    path = models.CharField(max_length=500, unique=True)
+    category = models.CharField(max_length=10, choices=CATEGORY_CHOICES)
+    size_bytes = models.PositiveBigIntegerField(default=0)
+    session = models.ForeignKey(
+        InterviewSession,
+        related_name="media_files",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+    )
+    question = models.ForeignKey(
+        InterviewQuestion,
+        related_name="media_files",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+    )
+    resume = models.ForeignKey(
+        "resumes.Resume",
+        related_name="media_files",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+    )
+    # When the file was last written, for its age.
+    modified_at = models.DateTimeField()
+    registered_at = models.DateTimeField(auto_now_add=True)
+    # Sweeps visit files least recently swept first.
+    last_swept = models.DateTimeField(null=True, blank=True)
+    # Set while the file is compressed in MEDIA_ARCHIVE_ROOT instead.
+    archived_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["last_swept"]),
+            models.Index(fields=["category"]),
+        ]
+
+    def __str__(self):
+        return f"{self.category}: {self.path}"
+
+
+class EvaluationStage(models.Model):
+    """
+    Progress of one step of a session's AI evaluation (see
+    evaluation_pipeline), so the report can show what is still running.
+    """
+
+    STAGE_CHOICES = [
+        ("RESUME", "Resume vs. Job Description"),
+        ("ANSWERS", "Interview Answers"),
+        ("OVERALL", "Overall Profile"),
+    ]
+    STATUS_CHOICES = [
+        ("PENDING", "Pending"),
+        ("RUNNING", "Running"),
+        ("DONE", "Done"),
+        ("FAILED", "Failed"),
+    ]
+    session = models.ForeignKey(
+        InterviewSession, related_name="evaluation_stages", on_delete=models.CASCADE
+    )
+    stage = models.CharField(max_length=10, choices=STAGE_CHOICES)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default="PENDING")
+    error = models.TextField(null=True, blank=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        unique_together = ("session", "stage")
+
+    def __str__(self):
+        return f"{self.session_id} {self.stage}: {self.status}"
@@ -0,0 +1,140 @@
+# interview_app/prompt_builder.py
+"""
+Prompts assembled to a per-call-type token budget.
+
+A prompt is fixed instructions followed by sections (job description,
+resume, answers, ...). When the sections together exceed the budget, the
+largest are truncated first, so short sections stay whole. Evaluations use
+the stored resume summary and a cached condensed job description instead
+of the raw texts where they exist. Each built prompt is logged with the
+size and source of every section.
+"""
+import logging
+import math
+from collections import namedtuple
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# Rough average for English text with Gemini's tokenizer; counting exactly
+# would cost an API call per prompt.
+CHARS_PER_TOKEN = 4
+TRUNCATION_MARKER = "\n[...truncated]"
+
+# Tokens for the sections of each call type's prompt (instructions are not
+# counted). Call types not listed here are not limited.
+DEFAULT_PROMPT_TOKEN_BUDGETS = {
+    "question_set": 6000,
+    "resume_evaluation": 3000,
+    "answers_evaluation": 8000,
+    "interview_evaluation": 8000,
+    "answer_feedback": 4000,
+    "job_description_summary": 8000,
+}
+
+# header is printed above the text; source says where the text came from
+# ("raw", "summary", ...) for the prompt log.
+Section = namedtuple("Section", ["header", "text", "source"], defaults=["raw"])
+
+
+def count_tokens(text):
+    return math.ceil(len(text or "") / CHARS_PER_TOKEN)
+
+
+def prompt_budget(call_type):
+    """Budget for a call type; settings.PROMPT_TOKEN_BUDGETS overrides the defaults."""
+    budgets = dict(DEFAULT_PROMPT_TOKEN_BUDGETS)
+    budgets.update(getattr(settings, "PROMPT_TOKEN_BUDGETS", {}))
+    return budgets.get(call_type)
+
+
+def truncate_to_tokens(text, max_tokens):
+    if count_tokens(text) <= max_tokens:
+        return text
+    keep = max(0, max_tokens * CHARS_PER_TOKEN - len(TRUNCATION_MARKER))
+    return text[:keep].rstrip() + TRUNCATION_MARKER
+
+
+def _allocate(sizes, budget):
+    """
+    Token allowance per section: every section gets up to the same cap,
+    the largest cap for which the total stays within budget.
+    """
+    if sum(sizes) <= budget:
+        return list(sizes)
+    remaining, cap = budget, 0
+    for count, size in enumerate(sorted(sizes)):
+        share = remaining // (len(sizes) - count)
+        if size > share:
+            cap = share
+            break
+        remaining -= size
+    return [min(size, cap) for size in sizes]
+
+
+def build_prompt(call_type, instructions, sections):
+    """
+    instructions followed by each Section as "\\n\\n<header>\\n<text>",
+    truncated to the call type's token budget.
+    """
+    texts = [section.text or "" for section in sections]
+    sizes = [count_tokens(text) for text in texts]
+    budget = prompt_budget(call_type)
+    allowances = sizes if budget is None else _allocate(sizes, budget)
+
+    parts, contents = [instructions], []
+    for section, text, size, allowance in zip(sections, texts, sizes, allowances):
+        if allowance < size:
+            text = truncate_to_tokens(text, allowance)
+        parts.append(f"\n\n{section.header}\n{text}")
+        contents.append(
+            f"{section.header.strip(' -:')}={section.source}:{count_tokens(text)}"
+            + (f"/{size} truncated" if allowance < size else "")
+        )
+    prompt = "".join(parts)
+    logger.info(
+        f"{call_type} prompt ~{count_tokens(prompt)} tokens "
+        f"(budget {budget or 'none'}): {', '.join(contents) or 'no sections'}"
+    )
+    return prompt
+
+
+def resume_section(header, resume_summary, resume_text):
+    """The stored resume summary when there is one, else the raw resume."""
+    if resume_summary and resume_summary.strip():
+        return Section(header, resume_summary.strip(), "summary")
+    return Section(header, resume_text or "", "raw")
+
+
+def job_description_section(header, job_description):
+    """
+    The job description, condensed by the LLM (and cached) when it is
+    longer than PROMPT_JD_SUMMARY_MIN_TOKENS. Falls back to the raw text.
+    A cache miss costs an extra LLM call, so this is for evaluations, not
+    for question generation while the candidate waits.
+    """
+    job_description = job_description or ""
+    if count_tokens(job_description) <= getattr(
+        settings, "PROMPT_JD_SUMMARY_MIN_TOKENS", 400
+    ):
+        return Section(header, job_description, "raw")
+
+    from .llm_cache import llm_cache
+
+    prompt = build_prompt(
+        "job_description_summary",
+        "Condense the following job description for an interviewer. Keep the role, "
+        "seniority, required and preferred skills, and main responsibilities; drop "
+        "company boilerplate, benefits and application instructions. Answer in plain "
+        "text of at most 200 words.",
+        [Section("JOB DESCRIPTION:", job_description)],
+    )
+    try:
+        summary = llm_cache.generate_text("job_description_summary", prompt).strip()
+    except Exception as e:
+        logger.warning(f"Could not condense the job description: {e}")
+        summary = ""
+    if not summary:
+        return Section(header, job_description, "raw")
+    return Section(header, summary, "summary")
@@ -0,0 +1,213 @@
+# interview_app/question_generation.py
+"""
+Resume summary and interview questions from one structured Gemini call.
+
+The model is asked for JSON, which is checked against QUESTION_SET_SCHEMA.
+An invalid response is sent back with the validation errors for repair, at
+most QUESTION_GENERATION_MAX_ATTEMPTS times in total, so a drifting model
+costs a bounded number of retries instead of failing the interview start.
+"""
+import json
+import logging
+import re
+
+from django.conf import settings
+
+from .llm_gateway import get_llm_gateway
+from .prompt_builder import Section, build_prompt
+
+logger = logging.getLogger(__name__)
+
+QUESTION_TYPES = ("Ice-Breaker", "Technical Questions", "Behavioral Questions")
+CODING_LANGUAGES = ("PYTHON", "JAVASCRIPT", "JAVA", "CSHARP", "PHP", "RUBY", "SQL")
+
+# Shown to the model verbatim; validate_question_set() enforces it.
+QUESTION_SET_SCHEMA = {
+    "resume_summary": "string: the candidate's key skills, one paragraph",
+    "questions": [
+        {
+            "type": " | ".join(QUESTION_TYPES),
+            "text": "string: the question as it will be spoken",
+        }
+    ],
+    "coding_question": {
+        "title": "string",
+        "description": "string",
+        "language": " | ".join(CODING_LANGUAGES),
+        "starter_code": "string",
+        "test_cases": [{"input": "string", "output": "string"}],
+    },
+}
+
+
+def fallback_questions(candidate_name="Candidate"):
+    """Generic questions used when the model never returns a valid set."""
+    return [
+        {
+            "type": "Ice-Breaker",
+            "text": f"Welcome {candidate_name}! Can you tell me about a challenging project you have worked on?",
+        },
+        {
+            "type": "Technical Questions",
+            "text": "What is the difference between `let`, `const`, and `var` in JavaScript?",
+        },
+        {
+            "type": "Behavioral Questions",
+            "text": "Describe a time you had a conflict with a coworker and how you resolved it.",
+        },
+    ]
+
+
+class QuestionSetError(ValueError):
+    """The model did not return a valid question set within the attempt limit."""
+
+
+def _non_empty_string(value):
+    return isinstance(value, str) and bool(value.strip())
+
+
+def validate_question_set(data, coding_question=False):
+    """Return a list of schema violations in data (empty when valid)."""
+    if not isinstance(data, dict):
+        return ["the response must be a JSON object"]
+    errors = []
+    if not _non_empty_string(data.get("resume_summary")):
+        errors.append("'resume_summary' must be a non-empty string")
+
+    questions = data.get("questions")
+    if not isinstance(questions, list) or not questions:
+        errors.append("'questions' must be a non-empty list")
+    else:
+        for i, question in enumerate(questions):
+            if not isinstance(question, dict):
+                errors.append(f"questions[{i}] must be an object")
+                continue
+            if question.get("type") not in QUESTION_TYPES:
+                errors.append(
+                    f"questions[{i}].type must be one of {', '.join(QUESTION_TYPES)}"
+                )
+            if not _non_empty_string(question.get("text")):
+                errors.append(f"questions[{i}].text must be a non-empty string")
+
+    coding = data.get("coding_question")
+    if coding is None:
+        if coding_question:
+            errors.append("'coding_question' is required")
+    elif not isinstance(coding, dict):
+        errors.append("'coding_question' must be an object or null")
+    else:
+        for field in ("title", "description", "starter_code"):
+            if not _non_empty_string(coding.get(field)):
+                errors.append(f"coding_question.{field} must be a non-empty string")
+        if coding.get("language") not in CODING_LANGUAGES:
+            errors.append(
+                f"coding_question.language must be one of {', '.join(CODING_LANGUAGES)}"
+            )
+        test_cases = coding.get("test_cases")
+        if not isinstance(test_cases, list) or not test_cases:
+            errors.append("coding_question.test_cases must be a non-empty list")
+        elif not all(
+            isinstance(case, dict)
+            and isinstance(case.get("input"), str)
+            and isinstance(case.get("output"), str)
+            for case in test_cases
+        ):
+            errors.append(
+                "each coding_question.test_cases item needs string 'input' and 'output'"
+            )
+    return errors
+
+
+def parse_json_response(text):
+    """The JSON object in a model response."""
+    # Models sometimes wrap JSON in a Markdown code fence despite the MIME type.
+    fenced = re.search(r"```(?:json)?\s*(.*?)```", text, re.DOTALL)
+    return json.loads(fenced.group(1) if fenced else text)
+
+
+def _question_set_prompt(job_description, resume_text, language_name, coding_question):
+    role = job_description.splitlines()[0] if job_description else "Technical Role"
+    coding_instruction = (
+        "Include a short coding question the candidate can solve in about 15 minutes, "
+        "with at least three test cases whose output is the exact expected stdout. "
+        if coding_question
+        else "Set 'coding_question' to null. "
+    )
+    return build_prompt(
+        "question_set",
+        f"You are an expert Talaro interviewer. Your task is to generate 5 insightful interview questions in {language_name}. "
+        f"The interview is for a '{role}' role. "
+        "Please base the questions on the provided job description and candidate's resume. "
+        "Start with a welcoming ice-breaker question that also references something specific from the candidate's resume. "
+        "Then, generate a mix of technical and behavioral questions. "
+        "Also summarize the key skills from the resume. "
+        f"{coding_instruction}"
+        "Respond with a single JSON object, and nothing else, following this schema:\n"
+        f"{json.dumps(QUESTION_SET_SCHEMA, indent=2)}",
+        [
+            # The raw JD (build_prompt truncates it to the budget): condensing
+            # it would add an LLM round trip before this one.
+            Section("--- JOB DESCRIPTION ---", job_description or ""),
+            # The full resume: the summary is produced by this call.
+            Section("--- RESUME ---", resume_text),
+        ],
+    )
+
+
+def _repair_prompt(original_prompt, response_text, errors):
+    return (
+        f"{original_prompt}\n\n"
+        "--- YOUR PREVIOUS RESPONSE ---\n"
+        f"{response_text}\n\n"
+        "That response is invalid:\n- "
+        + "\n- ".join(errors)
+        + "\n\nReturn the corrected JSON object only."
+    )
+
+
+def generate_question_set(
+    job_description, resume_text, language_name="English", coding_question=False
+):
+    """
+    One Gemini call for the resume summary and the spoken questions (plus a
+    coding question if coding_question is true). Returns the validated
+    {"resume_summary", "questions", "coding_question"} dict; raises
+    QuestionSetError when every attempt was invalid.
+    """
+    prompt = _question_set_prompt(
+        job_description or "", resume_text or "", language_name, coding_question
+    )
+    max_attempts = max(1, getattr(settings, "QUESTION_GENERATION_MAX_ATTEMPTS", 3))
+
+    request_prompt, errors = prompt, []
+    for attempt in range(1, max_attempts + 1):
+        response_text = get_llm_gateway().generate_text(
+            "question_set",
+            request_prompt,
+            generation_config={"response_mime_type": "application/json"},
+        )
+        try:
+            data = parse_json_response(response_text)
+        except ValueError as e:
+            errors = [f"the response is not valid JSON ({e})"]
+        else:
+            errors = validate_question_set(data, coding_question)
+        if not errors:
+            questions = data["questions"]
+            if "welcome" in questions[0]["text"].lower():
+                questions[0]["type"] = "Ice-Breaker"
+            return {
+                "resume_summary": data["resume_summary"].strip(),
+                "questions": [
+                    {"type": q["type"], "text": q["text"].strip()} for q in questions
+                ],
+                "coding_question": data.get("coding_question"),
+            }
+        logger.warning(
+            f"Invalid question set (attempt {attempt}/{max_attempts}): {errors}"
+        )
+        request_prompt = _repair_prompt(prompt, response_text, errors)
+
+    raise QuestionSetError(
+        f"No valid question set after {max_attempts} attempts: {'; '.join(errors)}"
+    )
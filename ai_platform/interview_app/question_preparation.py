@@ -0,0 +1,236 @@
+# interview_app/question_preparation.py
+"""
+Interview questions and their audio, prepared ahead of the interview.
+
+Preparation starts in the background when a session is created, so the
+portal only has to read the stored questions. If the candidate arrives
+before it has finished, the portal shows a waiting page that polls
+question_preparation_status, and a preparation that never started, failed
+or was lost in a restart is started again in the background.
+"""
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.urls import reverse
+from django.utils import timezone
+
+from .background import run_in_background
+from .models import InterviewQuestion, InterviewSession
+from .question_generation import (
+    QuestionSetError,
+    fallback_questions,
+    generate_question_set,
+)
+from .tts_cache import tts_cache
+
+logger = logging.getLogger(__name__)
+
+CODING_CHALLENGE = {
+    "type": "CODING",
+    "title": "Reverse String",
+    "description": 'Write a function that reverses a string. For example, if the input is "hello", the output should be "olleh".',
+    "language": "PYTHON",
+    "starter_code": "def reverse_string(s):\n    # Your code here\n    pass",
+    "test_cases": [
+        {"input": '"hello"', "output": "olleh"},
+        {"input": '"world"', "output": "dlrow"},
+        {"input": '"python"', "output": "nohtyp"},
+    ],
+}
+
+
+def generate_questions(session):
+    """
+    The resume summary and spoken questions of session, from one structured
+    Gemini call. Returns (resume_summary, [{"type", "text"}]).
+    """
+    from .views import SUPPORTED_LANGUAGES
+
+    try:
+        question_set = generate_question_set(
+            session.job_description,
+            session.resume_text,
+            SUPPORTED_LANGUAGES.get(session.language_code, "English"),
+        )
+    except QuestionSetError as e:
+        logger.error(f"Using fallback questions for session {session.id}: {e}")
+        return "", fallback_questions(session.candidate_name)
+    return question_set["resume_summary"], question_set["questions"]
+
+
+def _question_audio_urls(session, texts):
+    """
+    The (shared, cached) audio URLs of the first TTS_PRESYNTHESIZE_QUESTIONS
+    spoken questions, synthesized concurrently; None for the rest, which the
+    question_audio view synthesizes when the player first asks for them.
+    """
+    count = max(0, getattr(settings, "TTS_PRESYNTHESIZE_QUESTIONS", 1))
+    urls = tts_cache.audio_urls(texts[:count], session.language_code, session.accent_tld)
+    return urls + [None] * (len(texts) - len(urls))
+
+
+def _claim(session_id, stale_seconds=None):
+    """
+    Mark the session as PREPARING. Returns the claim's start time, or None
+    if another preparation started less than stale_seconds ago (default
+    QUESTION_PREPARATION_TIMEOUT_SECONDS) is running. The start time
+    identifies the claim when saving results.
+    """
+    if stale_seconds is None:
+        stale_seconds = getattr(settings, "QUESTION_PREPARATION_TIMEOUT_SECONDS", 300)
+    started_at = timezone.now()
+    updated = (
+        InterviewSession.objects.filter(id=session_id)
+        .exclude(question_preparation_status="READY")
+        .exclude(
+            question_preparation_status="PREPARING",
+            question_preparation_started_at__gte=started_at
+            - timedelta(seconds=stale_seconds),
+        )
+        .update(
+            question_preparation_status="PREPARING",
+            question_preparation_started_at=started_at,
+        )
+    )
+    return started_at if updated else None
+
+
+def _release_audio(questions):
+    """Drop the audio references of questions that will not be saved."""
+    for question in questions:
+        tts_cache.release(question.get("audio_url"))
+
+
+def _prepare(session_id, claimed_at):
+    session = InterviewSession.objects.get(id=session_id)
+    claim = InterviewSession.objects.filter(
+        id=session_id,
+        question_preparation_status="PREPARING",
+        question_preparation_started_at=claimed_at,
+    )
+
+    if session.questions.filter(question_level="MAIN").exists():
+        # Questions created before preparation was tracked: only fill in
+        # missing audio.
+        missing = [
+            question
+            for question in session.questions.filter(question_level="MAIN").order_by("order")
+            if question.question_type != "CODING" and not question.audio_url
+        ]
+        audio_urls = _question_audio_urls(
+            session, [question.question_text for question in missing]
+        )
+        for question, audio_url in zip(missing, audio_urls):
+            question.audio_url = audio_url
+        InterviewQuestion.objects.bulk_update(
+            [question for question in missing if question.audio_url], ["audio_url"]
+        )
+        claim.update(question_preparation_status="READY")
+        return
+
+    questions = []
+    try:
+        resume_summary, questions = generate_questions(session)
+        audio_urls = _question_audio_urls(
+            session, [question["text"] for question in questions]
+        )
+        for question, audio_url in zip(questions, audio_urls):
+            question["audio_url"] = audio_url
+    except Exception as e:
+        logger.error(f"Question preparation failed for session {session_id}: {e}")
+        _release_audio(questions)
+        claim.update(question_preparation_status="FAILED")
+        raise
+
+    with transaction.atomic():
+        # A preparation that was taken over must not add a second question set.
+        if not claim.update(
+            question_preparation_status="READY", resume_summary=resume_summary
+        ):
+            logger.info(f"Discarding superseded questions for session {session_id}")
+            _release_audio(questions)
+            return
+        InterviewQuestion.objects.bulk_create(
+            [
+                InterviewQuestion(
+                    session=session,
+                    question_text=question["text"],
+                    question_type=question["type"],
+                    audio_url=question["audio_url"],
+                    order=index,
+                    question_level="MAIN",
+                )
+                for index, question in enumerate(questions)
+            ]
+            + [
+                InterviewQuestion(
+                    session=session,
+                    question_text=CODING_CHALLENGE["description"],
+                    question_type="CODING",
+                    coding_language=CODING_CHALLENGE["language"],
+                    order=len(questions),
+                    question_level="MAIN",
+                )
+            ]
+        )
+    logger.info(f"Prepared {len(questions)} questions for session {session_id}")
+
+
+def prepare_session_questions(session_id):
+    """Generate and store the questions of a session unless already done."""
+    claimed_at = _claim(session_id)
+    if claimed_at is not None:
+        _prepare(session_id, claimed_at)
+
+
+def start_question_preparation(session):
+    """Queue question preparation for a newly created session."""
+    return run_in_background(prepare_session_questions, session.id)
+
+
+def load_prepared_questions(session):
+    """The stored questions of session as (spoken, coding) portal data."""
+    spoken, coding = [], []
+    for question in session.questions.filter(question_level="MAIN").order_by("order"):
+        if question.question_type == "CODING":
+            coding.append(
+                dict(
+                    CODING_CHALLENGE,
+                    id=str(question.id),
+                    description=question.question_text,
+                    language=question.coding_language or CODING_CHALLENGE["language"],
+                )
+            )
+        else:
+            spoken.append(
+                {
+                    "id": str(question.id),
+                    "type": question.question_type,
+                    "text": question.question_text,
+                    # Serves the stored audio, or synthesizes it on first request.
+                    "audio_url": reverse("question_audio", args=[question.id]),
+                }
+            )
+    return spoken, coding
+
+
+def get_session_questions(session):
+    """
+    (spoken, coding) questions for the portal, or None while they are being
+    prepared. Never waits: if no preparation is running, or the running one
+    has taken longer than QUESTION_PREPARATION_WAIT_SECONDS, one is started
+    in the background and the portal polls until the questions are READY.
+    """
+    session.refresh_from_db(fields=["question_preparation_status"])
+    if session.question_preparation_status != "READY":
+        claimed_at = _claim(
+            session.id, getattr(settings, "QUESTION_PREPARATION_WAIT_SECONDS", 30)
+        )
+        if claimed_at is not None:
+            logger.info(f"Preparing questions on demand for session {session.id}")
+            run_in_background(_prepare, session.id, claimed_at)
+        return None
+    session.refresh_from_db()
+    return load_prepared_questions(session)
@@ -0,0 +1,112 @@
+# interview_app/result_cache.py
+import hashlib
+import logging
+import threading
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .models import CachedResult
+
+logger = logging.getLogger(__name__)
+
+
+def content_key(*parts):
+    """SHA-256 over the given parts (bytes or str), as a hex cache key."""
+    digest = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, str):
+            part = part.encode("utf-8")
+        digest.update(hashlib.sha256(part).digest())
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    A size-bounded, least-recently-used cache of JSON results, persisted in
+    the CachedResult table so entries survive restarts and are shared by
+    every Django process. Entries may also carry a time-to-live; expired
+    entries count as misses and are evicted first. Hit and miss counters are
+    kept per process.
+    """
+
+    def __init__(self, namespace, max_entries):
+        self.namespace = namespace
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key):
+        """Return the cached value for key, or None."""
+        entry = (
+            CachedResult.objects.filter(namespace=self.namespace, key=key)
+            .filter(Q(expires_at__isnull=True) | Q(expires_at__gt=timezone.now()))
+            .only("value")
+            .first()
+        )
+        with self._lock:
+            if entry is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        if entry is None:
+            return None
+        CachedResult.objects.filter(pk=entry.pk).update(
+            hit_count=F("hit_count") + 1, last_accessed=timezone.now()
+        )
+        return entry.value
+
+    def set(self, key, value, ttl=None):
+        """Store value under key, expiring after ttl seconds if given."""
+        now = timezone.now()
+        try:
+            CachedResult.objects.update_or_create(
+                namespace=self.namespace,
+                key=key,
+                defaults={
+                    "value": value,
+                    "last_accessed": now,
+                    "expires_at": now + timedelta(seconds=ttl) if ttl else None,
+                },
+            )
+        except IntegrityError:
+            # Another process stored the same result first.
+            return
+        self._evict()
+
+    def _evict(self):
+        entries = CachedResult.objects.filter(namespace=self.namespace)
+        expired, _ = entries.filter(expires_at__lte=timezone.now()).delete()
+        if expired:
+            logger.info(
+                f"Removed {expired} expired entries from the '{self.namespace}' cache"
+            )
+        overflow = entries.count() - self.max_entries
+        if overflow <= 0:
+            return
+        stale = entries.order_by("last_accessed").values_list("pk", flat=True)[:overflow]
+        deleted, _ = CachedResult.objects.filter(pk__in=list(stale)).delete()
+        logger.info(f"Evicted {deleted} entries from the '{self.namespace}' cache")
+
+    def stats(self):
+        with self._lock:
+            hits, misses = self._hits, self._misses
+        lookups = hits + misses
+        return {
+            "namespace": self.namespace,
+            "entries": CachedResult.objects.filter(namespace=self.namespace).count(),
+            "max_entries": self.max_entries,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+        }
+
+
+transcription_cache = ResultCache(
+    "transcription",
+    max_entries=getattr(settings, "TRANSCRIPTION_CACHE_MAX_ENTRIES", 5000),
+)
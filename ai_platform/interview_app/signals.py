@@ -0,0 +1,11 @@
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from .tts_cache import tts_cache
+
+
+@receiver(post_delete, sender="interview_app.InterviewQuestion")
+@receiver(post_delete, sender="ai_interview.AIInterviewQuestion")
+def release_question_audio(sender, instance, **kwargs):
+    """A deleted question no longer references its cached audio."""
+    tts_cache.release(instance.audio_url)
@@ -1,3 +1,604 @@
-from django.test import TestCase
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import Future
+from datetime import timedelta
+from unittest import mock
 
-# Create your tests here.
+import numpy as np
+
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+
+from . import media_lifecycle, question_preparation
+from .llm_cache import LLMCache
+from .llm_gateway import CircuitBreaker, LLMGateway, LLMUnavailableError
+from .models import InterviewSession, MediaFile, TTSAudio
+from .prompt_builder import TRUNCATION_MARKER, Section, _allocate, build_prompt, count_tokens
+from .question_generation import validate_question_set
+from .transcription_pool import QueueFullError, TranscriptionPool
+from .tts_cache import TTSCache
+from .tts_engines import TTSEngines
+from .vad import to_original_time, trim_silence
+from .views import _byte_range
+
+
+@override_settings(QUESTION_PREPARATION_TIMEOUT_SECONDS=300)
+class QuestionPreparationClaimTests(TestCase):
+    def setUp(self):
+        self.session = InterviewSession.objects.create(candidate_name="Test")
+
+    def set_status(self, status, started_seconds_ago=0):
+        InterviewSession.objects.filter(id=self.session.id).update(
+            question_preparation_status=status,
+            question_preparation_started_at=timezone.now()
+            - timedelta(seconds=started_seconds_ago),
+        )
+
+    def test_claims_a_session_not_being_prepared(self):
+        self.assertIsNotNone(question_preparation._claim(self.session.id))
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.question_preparation_status, "PREPARING")
+
+    def test_running_preparation_is_not_taken_over(self):
+        self.set_status("PREPARING", started_seconds_ago=10)
+        self.assertIsNone(question_preparation._claim(self.session.id))
+
+    def test_stale_preparation_is_taken_over(self):
+        self.set_status("PREPARING", started_seconds_ago=301)
+        self.assertIsNotNone(question_preparation._claim(self.session.id))
+
+    def test_shorter_stale_limit_takes_over_sooner(self):
+        self.set_status("PREPARING", started_seconds_ago=31)
+        self.assertIsNotNone(question_preparation._claim(self.session.id, 30))
+
+    def test_failed_preparation_is_retried(self):
+        self.set_status("FAILED", started_seconds_ago=10)
+        self.assertIsNotNone(question_preparation._claim(self.session.id))
+
+    def test_ready_session_is_never_claimed(self):
+        self.set_status("READY", started_seconds_ago=1000)
+        self.assertIsNone(question_preparation._claim(self.session.id, 0))
+
+
+class ValidateQuestionSetTests(SimpleTestCase):
+    def valid(self, **overrides):
+        data = {
+            "resume_summary": "Python developer",
+            "questions": [{"type": "Ice-Breaker", "text": "Tell me about yourself."}],
+            "coding_question": None,
+        }
+        data.update(overrides)
+        return data
+
+    def test_valid_set(self):
+        self.assertEqual(validate_question_set(self.valid()), [])
+
+    def test_not_an_object(self):
+        self.assertEqual(
+            validate_question_set([]), ["the response must be a JSON object"]
+        )
+
+    def test_bad_question_type_and_empty_text(self):
+        errors = validate_question_set(
+            self.valid(questions=[{"type": "Trivia", "text": " "}])
+        )
+        self.assertEqual(len(errors), 2)
+
+    def test_coding_question_required_when_asked_for(self):
+        self.assertEqual(
+            validate_question_set(self.valid(), coding_question=True),
+            ["'coding_question' is required"],
+        )
+
+    def test_coding_question_test_cases_need_string_output(self):
+        coding = {
+            "title": "Reverse",
+            "description": "Reverse a string.",
+            "language": "PYTHON",
+            "starter_code": "def f(s): pass",
+            "test_cases": [{"input": '"ab"', "output": 1}],
+        }
+        self.assertEqual(len(validate_question_set(self.valid(coding_question=coding))), 1)
+
+
+class AllocateTests(SimpleTestCase):
+    def test_sections_within_budget_are_kept_whole(self):
+        self.assertEqual(_allocate([100, 200], 300), [100, 200])
+
+    def test_short_sections_stay_whole_and_large_ones_share_the_rest(self):
+        self.assertEqual(_allocate([100, 1000, 2000], 1100), [100, 500, 500])
+
+    def test_equal_sections_are_cut_equally(self):
+        self.assertEqual(_allocate([600, 600], 600), [300, 300])
+
+
+class BuildPromptTests(SimpleTestCase):
+    @override_settings(PROMPT_TOKEN_BUDGETS={"test": 50})
+    def test_largest_section_is_truncated_to_the_budget(self):
+        prompt = build_prompt(
+            "test",
+            "Instructions",
+            [Section("SHORT:", "a" * 40), Section("LONG:", "b" * 1000)],
+        )
+        self.assertTrue(prompt.startswith("Instructions\n\nSHORT:\n" + "a" * 40))
+        long_text = prompt.split("LONG:\n", 1)[1]
+        self.assertTrue(long_text.endswith(TRUNCATION_MARKER))
+        self.assertLessEqual(count_tokens(long_text), 40)
+
+    def test_call_types_without_a_budget_are_not_truncated(self):
+        prompt = build_prompt("unlimited", "Go", [Section("TEXT:", "c" * 100000)])
+        self.assertEqual(prompt, "Go\n\nTEXT:\n" + "c" * 100000)
+
+
+class ByteRangeTests(SimpleTestCase):
+    def test_no_or_malformed_header(self):
+        self.assertIsNone(_byte_range(None, 100))
+        self.assertIsNone(_byte_range("bytes=-", 100))
+        self.assertIsNone(_byte_range("items=0-1", 100))
+        self.assertIsNone(_byte_range("bytes=0-1,5-6", 100))
+
+    def test_explicit_and_open_ranges(self):
+        self.assertEqual(_byte_range("bytes=0-9", 100), (0, 9))
+        self.assertEqual(_byte_range("bytes=90-", 100), (90, 99))
+        self.assertEqual(_byte_range("bytes=50-500", 100), (50, 99))
+
+    def test_suffix_range(self):
+        self.assertEqual(_byte_range("bytes=-10", 100), (90, 99))
+        self.assertEqual(_byte_range("bytes=-500", 100), (0, 99))
+
+    def test_unsatisfiable(self):
+        self.assertEqual(_byte_range("bytes=100-", 100), "unsatisfiable")
+        self.assertEqual(_byte_range("bytes=9-5", 100), "unsatisfiable")
+
+
+def _tone(seconds, amplitude, sample_rate=16000):
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    return (amplitude * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+
+
+@override_settings(VAD_PADDING_SECONDS=0.2)
+class TrimSilenceTests(SimpleTestCase):
+    def test_leading_and_trailing_silence_is_dropped(self):
+        silence = np.zeros(16000, dtype=np.float32)
+        audio = np.concatenate([silence, _tone(1, 0.5), silence])
+        trimmed, regions, speech = trim_silence(audio)
+        self.assertEqual(len(speech), 1)
+        self.assertAlmostEqual(len(trimmed) / 16000, 1.4, delta=0.1)
+        # The start of the trimmed audio is the padded start of the speech.
+        self.assertAlmostEqual(to_original_time(0, regions), 0.8, delta=0.05)
+
+    def test_quiet_speech_is_passed_on_untrimmed(self):
+        audio = _tone(2, 0.005)
+        trimmed, regions, speech = trim_silence(audio)
+        self.assertIs(trimmed, audio)
+        self.assertIsNone(regions)
+        self.assertIsNone(speech)
+
+
+class FakeEngine:
+    def __init__(self, name, fail=False):
+        self.name = name
+        self.fail = fail
+        self.calls = 0
+
+    def voice(self, lang_code, accent_tld):
+        return f"{lang_code}-{accent_tld}"
+
+    def stream(self, text, lang_code, accent_tld):
+        self.calls += 1
+        if self.fail:
+            raise ConnectionError(f"{self.name} is down")
+        yield f"{self.name}:{text}".encode()
+
+
+class TTSEnginesTests(SimpleTestCase):
+    def test_falls_back_to_the_next_engine(self):
+        engines = TTSEngines(
+            [FakeEngine("google_cloud", fail=True), FakeEngine("espeak")], 3, 60
+        )
+        name, chunks = engines.stream("Hello", "en", "com")
+        self.assertEqual(name, "espeak")
+        self.assertEqual(b"".join(chunks), b"espeak:Hello")
+
+    def test_failing_engine_is_skipped_once_its_circuit_opens(self):
+        primary = FakeEngine("google_cloud", fail=True)
+        engines = TTSEngines([primary, FakeEngine("espeak")], 2, 60)
+        for _ in range(4):
+            engines.stream("Hello", "en", "com")
+        self.assertEqual(primary.calls, 2)
+        self.assertEqual(engines.metrics()["engines"]["google_cloud"]["skipped"], 2)
+
+    def test_fallback_audio_is_servable_only_while_the_primary_is_down(self):
+        engines = TTSEngines(
+            [FakeEngine("google_cloud", fail=True), FakeEngine("espeak")], 1, 60
+        )
+        self.assertEqual(
+            engines.servable_voices("en", "com"), [("google_cloud", "en-com")]
+        )
+        engines.stream("Hello", "en", "com")
+        self.assertEqual(
+            engines.servable_voices("en", "com"),
+            [("google_cloud", "en-com"), ("espeak", "en-com")],
+        )
+
+
+class TTSCacheTestCase(TestCase):
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        media = override_settings(MEDIA_ROOT=media_root, MEDIA_URL="/media/")
+        media.enable()
+        self.addCleanup(media.disable)
+        self.cache = TTSCache(max_bytes=10**6)
+
+    def use_engines(self, *engines, failure_threshold=1):
+        self.engines = TTSEngines(list(engines), failure_threshold, 60)
+        patcher = mock.patch(
+            "ai_platform.interview_app.tts_cache.get_tts_engines", return_value=self.engines
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class TTSCacheTests(TTSCacheTestCase):
+    def setUp(self):
+        super().setUp()
+        self.engine = FakeEngine("google_cloud")
+        self.use_engines(self.engine)
+
+    def test_same_text_is_synthesized_once_and_shared(self):
+        first = self.cache.audio_url("Tell me about  yourself.", "en", "com")
+        second = self.cache.audio_url("Tell me about yourself.\n", "en", "com")
+        self.assertEqual(first, second)
+        self.assertEqual(self.engine.calls, 1)
+        self.assertEqual(TTSAudio.objects.get().ref_count, 2)
+        self.assertEqual(self.cache.stats()["hits"], 1)
+
+    def test_release_drops_a_reference(self):
+        url = self.cache.audio_url("Hello", "en", "com")
+        self.cache.release(url)
+        self.cache.release(url)
+        self.assertEqual(TTSAudio.objects.get().ref_count, 0)
+
+    def test_only_unreferenced_files_are_evicted_least_recently_used_first(self):
+        self.cache.max_bytes = 40  # each file is 14 bytes
+        old = self.cache.audio_url("A", "en", "com")
+        self.cache.release(old)
+        kept = self.cache.audio_url("B", "en", "com")
+        self.cache.audio_url("C", "en", "com")
+        self.assertIsNone(self.cache.stored_path(old))
+        self.assertIsNotNone(self.cache.stored_path(kept))
+        self.assertEqual(TTSAudio.objects.count(), 2)
+
+
+class TTSFallbackCacheTests(TTSCacheTestCase):
+    def test_fallback_audio_is_replaced_once_the_primary_recovers(self):
+        primary = FakeEngine("google_cloud", fail=True)
+        self.use_engines(primary, FakeEngine("espeak"))
+        degraded = self.cache.audio_url("Hello", "en", "com")
+        # While the primary's circuit is open, the fallback audio is shared.
+        self.assertEqual(self.cache.audio_url("Hello", "en", "com"), degraded)
+
+        primary.fail = False
+        self.engines._breakers["google_cloud"].record_success()
+        recovered = self.cache.audio_url("Hello", "en", "com")
+        self.assertNotEqual(recovered, degraded)
+        with open(self.cache.stored_path(recovered), "rb") as f:
+            self.assertEqual(f.read(), b"google_cloud:Hello")
+
+
+class FakeGateway:
+    model_name = "test-model"
+    backend = mock.Mock()
+    backend.name = "fake"
+
+    def __init__(self):
+        self.calls = 0
+
+    def generate_text(self, call_type, prompt, generation_config=None):
+        self.calls += 1
+        return f"response {self.calls}"
+
+
+class LLMCacheTests(TestCase):
+    def setUp(self):
+        self.gateway = FakeGateway()
+        patcher = mock.patch(
+            "ai_platform.interview_app.llm_cache.get_llm_gateway", return_value=self.gateway
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.cache = LLMCache(max_entries=10)
+
+    def test_repeated_prompt_is_answered_from_the_cache(self):
+        first = self.cache.generate_text("resume_evaluation", "Score  this\nresume")
+        second = self.cache.generate_text("resume_evaluation", "Score this resume")
+        self.assertEqual((first, second), ("response 1", "response 1"))
+        self.assertEqual(self.gateway.calls, 1)
+        self.assertEqual(
+            self.cache.stats()["call_types"]["resume_evaluation"]["hits"], 1
+        )
+
+    def test_generation_config_is_part_of_the_key(self):
+        self.cache.generate_text("resume_evaluation", "Score this resume")
+        self.cache.generate_text(
+            "resume_evaluation",
+            "Score this resume",
+            generation_config={"response_mime_type": "application/json"},
+        )
+        self.assertEqual(self.gateway.calls, 2)
+
+    def test_uncached_call_types_always_reach_the_model(self):
+        self.cache.generate_text("follow_up", "Ask a follow-up")
+        self.cache.generate_text("follow_up", "Ask a follow-up")
+        self.assertEqual(self.gateway.calls, 2)
+
+    @override_settings(LLM_CACHE_TTLS={"resume_evaluation": 0})
+    def test_a_zero_ttl_disables_caching(self):
+        self.cache.generate_text("resume_evaluation", "Score this resume")
+        self.cache.generate_text("resume_evaluation", "Score this resume")
+        self.assertEqual(self.gateway.calls, 2)
+
+
+class FakeProcessPool:
+    """Stands in for the worker processes; the test completes each batch."""
+
+    def __init__(self, **kwargs):
+        self.batches = []
+
+    def submit(self, fn, jobs):
+        future = Future()
+        self.batches.append((jobs, future))
+        return future
+
+    def shutdown(self, **kwargs):
+        pass
+
+
+class TranscriptionPoolTestCase(SimpleTestCase):
+    def make_pool(self, max_queue=4):
+        with mock.patch(
+            "ai_platform.interview_app.transcription_pool.ProcessPoolExecutor",
+            FakeProcessPool,
+        ):
+            pool = TranscriptionPool(
+                processes=1, max_queue=max_queue, batch_window=0, max_batch_size=8
+            )
+        self.addCleanup(pool.shutdown)
+        return pool
+
+    def wait_for_batches(self, pool, count):
+        deadline = time.time() + 5
+        while len(pool._executor.batches) < count:
+            self.assertLess(time.time(), deadline, "the clips were never dispatched")
+            time.sleep(0.01)
+        return pool._executor.batches
+
+    def finish_batch(self, jobs, future, text="hello"):
+        future.set_result(
+            {
+                "outcomes": [("ok", {"text": text, "segments": []}) for _ in jobs],
+                "started_at": time.time(),
+                "inference_seconds": 0.1,
+                "registry": {"pid": 1},
+            }
+        )
+
+
+class TranscriptionPoolBackpressureTests(TranscriptionPoolTestCase):
+    def test_submit_is_rejected_when_the_queue_is_full(self):
+        pool = self.make_pool(max_queue=2)
+        pool.submit(b"one", cache=False)
+        pool.submit(b"two", cache=False)
+        with self.assertRaises(QueueFullError):
+            pool.submit(b"three", cache=False)
+        metrics = pool.metrics()
+        self.assertEqual((metrics["queue_depth"], metrics["rejected"]), (2, 1))
+
+    def test_finished_clips_free_their_slots(self):
+        pool = self.make_pool(max_queue=1)
+        future = pool.submit(b"one", cache=False)
+        jobs, batch_future = self.wait_for_batches(pool, 1)[0]
+        self.finish_batch(jobs, batch_future)
+        self.assertEqual(future.result(timeout=1)["text"], "hello")
+        pool.submit(b"two", cache=False)
+        self.assertEqual(pool.metrics()["completed"], 1)
+
+
+@mock.patch(
+    "ai_platform.interview_app.background.run_in_background",
+    lambda func, *args, **kwargs: func(*args, **kwargs),
+)
+class TranscriptionCacheTests(TranscriptionPoolTestCase, TestCase):
+    def test_a_repeated_upload_joins_the_one_in_flight(self):
+        pool = self.make_pool()
+        first = pool.submit(b"answer", language="en")
+        self.assertIs(pool.submit(b"answer", language="en"), first)
+        self.assertEqual(pool.metrics()["coalesced"], 1)
+        self.assertEqual(len(self.wait_for_batches(pool, 1)[0][0]), 1)
+
+    def test_finished_transcript_is_served_from_the_cache(self):
+        pool = self.make_pool()
+        pool.submit(b"answer", language="en")
+        jobs, batch_future = self.wait_for_batches(pool, 1)[0]
+        self.finish_batch(jobs, batch_future, text="cached text")
+
+        again = pool.submit(b"answer", language="en")
+        self.assertTrue(again.done())
+        self.assertEqual(again.result()["text"], "cached text")
+        self.assertTrue(again.result()["cached"])
+        self.assertEqual(pool.metrics()["submitted"], 1)
+
+    def test_other_language_or_partial_audio_is_not_served_from_the_cache(self):
+        pool = self.make_pool()
+        pool.submit(b"answer", language="en")
+        jobs, batch_future = self.wait_for_batches(pool, 1)[0]
+        self.finish_batch(jobs, batch_future)
+
+        self.assertFalse(pool.submit(b"answer", language="hi").done())
+        self.assertFalse(pool.submit(b"answer", offset_seconds=2.0, language="en").done())
+        self.assertFalse(pool.submit(b"answer", language="en", cache=False).done())
+        self.assertEqual(pool.metrics()["submitted"], 4)
+
+
+class BackendError(Exception):
+    def __init__(self, code):
+        super().__init__(f"HTTP {code}")
+        self.code = code
+
+
+class ScriptedBackend:
+    """Returns (or raises) the given outcomes in order."""
+
+    name = "scripted"
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    def generate_content(self, call_type, contents, generation_config, timeout):
+        self.calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return mock.Mock(text=outcome, usage_metadata=None)
+
+
+class LLMGatewayTests(SimpleTestCase):
+    def gateway(self, backend, max_retries=3, failure_threshold=5):
+        return LLMGateway(
+            backend,
+            "test-model",
+            max_retries=max_retries,
+            backoff_base=0,
+            breaker=CircuitBreaker(failure_threshold=failure_threshold, reset_seconds=60),
+        )
+
+    def test_server_errors_are_retried(self):
+        backend = ScriptedBackend(BackendError(503), BackendError(429), "ok")
+        gateway = self.gateway(backend)
+        self.assertEqual(gateway.generate_text("test", "prompt"), "ok")
+        self.assertEqual(backend.calls, 3)
+        self.assertEqual(gateway.metrics()["call_types"]["test"]["retries"], 2)
+
+    def test_client_errors_are_not_retried(self):
+        backend = ScriptedBackend(BackendError(400), "ok")
+        gateway = self.gateway(backend)
+        with self.assertRaises(BackendError):
+            gateway.generate_text("test", "prompt")
+        self.assertEqual(backend.calls, 1)
+        self.assertEqual(gateway.breaker.state, "closed")
+
+    def test_the_last_error_is_raised_once_retries_run_out(self):
+        backend = ScriptedBackend(*[BackendError(500)] * 3)
+        with self.assertRaises(BackendError):
+            self.gateway(backend, max_retries=2).generate_text("test", "prompt")
+        self.assertEqual(backend.calls, 3)
+
+    def test_open_circuit_fails_fast_until_a_trial_call_succeeds(self):
+        backend = ScriptedBackend(BackendError(503), BackendError(503), "ok")
+        gateway = self.gateway(backend, max_retries=1, failure_threshold=2)
+        with self.assertRaises(BackendError):
+            gateway.generate_text("test", "prompt")
+        with self.assertRaises(LLMUnavailableError):
+            gateway.generate_text("test", "prompt")
+        self.assertEqual(backend.calls, 2)
+
+        gateway.breaker._opened_at -= 61
+        self.assertEqual(gateway.breaker.state, "half-open")
+        self.assertEqual(gateway.generate_text("test", "prompt"), "ok")
+        self.assertEqual(gateway.breaker.state, "closed")
+
+
+class MediaLifecycleTests(TestCase):
+    def setUp(self):
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root)
+        self.media_root = os.path.join(root, "media")
+        media = override_settings(
+            MEDIA_ROOT=self.media_root,
+            MEDIA_URL="/media/",
+            MEDIA_ARCHIVE_ROOT=os.path.join(root, "archive"),
+        )
+        media.enable()
+        self.addCleanup(media.disable)
+
+    def write(self, path, days_old=0):
+        full_path = os.path.join(self.media_root, path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        with open(full_path, "wb") as f:
+            f.write(b"data")
+        modified = time.time() - days_old * 24 * 60 * 60
+        os.utime(full_path, (modified, modified))
+        return full_path
+
+    def test_stale_temporary_files_are_deleted(self):
+        stale = self.write("uploads/.abc.tmp", days_old=2)
+        fresh = self.write("uploads/.def.tmp")
+        summary = media_lifecycle.sweep(100)
+        self.assertEqual(summary["deleted"], {"temp": 1})
+        self.assertFalse(os.path.exists(stale))
+        self.assertTrue(os.path.exists(fresh))
+
+    def test_cached_audio_is_deleted_only_when_unused_past_retention(self):
+        old = timezone.now() - timedelta(days=30)
+        for key, ref_count in (("unused", 0), ("in_use", 1)):
+            self.write(f"tts/cache/{key}.mp3")
+            TTSAudio.objects.create(
+                key=key, engine="gtts", file_path=f"tts/cache/{key}.mp3", ref_count=ref_count
+            )
+        TTSAudio.objects.update(last_accessed=old)
+        media_lifecycle.sweep(100)
+        self.assertEqual(list(TTSAudio.objects.values_list("key", flat=True)), ["in_use"])
+        self.assertFalse(os.path.exists(os.path.join(self.media_root, "tts/cache/unused.mp3")))
+
+    def test_id_card_is_deleted_after_the_session_retention(self):
+        session = InterviewSession.objects.create(
+            candidate_name="Test", id_card_image="id_cards/card.jpg"
+        )
+        InterviewSession.objects.filter(id=session.id).update(
+            created_at=timezone.now() - timedelta(days=31)
+        )
+        card = self.write("id_cards/card.jpg")
+        media_lifecycle.sweep(100)
+        self.assertFalse(os.path.exists(card))
+        session.refresh_from_db()
+        self.assertFalse(session.id_card_image)
+
+    def test_uploads_are_not_archived_by_default(self):
+        upload = self.write("uploads/report.pdf", days_old=400)
+        self.assertEqual(media_lifecycle.sweep(100)["archived"], {})
+        self.assertTrue(os.path.exists(upload))
+
+    @override_settings(MEDIA_ARCHIVE_AFTER_DAYS={"upload": 90})
+    def test_cold_unreferenced_upload_is_archived_and_restorable(self):
+        upload = self.write("uploads/report.pdf", days_old=100)
+        self.assertEqual(media_lifecycle.sweep(100)["archived"], {"upload": 1})
+        self.assertFalse(os.path.exists(upload))
+        media_lifecycle.restore("uploads/report.pdf")
+        with open(upload, "rb") as f:
+            self.assertEqual(f.read(), b"data")
+
+    @override_settings(MEDIA_ARCHIVE_AFTER_DAYS={"upload": 90})
+    def test_file_a_model_refers_to_is_never_archived(self):
+        upload = self.write("uploads/card.jpg", days_old=100)
+        InterviewSession.objects.create(candidate_name="Test", id_card_image="uploads/card.jpg")
+        self.assertEqual(media_lifecycle.sweep(100)["archived"], {})
+        self.assertTrue(os.path.exists(upload))
+
+    def test_dry_run_only_registers_files(self):
+        stale = self.write("uploads/.abc.tmp", days_old=2)
+        summary = media_lifecycle.sweep(100, dry_run=True)
+        self.assertEqual((summary["registered"], summary["deleted"]), (1, {"temp": 1}))
+        self.assertTrue(os.path.exists(stale))
+
+    def test_scan_continues_where_the_last_one_stopped(self):
+        for name in ("a", "b/c", "d"):
+            self.write(f"uploads/{name}.pdf")
+        self.assertEqual(media_lifecycle.scan(2), 2)
+        self.assertEqual(media_lifecycle.scan(2), 1)
+        # The walk reached the end, so the next scan starts from the top.
+        self.assertEqual(media_lifecycle.scan_state.get("cursor"), "")
+        self.assertEqual(MediaFile.objects.count(), 3)
@@ -0,0 +1,238 @@
+# interview_app/transcription_backends.py
+"""
+Speech-to-text backends. Every backend takes 16 kHz float32 audio arrays and
+returns, per clip, {"text": str, "segments": [{"start", "end", "text"}]} with
+times in seconds from the start of the clip, so callers never depend on
+which engine produced a transcript.
+"""
+import logging
+
+from django.conf import settings
+
+from .model_registry import registry
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 16000
+WINDOW_SAMPLES = 30 * SAMPLE_RATE
+
+DEFAULT_DECODE_PROFILES = {
+    # Live answers: greedy, no fallback, every window decoded independently.
+    "fast": {
+        "beam_size": 1,
+        "temperature": [0.0],
+        "condition_on_previous_text": False,
+    },
+    # Offline re-transcription: beam search with the full temperature fallback.
+    "accurate": {
+        "beam_size": 5,
+        "temperature": [0.0, 0.2, 0.4, 0.6, 0.8, 1.0],
+        "condition_on_previous_text": True,
+    },
+}
+
+
+def decode_profile(name=None):
+    """
+    Decode options for a profile name (default
+    settings.TRANSCRIPTION_DEFAULT_PROFILE). Deployments may override or add
+    profiles with settings.TRANSCRIPTION_DECODE_PROFILES.
+    """
+    profiles = dict(DEFAULT_DECODE_PROFILES)
+    profiles.update(getattr(settings, "TRANSCRIPTION_DECODE_PROFILES", {}))
+    name = name or getattr(settings, "TRANSCRIPTION_DEFAULT_PROFILE", "fast")
+    if name not in profiles:
+        raise ValueError(f"Unknown decode profile '{name}'.")
+    return profiles[name]
+
+
+def whisper_language(language_code):
+    """Whisper language for a session language code ("en-IN" -> "en")."""
+    if not language_code:
+        return None
+    return language_code.split("-")[0].lower()
+
+
+class TranscriptionBackend:
+    """
+    Base class: subclasses implement transcribe(); batching is optional.
+    language is a Whisper language code (None lets the engine detect it) and
+    profile the name of a decode profile.
+    """
+
+    name = None
+    model_key = None
+
+    def load(self):
+        """Load (or fetch from the model registry) the underlying model."""
+        return registry.get(self.model_key)
+
+    def transcribe(self, audio, language=None, profile=None):
+        raise NotImplementedError
+
+    def transcribe_batch(self, clips, language=None, profile=None):
+        """Transcribe several clips; the default runs them one by one."""
+        return [self.transcribe(audio, language, profile) for audio in clips]
+
+
+def _segments_from_tokens(tokens, tokenizer, duration):
+    """
+    Split decoded tokens into timed segments. Whisper emits each segment as
+    <|start|> text tokens <|end|>; a trailing segment without an end
+    timestamp runs to the end of the clip.
+    """
+    segments = []
+    start, text_tokens = None, []
+    for token in tokens:
+        if token < tokenizer.timestamp_begin:
+            text_tokens.append(token)
+            continue
+        timestamp = (token - tokenizer.timestamp_begin) * 0.02
+        if start is not None and text_tokens:
+            segments.append(
+                {"start": start, "end": timestamp, "text": tokenizer.decode(text_tokens)}
+            )
+            start, text_tokens = None, []
+        else:
+            start = timestamp
+    if text_tokens:
+        segments.append(
+            {"start": start or 0.0, "end": duration, "text": tokenizer.decode(text_tokens)}
+        )
+    return segments
+
+
+class WhisperBackend(TranscriptionBackend):
+    """openai-whisper in fp32 on PyTorch (the default)."""
+
+    name = "openai-whisper"
+    model_key = "whisper"
+
+    def transcribe(self, audio, language=None, profile=None):
+        options = decode_profile(profile)
+        result = self.load().transcribe(
+            audio,
+            fp16=False,
+            language=language,
+            task="transcribe",
+            beam_size=options["beam_size"] if options["beam_size"] > 1 else None,
+            temperature=tuple(options["temperature"]),
+            condition_on_previous_text=options["condition_on_previous_text"],
+        )
+        return {
+            "text": result.get("text", ""),
+            "segments": [
+                {"start": segment["start"], "end": segment["end"], "text": segment["text"]}
+                for segment in result.get("segments", [])
+            ],
+        }
+
+    def transcribe_batch(self, clips, language=None, profile=None):
+        """
+        Clips of at most 30 s are decoded in one forward pass: each is padded
+        to a full window and the mel spectrograms are stacked into one batch.
+        A batch has no temperature fallback, so profiles that ask for one,
+        and clips longer than a window, go through transcribe().
+        """
+        options = decode_profile(profile)
+        if len(options["temperature"]) > 1:
+            return super().transcribe_batch(clips, language, profile)
+
+        results = [None] * len(clips)
+        short = [i for i, audio in enumerate(clips) if len(audio) <= WINDOW_SAMPLES]
+        for i, audio in enumerate(clips):
+            if i not in short:
+                results[i] = self.transcribe(audio, language, profile)
+        if short:
+            decoded = self._decode_windows([clips[i] for i in short], language, options)
+            for i, result in zip(short, decoded):
+                results[i] = result
+        return results
+
+    def _decode_windows(self, clips, language, options):
+        import torch
+        import whisper
+        from whisper.tokenizer import get_tokenizer
+
+        model = self.load()
+        mel = torch.stack(
+            [
+                whisper.log_mel_spectrogram(whisper.pad_or_trim(audio), model.dims.n_mels)
+                for audio in clips
+            ]
+        ).to(model.device)
+        decoded = whisper.decode(
+            model,
+            mel,
+            whisper.DecodingOptions(
+                fp16=False,
+                language=language,
+                task="transcribe",
+                beam_size=options["beam_size"] if options["beam_size"] > 1 else None,
+                temperature=options["temperature"][0],
+            ),
+        )
+        tokenizer = get_tokenizer(
+            model.is_multilingual,
+            num_languages=model.num_languages,
+            language=language,
+            task="transcribe",
+        )
+        return [
+            {
+                "text": result.text,
+                "segments": _segments_from_tokens(
+                    result.tokens, tokenizer, len(audio) / SAMPLE_RATE
+                ),
+            }
+            for audio, result in zip(clips, decoded)
+        ]
+
+
+class QuantizedWhisperBackend(WhisperBackend):
+    """
+    openai-whisper with its Linear layers converted to int8 by PyTorch
+    dynamic quantization. Same decoding path as WhisperBackend.
+    """
+
+    name = "whisper-int8"
+    model_key = "whisper-int8"
+
+
+class FasterWhisperBackend(TranscriptionBackend):
+    """faster-whisper (CTranslate2) with int8 weights on CPU."""
+
+    name = "faster-whisper"
+    model_key = "faster-whisper"
+
+    def transcribe(self, audio, language=None, profile=None):
+        options = decode_profile(profile)
+        segments, _info = self.load().transcribe(
+            audio,
+            language=language,
+            task="transcribe",
+            beam_size=options["beam_size"],
+            temperature=options["temperature"],
+            condition_on_previous_text=options["condition_on_previous_text"],
+        )
+        segments = [
+            {"start": segment.start, "end": segment.end, "text": segment.text}
+            for segment in segments
+        ]
+        return {"text": "".join(s["text"] for s in segments), "segments": segments}
+
+
+BACKENDS = {
+    backend.name: backend
+    for backend in (WhisperBackend, QuantizedWhisperBackend, FasterWhisperBackend)
+}
+
+
+def get_backend(name):
+    """Return a backend instance by name, e.g. for benchmarks."""
+    if name not in BACKENDS:
+        raise ValueError(
+            f"Unknown transcription backend '{name}'. "
+            f"Choose one of: {', '.join(BACKENDS)}"
+        )
+    return BACKENDS[name]()
@@ -0,0 +1,494 @@
+# interview_app/transcription_pool.py
+import logging
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import get_context
+
+from django.conf import settings
+
+from .transcription_backends import whisper_language
+from .vad import trim_silence, to_original_time
+
+logger = logging.getLogger(__name__)
+
+
+class QueueFullError(Exception):
+    """Raised when the transcription queue has no free slot for a new job."""
+
+
+# --- Worker process side ---
+
+
+def _init_worker():
+    """
+    Runs once in every worker process: loads the transcription model so that
+    each process holds exactly one copy and later jobs start decoding
+    immediately.
+    """
+    import django
+
+    # Spawned workers start from a clean interpreter; the model registry
+    # reads its configuration from settings.
+    django.setup()
+
+    from .whisper_loader import get_transcription_backend
+
+    try:
+        get_transcription_backend().load()
+    except Exception as e:
+        # Leave the worker alive; jobs will report the error individually.
+        logger.error(f"Could not preload the transcription model: {e}")
+
+
+def _load_clip(audio_bytes, offset_seconds):
+    from .audio_decode import decode_audio_bytes, SAMPLE_RATE
+
+    audio = decode_audio_bytes(audio_bytes)
+    # Streaming callers re-send the growing recording and only need the part
+    # after what they have already committed.
+    return audio[int(offset_seconds * SAMPLE_RATE) :]
+
+
+def _restore_timeline(result, offset_seconds, length, regions, speech):
+    """
+    Move segment timestamps from the (possibly silence-trimmed) audio the
+    model saw back onto the recording, and report where speech was heard.
+    """
+    from .audio_decode import SAMPLE_RATE
+
+    if regions is not None:
+        for segment in result["segments"]:
+            segment["start"] = to_original_time(segment["start"], regions)
+            segment["end"] = to_original_time(segment["end"], regions)
+        speech_regions = [(start / SAMPLE_RATE, end / SAMPLE_RATE) for start, end in speech]
+    else:
+        # VAD disabled or it heard nothing: treat the whole clip as speech.
+        speech_regions = [(0.0, length / SAMPLE_RATE)] if length else []
+
+    for segment in result["segments"]:
+        segment["start"] += offset_seconds
+        segment["end"] += offset_seconds
+    result["speech_regions"] = [
+        (start + offset_seconds, end + offset_seconds) for start, end in speech_regions
+    ]
+    result["speech_seconds"] = sum(end - start for start, end in speech_regions)
+    result["duration"] = offset_seconds + length / SAMPLE_RATE
+
+
+def _transcribe_batch_in_worker(jobs):
+    """
+    Transcribe a batch of (audio_bytes, offset_seconds, language, profile)
+    jobs. Returns one ("ok", result) or ("error", message) per job, in order,
+    so that one undecodable upload does not fail the others. Clips sharing a
+    language and decode profile are decoded together.
+    """
+    from .whisper_loader import get_transcription_backend
+
+    started_at = time.time()
+    backend = get_transcription_backend()
+
+    outcomes = [None] * len(jobs)
+    groups, timelines, stages = {}, {}, {}
+    for index, (audio_bytes, offset_seconds, language, profile) in enumerate(jobs):
+        stages[index] = {"decode": 0.0, "vad": 0.0, "model": 0.0, "postprocess": 0.0}
+        try:
+            stage_started = time.time()
+            audio = _load_clip(audio_bytes, offset_seconds)
+            stages[index]["decode"] = time.time() - stage_started
+            length, regions, speech = len(audio), None, None
+            if getattr(settings, "VAD_ENABLED", True):
+                # Whisper only sees the speech; silence costs as much as words.
+                stage_started = time.time()
+                audio, regions, speech = trim_silence(audio)
+                stages[index]["vad"] = time.time() - stage_started
+            timelines[index] = (offset_seconds, length, regions, speech)
+            if not len(audio):
+                outcomes[index] = ("ok", {"text": "", "segments": []})
+                continue
+            groups.setdefault((language, profile), []).append((index, audio))
+        except Exception as e:
+            outcomes[index] = ("error", str(e))
+
+    for (language, profile), members in groups.items():
+        indexes = [index for index, _ in members]
+        stage_started = time.time()
+        try:
+            results = backend.transcribe_batch(
+                [audio for _, audio in members], language=language, profile=profile
+            )
+            for index, result in zip(indexes, results):
+                outcomes[index] = ("ok", result)
+        except Exception as e:
+            for index in indexes:
+                outcomes[index] = ("error", str(e))
+        # Clips decoded together share the forward pass.
+        for index in indexes:
+            stages[index]["model"] = time.time() - stage_started
+
+    for index, (offset_seconds, length, regions, speech) in timelines.items():
+        if outcomes[index][0] == "ok":
+            stage_started = time.time()
+            _restore_timeline(outcomes[index][1], offset_seconds, length, regions, speech)
+            stages[index]["postprocess"] = time.time() - stage_started
+    for index, (status, payload) in enumerate(outcomes):
+        if status == "ok":
+            payload["stage_seconds"] = stages[index]
+
+    from .model_registry import registry
+
+    return {
+        "outcomes": outcomes,
+        "started_at": started_at,
+        "inference_seconds": time.time() - started_at,
+        # The worker's models, for the model registry API.
+        "registry": dict(registry.memory_report(), pid=os.getpid()),
+    }
+
+
+# --- Django process side ---
+
+
+def _cache_key(audio_bytes, language=None, profile=None):
+    """
+    Cache key of a transcript: audio content, engine, model, language and
+    decode profile.
+    """
+    from .result_cache import content_key
+
+    return content_key(
+        audio_bytes,
+        getattr(settings, "TRANSCRIPTION_BACKEND", "openai-whisper"),
+        settings.WHISPER_MODEL_NAME,
+        language or "auto",
+        profile or getattr(settings, "TRANSCRIPTION_DEFAULT_PROFILE", "fast"),
+    )
+
+
+def _cache_lookup(cache_key):
+    from .result_cache import transcription_cache
+
+    try:
+        return transcription_cache.get(cache_key)
+    except Exception as e:
+        # The cache is an optimisation; never fail an upload because of it.
+        logger.warning(f"Transcription cache lookup failed: {e}")
+        return None
+
+
+def _summarize(samples):
+    if not samples:
+        return {"avg": 0.0, "p95": 0.0, "max": 0.0}
+    ordered = sorted(samples)
+    p95_index = min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))
+    return {
+        "avg": round(sum(ordered) / len(ordered), 3),
+        "p95": round(ordered[p95_index], 3),
+        "max": round(ordered[-1], 3),
+    }
+
+
+class TranscriptionPool:
+    """
+    A fixed set of worker processes, each holding one Whisper model, behind a
+    bounded queue. submit() never blocks: when every slot is taken it raises
+    QueueFullError so the caller can push back on the client.
+
+    Clips are not sent to the workers one by one. A batching thread collects
+    them for up to batch_window seconds (or until max_batch_size are
+    waiting, whichever comes first) and hands each batch to a worker, which
+    decodes the short clips of the batch in a single forward pass.
+    """
+
+    def __init__(self, processes, max_queue, batch_window=0.1, max_batch_size=8):
+        self.processes = processes
+        self.max_queue = max_queue
+        self.batch_window = batch_window
+        self.max_batch_size = max(1, max_batch_size)
+        self._executor = ProcessPoolExecutor(
+            max_workers=processes,
+            mp_context=get_context("spawn"),
+            initializer=_init_worker,
+        )
+        self._slots = threading.BoundedSemaphore(max_queue)
+        self._lock = threading.Lock()
+        self._outstanding = 0
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._coalesced = 0
+        self._batches = 0
+        self._wait_samples = deque(maxlen=500)
+        self._inference_samples = deque(maxlen=500)
+        self._batch_size_samples = deque(maxlen=500)
+        self._batch_wait_samples = deque(maxlen=500)
+        # Latest model registry report of each worker process, by pid.
+        self._worker_registries = {}
+
+        # Clips waiting to be batched: (future, job, enqueued_at), where job is
+        # the (audio_bytes, offset, language, profile) tuple sent to a worker.
+        self._pending = []
+        self._pending_cond = threading.Condition()
+        # Futures of whole uploads being transcribed, by cache key, so a
+        # retried upload joins the original job instead of decoding again.
+        self._in_flight = {}
+        self._closed = False
+        self._batcher = threading.Thread(
+            target=self._batch_loop, name="transcription-batcher", daemon=True
+        )
+        self._batcher.start()
+
+    def submit(
+        self, audio_bytes, offset_seconds=0.0, language=None, profile=None, cache=True
+    ):
+        """
+        Queue one clip and return a Future resolving to the result dict.
+
+        language pins the spoken language (a session language code such as
+        "en" or "en-IN"), skipping detection; profile names a decode profile
+        from transcription_backends (default "fast"). Whole uploads (offset
+        0) are answered from the transcription cache when the same audio was
+        transcribed before, unless cache is False.
+        """
+        language = whisper_language(language)
+        cache_key = None
+        if (
+            cache
+            and offset_seconds == 0
+            and getattr(settings, "TRANSCRIPTION_CACHE_ENABLED", True)
+        ):
+            cache_key = _cache_key(audio_bytes, language, profile)
+            with self._lock:
+                in_flight = self._in_flight.get(cache_key)
+                if in_flight is not None:
+                    self._coalesced += 1
+                    return in_flight
+            cached = _cache_lookup(cache_key)
+            if cached is not None:
+                future = Future()
+                future.set_result(
+                    dict(cached, wait_seconds=0.0, inference_seconds=0.0, cached=True)
+                )
+                return future
+
+        future = self._enqueue(audio_bytes, offset_seconds, language, profile)
+        if cache_key is not None:
+            with self._lock:
+                self._in_flight[cache_key] = future
+            future.add_done_callback(lambda f: self._on_upload_done(cache_key, f))
+        return future
+
+    def _enqueue(self, audio_bytes, offset_seconds, language, profile):
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._rejected += 1
+            raise QueueFullError(
+                f"Transcription queue is full ({self.max_queue} jobs waiting)."
+            )
+
+        with self._lock:
+            self._outstanding += 1
+            self._submitted += 1
+
+        future = Future()
+        with self._pending_cond:
+            self._pending.append(
+                (future, (audio_bytes, offset_seconds, language, profile), time.time())
+            )
+            self._pending_cond.notify()
+        return future
+
+    def transcribe(self, audio_bytes, language=None, profile=None, timeout=None):
+        """Submit a clip and wait for its result (for synchronous callers)."""
+        return self.submit(audio_bytes, language=language, profile=profile).result(
+            timeout=timeout
+        )
+
+    def _on_upload_done(self, cache_key, future):
+        with self._lock:
+            self._in_flight.pop(cache_key, None)
+        if future.cancelled() or future.exception() is not None:
+            return
+        result = {
+            k: v
+            for k, v in future.result().items()
+            if k not in ("wait_seconds", "inference_seconds", "batch_size", "stage_seconds")
+        }
+        from .background import run_in_background
+        from .result_cache import transcription_cache
+
+        run_in_background(transcription_cache.set, cache_key, result)
+
+    def _batch_loop(self):
+        while True:
+            with self._pending_cond:
+                while not self._pending and not self._closed:
+                    self._pending_cond.wait()
+                if self._closed:
+                    return
+                deadline = self._pending[0][2] + self.batch_window
+                while len(self._pending) < self.max_batch_size:
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        break
+                    self._pending_cond.wait(remaining)
+                batch = self._pending[: self.max_batch_size]
+                del self._pending[: self.max_batch_size]
+            self._dispatch(batch)
+
+    def _dispatch(self, batch):
+        live = []
+        for clip in batch:
+            # A caller may have cancelled while its clip was waiting.
+            if clip[0].set_running_or_notify_cancel():
+                live.append(clip)
+            else:
+                self._release_slot(failed=True)
+        if not live:
+            return
+
+        dispatched_at = time.time()
+        with self._lock:
+            self._batches += 1
+            self._batch_size_samples.append(len(live))
+            for clip in live:
+                self._batch_wait_samples.append(dispatched_at - clip[2])
+
+        try:
+            batch_future = self._executor.submit(
+                _transcribe_batch_in_worker,
+                [job for _, job, _ in live],
+            )
+        except Exception as e:
+            self._fail_batch(live, e)
+            return
+        batch_future.add_done_callback(lambda f: self._on_batch_done(live, f))
+
+    def _on_batch_done(self, batch, batch_future):
+        try:
+            batch_result = batch_future.result()
+        except Exception as e:
+            self._fail_batch(batch, e)
+            return
+
+        self._record_worker_registry(batch_result["registry"])
+        for clip, (status, payload) in zip(batch, batch_result["outcomes"]):
+            future, enqueued_at = clip[0], clip[2]
+            if status != "ok":
+                future.set_exception(RuntimeError(payload))
+                self._release_slot(failed=True)
+                continue
+            payload["wait_seconds"] = batch_result["started_at"] - enqueued_at
+            payload["inference_seconds"] = batch_result["inference_seconds"]
+            payload["batch_size"] = len(batch)
+            with self._lock:
+                self._wait_samples.append(payload["wait_seconds"])
+                self._inference_samples.append(payload["inference_seconds"])
+            future.set_result(payload)
+            self._release_slot(failed=False)
+
+    def _record_worker_registry(self, report):
+        with self._lock:
+            self._worker_registries[report["pid"]] = dict(report, reported_at=time.time())
+            # Keep the live workers; replaced ones stop reporting.
+            stale = sorted(
+                self._worker_registries.values(), key=lambda r: r["reported_at"]
+            )[: -self.processes]
+            for entry in stale:
+                del self._worker_registries[entry["pid"]]
+
+    def worker_registries(self):
+        """
+        The model registry of each worker process as of its latest batch;
+        a worker that has not transcribed anything yet is not listed.
+        """
+        with self._lock:
+            return sorted(
+                (dict(report) for report in self._worker_registries.values()),
+                key=lambda r: r["pid"],
+            )
+
+    def _fail_batch(self, batch, error):
+        logger.error(f"Transcription batch of {len(batch)} clips failed: {error}")
+        for clip in batch:
+            clip[0].set_exception(error)
+            self._release_slot(failed=True)
+
+    def _release_slot(self, failed):
+        with self._lock:
+            self._outstanding -= 1
+            if failed:
+                self._failed += 1
+            else:
+                self._completed += 1
+        self._slots.release()
+
+    def metrics(self):
+        with self._lock:
+            return {
+                "processes": self.processes,
+                "max_queue": self.max_queue,
+                "batch_window_ms": int(self.batch_window * 1000),
+                "max_batch_size": self.max_batch_size,
+                "queue_depth": self._outstanding,
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "failed": self._failed,
+                "rejected": self._rejected,
+                "coalesced": self._coalesced,
+                "batches": self._batches,
+                "batch_size": _summarize(self._batch_size_samples),
+                "batch_wait_seconds": _summarize(self._batch_wait_samples),
+                "wait_seconds": _summarize(self._wait_samples),
+                "inference_seconds": _summarize(self._inference_samples),
+            }
+
+    def shutdown(self):
+        with self._pending_cond:
+            self._closed = True
+            self._pending_cond.notify_all()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def running_transcription_pool():
+    """The pool of this process if it has been started, else None."""
+    return _pool
+
+
+def get_transcription_pool():
+    """
+    Get or create the transcription pool for this Django process (singleton).
+
+    Every web worker (e.g. each gunicorn process) starts its own pool, so
+    the Whisper models in memory are web workers x
+    TRANSCRIPTION_WORKER_PROCESSES; the default is one process per pool.
+    """
+    global _pool
+
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:  # Double-check locking
+                processes = getattr(
+                    settings, "TRANSCRIPTION_WORKER_PROCESSES", 1
+                )
+                max_queue = getattr(settings, "TRANSCRIPTION_QUEUE_SIZE", 16)
+                batch_window_ms = getattr(settings, "TRANSCRIPTION_BATCH_WINDOW_MS", 100)
+                max_batch_size = getattr(settings, "TRANSCRIPTION_MAX_BATCH_SIZE", 8)
+                _pool = TranscriptionPool(
+                    processes=processes,
+                    max_queue=max_queue,
+                    batch_window=batch_window_ms / 1000,
+                    max_batch_size=max_batch_size,
+                )
+                logger.info(
+                    f"Started transcription pool: {processes} processes, queue size {max_queue}, "
+                    f"batches of up to {max_batch_size} within {batch_window_ms} ms"
+                )
+    return _pool
@@ -0,0 +1,332 @@
+# interview_app/tts_cache.py
+"""
+Question audio shared across sessions.
+
+Speech is stored once per (engine, voice, text) under MEDIA_ROOT/tts/cache/,
+named by a hash of the three, so the standard ice-breaker or a repeated
+question is synthesized once and then served to every session that asks
+it. Audio from a fallback engine is only served while the engines before
+it are down (see TTSEngines.servable_voices). Each TTSAudio row counts the questions whose audio_url points at its
+file; deleting a question releases its reference (see signals.py). Files
+that no question references are evicted least recently used first once
+the cache is larger than TTS_CACHE_MAX_MB.
+
+The questions of a session are synthesized concurrently (audio_urls), so
+preparing them costs about one engine round trip rather than one per
+question. Questions not synthesized in advance are streamed to the player
+on first request (stream_audio) and stored for later ones.
+"""
+import logging
+import math
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from django.conf import settings
+from django.db import IntegrityError, connections
+from django.db.models import Count, F, Q, Sum
+from django.utils import timezone
+
+from .models import TTSAudio
+from .result_cache import content_key
+from .tts_engines import get_tts_engines
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = "tts/cache"
+
+
+def _normalize(text):
+    """Whitespace does not change the speech, so it does not change the key."""
+    return " ".join((text or "").split())
+
+
+class TTSCache:
+    """
+    Content-addressed MP3 files with reference counts in the TTSAudio table,
+    shared by every Django process. Hit and miss counters are kept per
+    process.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._timeouts = 0
+
+    def _path(self, key):
+        return os.path.join(settings.MEDIA_ROOT, CACHE_DIR, f"{key}.mp3")
+
+    def _url(self, key):
+        return f"{settings.MEDIA_URL}{CACHE_DIR}/{key}.mp3"
+
+    def _key_from_url(self, audio_url):
+        prefix = f"{settings.MEDIA_URL}{CACHE_DIR}/"
+        if not audio_url or not audio_url.startswith(prefix):
+            return None
+        return os.path.splitext(audio_url[len(prefix):])[0]
+
+    def _tmp_path(self):
+        cache_dir = os.path.join(settings.MEDIA_ROOT, CACHE_DIR)
+        os.makedirs(cache_dir, exist_ok=True)
+        # Written under a temporary name, so a file is only ever seen complete.
+        return os.path.join(cache_dir, f".{uuid.uuid4().hex}.tmp")
+
+    def stored_path(self, audio_url):
+        """Path of the cached file behind audio_url, or None if there is none."""
+        key = self._key_from_url(audio_url)
+        if key and os.path.exists(self._path(key)):
+            return self._path(key)
+        return None
+
+    def _lookup(self, text, engines, language_code, accent_tld):
+        """URL of stored audio of text by a servable voice, adding a reference."""
+        for engine, voice in engines.servable_voices(language_code, accent_tld):
+            key = content_key(engine, voice, text)
+            if self._reference(key):
+                with self._lock:
+                    self._hits += 1
+                return self._url(key)
+        with self._lock:
+            self._misses += 1
+        return None
+
+    def _store(self, key, engine, tmp_path):
+        """Move the finished audio at tmp_path into the cache with one reference."""
+        size = os.path.getsize(tmp_path)
+        os.replace(tmp_path, self._path(key))
+        try:
+            _, created = TTSAudio.objects.get_or_create(
+                key=key,
+                defaults={
+                    "engine": engine,
+                    "file_path": f"{CACHE_DIR}/{key}.mp3",
+                    "size_bytes": size,
+                    "ref_count": 1,
+                },
+            )
+        except IntegrityError:
+            # Another process stored the same audio first.
+            created = False
+        if not created:
+            TTSAudio.objects.filter(key=key).update(
+                ref_count=F("ref_count") + 1, last_accessed=timezone.now()
+            )
+        self._evict()
+        return self._url(key)
+
+    def audio_url(self, text, language_code, accent_tld):
+        """
+        Media URL of text spoken in the given language and accent, adding a
+        reference to the file; synthesizes it only if no stored engine
+        output exists. Returns None when synthesis fails.
+        """
+        engines = get_tts_engines()
+        text = _normalize(text)
+        voices = engines.voices(language_code, accent_tld)
+        url = self._lookup(text, engines, language_code, accent_tld)
+        if url:
+            return url
+
+        tmp_path = self._tmp_path()
+        try:
+            engine = engines.synthesize(text, language_code, accent_tld, tmp_path)
+            if engine is None or not os.path.exists(tmp_path):
+                return None
+            if not os.path.getsize(tmp_path):
+                return None
+            return self._store(content_key(engine, dict(voices)[engine], text), engine, tmp_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def stream_audio(self, text, language_code, accent_tld, on_stored):
+        """
+        Like audio_url(), for serving audio while it is synthesized. Returns
+        (url, None) when the audio is stored already; otherwise (None,
+        chunks), where chunks yields the MP3 bytes as the engine produces
+        them and, once the audio is complete, stores it and calls
+        on_stored(url). Returns (None, None) when no engine could start.
+        """
+        engines = get_tts_engines()
+        text = _normalize(text)
+        voices = engines.voices(language_code, accent_tld)
+        url = self._lookup(text, engines, language_code, accent_tld)
+        if url:
+            return url, None
+        engine, chunks = engines.stream(text, language_code, accent_tld)
+        if engine is None:
+            return None, None
+        key = content_key(engine, dict(voices)[engine], text)
+        return None, self._tee(chunks, key, engine, on_stored)
+
+    def _tee(self, chunks, key, engine, on_stored):
+        tmp_path = self._tmp_path()
+        try:
+            with open(tmp_path, "wb") as out:
+                for chunk in chunks:
+                    out.write(chunk)
+                    yield chunk
+            if os.path.getsize(tmp_path):
+                on_stored(self._store(key, engine, tmp_path))
+        except Exception as e:
+            # The client gets truncated audio; nothing is stored.
+            logger.error(f"Streaming speech synthesis failed: {e}")
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def audio_urls(self, texts, language_code, accent_tld):
+        """
+        audio_url() of each of texts, synthesized concurrently by at most
+        TTS_SYNTHESIS_CONCURRENCY threads. An item that fails, or is still
+        running TTS_SYNTHESIS_TIMEOUT_SECONDS after it started, gets None;
+        the portal shows such a question as text only.
+        """
+        texts = list(texts)
+        if not texts:
+            return []
+        concurrency = max(
+            1, min(len(texts), getattr(settings, "TTS_SYNTHESIS_CONCURRENCY", 4))
+        )
+        timeout = getattr(settings, "TTS_SYNTHESIS_TIMEOUT_SECONDS", 15)
+        started = {}
+
+        def synthesize(index, text):
+            started[index] = time.monotonic()
+            try:
+                return self.audio_url(text, language_code, accent_tld)
+            finally:
+                connections.close_all()
+
+        begin = time.monotonic()
+        # Items queue for a free thread, so the batch gets one timeout per
+        # round of `concurrency` items in case every thread is stuck.
+        batch_deadline = begin + timeout * math.ceil(len(texts) / concurrency)
+        executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="tts")
+        futures = {
+            executor.submit(synthesize, index, text): index
+            for index, text in enumerate(texts)
+        }
+        urls = [None] * len(texts)
+        pending = set(futures)
+        try:
+            while pending:
+                done, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                for future in done:
+                    try:
+                        urls[futures[future]] = future.result()
+                    except Exception as e:
+                        logger.error(f"Speech synthesis of item {futures[future]} failed: {e}")
+                now = time.monotonic()
+                expired = {
+                    future
+                    for future in pending
+                    if now >= batch_deadline
+                    or now - started.get(futures[future], now) > timeout
+                }
+                for future in expired:
+                    logger.warning(f"Speech synthesis of item {futures[future]} timed out")
+                    if not future.cancel():
+                        future.add_done_callback(self._release_late)
+                with self._lock:
+                    self._timeouts += len(expired)
+                pending -= expired
+        finally:
+            executor.shutdown(wait=False)
+        logger.info(
+            f"Synthesized {sum(1 for url in urls if url)}/{len(texts)} audio files "
+            f"in {time.monotonic() - begin:.1f}s"
+        )
+        return urls
+
+    def _release_late(self, future):
+        """Audio that finished after its timeout is not used; drop its reference."""
+        if not future.cancelled() and future.exception() is None:
+            self.release(future.result())
+
+    def _reference(self, key):
+        """Add a reference to the stored file for key; False if there is none."""
+        entry = TTSAudio.objects.filter(key=key).only("pk").first()
+        if entry is None:
+            return False
+        if not os.path.exists(self._path(key)):
+            logger.warning(f"TTS cache file for {key[:12]} is missing; synthesizing again")
+            TTSAudio.objects.filter(pk=entry.pk).delete()
+            return False
+        # Zero rows means the entry was evicted since it was read.
+        return bool(
+            TTSAudio.objects.filter(pk=entry.pk).update(
+                ref_count=F("ref_count") + 1,
+                hit_count=F("hit_count") + 1,
+                last_accessed=timezone.now(),
+            )
+        )
+
+    def release(self, audio_url):
+        """Drop one reference to the file behind audio_url, if it is cached."""
+        key = self._key_from_url(audio_url)
+        if key:
+            TTSAudio.objects.filter(key=key, ref_count__gt=0).update(
+                ref_count=F("ref_count") - 1
+            )
+
+    def _evict(self):
+        total = TTSAudio.objects.aggregate(total=Sum("size_bytes"))["total"] or 0
+        if total <= self.max_bytes:
+            return
+        evicted = freed = 0
+        unreferenced = TTSAudio.objects.filter(ref_count=0).order_by("last_accessed")
+        for entry in unreferenced.only("pk", "key", "size_bytes").iterator():
+            if total - freed <= self.max_bytes:
+                break
+            # Skip entries referenced again since they were read.
+            deleted, _ = TTSAudio.objects.filter(pk=entry.pk, ref_count=0).delete()
+            if not deleted:
+                continue
+            try:
+                os.remove(self._path(entry.key))
+            except FileNotFoundError:
+                pass
+            evicted += 1
+            freed += entry.size_bytes
+        if evicted:
+            logger.info(f"Evicted {evicted} files ({freed} bytes) from the TTS cache")
+        if total - freed > self.max_bytes:
+            logger.warning(
+                f"TTS cache holds {total - freed} bytes, over its {self.max_bytes} byte "
+                "budget, in files that questions still reference"
+            )
+
+    def stats(self):
+        with self._lock:
+            hits, misses, timeouts = self._hits, self._misses, self._timeouts
+        lookups = hits + misses
+        totals = TTSAudio.objects.aggregate(
+            entries=Count("id"),
+            bytes=Sum("size_bytes"),
+            references=Sum("ref_count"),
+            unreferenced=Count("id", filter=Q(ref_count=0)),
+        )
+        return {
+            "entries": totals["entries"],
+            "bytes": totals["bytes"] or 0,
+            "max_bytes": self.max_bytes,
+            "references": totals["references"] or 0,
+            "unreferenced": totals["unreferenced"],
+            "engines": dict(
+                TTSAudio.objects.values_list("engine").annotate(Count("id"))
+            ),
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+            "timeouts": timeouts,
+        }
+
+
+tts_cache = TTSCache(
+    max_bytes=getattr(settings, "TTS_CACHE_MAX_MB", 1024) * 1024 * 1024,
+)
@@ -0,0 +1,273 @@
+# interview_app/tts_engines.py
+"""
+Text-to-speech engines, tried in the order given by settings.TTS_ENGINE_ORDER.
+
+"google_cloud" is Google Cloud Text-to-Speech, through one long-lived client
+shared by all threads. "gtts" is the Google Translate voice. "espeak" runs
+espeak-ng locally (encoded to MP3 by ffmpeg), a fast fallback that needs no
+network. "silent" writes silence as long as the text would take to speak,
+a stand-in for load tests and CI. Each engine has a circuit breaker: an
+engine that keeps failing is skipped until its reset time has passed, so a
+down service does not add its timeout to every question.
+"""
+import logging
+import math
+import shutil
+import subprocess
+import threading
+
+from django.conf import settings
+
+from .llm_gateway import CircuitBreaker
+
+logger = logging.getLogger(__name__)
+
+
+class TTSEngineError(Exception):
+    """An engine returned no audio."""
+
+
+class GoogleCloudEngine:
+    name = "google_cloud"
+    # Always this voice, whatever the session language.
+    VOICE = ("en-IN", "en-IN-Wavenet-F")
+
+    def __init__(self, timeout):
+        from google.cloud import texttospeech
+
+        self._texttospeech = texttospeech
+        self.timeout = timeout
+        self._client = None
+        self._lock = threading.Lock()
+
+    def _get_client(self):
+        # One gRPC client is thread-safe and keeps its connections open.
+        if self._client is None:
+            with self._lock:
+                if self._client is None:  # Double-check locking
+                    self._client = self._texttospeech.TextToSpeechClient()
+        return self._client
+
+    def voice(self, lang_code, accent_tld):
+        return "/".join(self.VOICE)
+
+    def stream(self, text, lang_code, accent_tld):
+        tts = self._texttospeech
+        response = self._get_client().synthesize_speech(
+            input=tts.SynthesisInput(text=text),
+            voice=tts.VoiceSelectionParams(language_code=self.VOICE[0], name=self.VOICE[1]),
+            audio_config=tts.AudioConfig(audio_encoding=tts.AudioEncoding.MP3),
+            timeout=self.timeout,
+        )
+        # The whole audio arrives at once.
+        yield response.audio_content
+
+
+class GTTSEngine:
+    name = "gtts"
+
+    def __init__(self, timeout):
+        from gtts import gTTS
+
+        self._gtts = gTTS
+        self.timeout = timeout
+
+    def voice(self, lang_code, accent_tld):
+        return f"{lang_code}-{accent_tld}"
+
+    def stream(self, text, lang_code, accent_tld):
+        # gTTS opens its own HTTP session per request and yields one part of
+        # the text at a time.
+        return self._gtts(
+            text=text, lang=lang_code, tld=accent_tld, timeout=self.timeout
+        ).stream()
+
+
+class EspeakEngine:
+    name = "espeak"
+    ACCENT_VOICES = {"com": "en-us", "co.uk": "en-gb"}
+
+    def __init__(self, timeout):
+        self.binary = shutil.which("espeak-ng") or shutil.which("espeak")
+        self.ffmpeg = shutil.which("ffmpeg")
+        if not self.binary or not self.ffmpeg:
+            raise ImportError("espeak-ng and ffmpeg must be installed")
+        self.timeout = timeout
+
+    def voice(self, lang_code, accent_tld):
+        if lang_code == "en":
+            return self.ACCENT_VOICES.get(accent_tld, "en")
+        return lang_code
+
+    def stream(self, text, lang_code, accent_tld):
+        wav = subprocess.run(
+            [self.binary, "-v", self.voice(lang_code, accent_tld), "--stdout"],
+            input=text.encode("utf-8"),
+            capture_output=True,
+            check=True,
+            timeout=self.timeout,
+        ).stdout
+        yield subprocess.run(
+            [self.ffmpeg, "-loglevel", "error", "-f", "wav", "-i", "pipe:0", "-f", "mp3", "pipe:1"],
+            input=wav,
+            capture_output=True,
+            check=True,
+            timeout=self.timeout,
+        ).stdout
+
+
+class SilentEngine:
+    """MPEG-1 Layer III frames of silence, 128 kbit/s mono at 44.1 kHz."""
+
+    name = "silent"
+    FRAME = b"\xff\xfb\x90\xc0" + bytes(413)
+    FRAME_SECONDS = 1152 / 44100
+    WORDS_PER_SECOND = 2.5
+
+    def __init__(self, timeout):
+        pass
+
+    def voice(self, lang_code, accent_tld):
+        return "silence"
+
+    def stream(self, text, lang_code, accent_tld):
+        seconds = max(1, len(text.split())) / self.WORDS_PER_SECOND
+        yield self.FRAME * math.ceil(seconds / self.FRAME_SECONDS)
+
+
+ENGINES = {
+    engine.name: engine
+    for engine in (GoogleCloudEngine, GTTSEngine, EspeakEngine, SilentEngine)
+}
+
+
+class TTSEngines:
+    """The configured engines in order, each behind its own circuit breaker."""
+
+    def __init__(self, engines, failure_threshold, reset_seconds):
+        self.engines = engines
+        self._breakers = {
+            engine.name: CircuitBreaker(
+                failure_threshold, reset_seconds, name=f"{engine.name} TTS"
+            )
+            for engine in engines
+        }
+        self._lock = threading.Lock()
+        self._stats = {
+            engine.name: {"successes": 0, "failures": 0, "skipped": 0}
+            for engine in engines
+        }
+
+    def _record(self, name, outcome):
+        with self._lock:
+            self._stats[name][outcome] += 1
+
+    def voices(self, lang_code, accent_tld):
+        """(engine, voice) pairs in the order they are tried."""
+        return [(engine.name, engine.voice(lang_code, accent_tld)) for engine in self.engines]
+
+    def servable_voices(self, lang_code, accent_tld):
+        """
+        The (engine, voice) pairs whose stored audio may be served: the first
+        engine's, and a fallback's only while every engine before it has its
+        circuit open. Audio a fallback made during an outage is thus
+        synthesized again by the better engine once that recovers.
+        """
+        voices = []
+        for engine in self.engines:
+            voices.append((engine.name, engine.voice(lang_code, accent_tld)))
+            if self._breakers[engine.name].state != "open":
+                break
+        return voices
+
+    def stream(self, text, lang_code, accent_tld):
+        """
+        (engine, chunks) from the first healthy engine that starts producing
+        audio, where chunks yields its MP3 bytes; (None, None) if none did.
+        """
+        for engine in self.engines:
+            breaker = self._breakers[engine.name]
+            if not breaker.allow():
+                self._record(engine.name, "skipped")
+                continue
+            try:
+                chunks = engine.stream(text, lang_code, accent_tld)
+                first = next(chunks, b"")
+                if not first:
+                    raise TTSEngineError("no audio returned")
+            except Exception as e:
+                logger.warning(f"{engine.name} TTS failed: {e}")
+                breaker.record_failure()
+                self._record(engine.name, "failures")
+                continue
+            breaker.record_success()
+            self._record(engine.name, "successes")
+            return engine.name, self._watch(engine.name, first, chunks)
+        logger.error("No TTS engine could synthesize the text")
+        return None, None
+
+    def _watch(self, name, first, chunks):
+        """Yield the audio, counting a failure against the engine if it breaks off."""
+        yield first
+        try:
+            yield from chunks
+        except Exception:
+            self._breakers[name].record_failure()
+            self._record(name, "failures")
+            raise
+
+    def synthesize(self, text, lang_code, accent_tld, output_path):
+        """
+        Write the spoken text to output_path as MP3. Returns the engine that
+        produced it, or None if every engine failed or was skipped.
+        """
+        name, chunks = self.stream(text, lang_code, accent_tld)
+        if name is None:
+            return None
+        try:
+            with open(output_path, "wb") as out:
+                for chunk in chunks:
+                    out.write(chunk)
+        except Exception as e:
+            logger.error(f"{name} TTS failed mid-stream: {e}")
+            return None
+        return name
+
+    def metrics(self):
+        with self._lock:
+            stats = {name: dict(counts) for name, counts in self._stats.items()}
+        for name, counts in stats.items():
+            counts["circuit"] = self._breakers[name].state
+        return {"order": [engine.name for engine in self.engines], "engines": stats}
+
+
+_engines = None
+_engines_lock = threading.Lock()
+
+
+def get_tts_engines():
+    global _engines
+
+    if _engines is None:
+        with _engines_lock:
+            if _engines is None:  # Double-check locking
+                timeout = getattr(settings, "TTS_ENGINE_TIMEOUT_SECONDS", 10)
+                engines = []
+                order = getattr(
+                    settings, "TTS_ENGINE_ORDER", ["google_cloud", "gtts", "espeak"]
+                )
+                for name in order:
+                    if name not in ENGINES:
+                        raise ValueError(
+                            f"Unknown TTS engine {name!r}; use one of {', '.join(ENGINES)}"
+                        )
+                    try:
+                        engines.append(ENGINES[name](timeout))
+                    except ImportError as e:
+                        logger.warning(f"TTS engine {name} is not available: {e}")
+                _engines = TTSEngines(
+                    engines,
+                    failure_threshold=getattr(settings, "TTS_ENGINE_FAILURE_THRESHOLD", 3),
+                    reset_seconds=getattr(settings, "TTS_ENGINE_RESET_SECONDS", 60),
+                )
+    return _engines
@@ -19,6 +19,31 @@ urlpatterns = [
     path("status/", views.get_proctoring_status, name="get_proctoring_status"),
     path("report_tab_switch/", views.report_tab_switch, name="report_tab_switch"),
     path("transcribe/", views.transcribe_audio, name="transcribe_audio"),
+    path(
+        "transcribe/chunk/",
+        views.transcribe_audio_chunk,
+        name="transcribe_audio_chunk",
+    ),
+    path(
+        "transcribe/<uuid:job_id>/",
+        views.transcription_status,
+        name="transcription_status",
+    ),
+    path(
+        "questions/status/",
+        views.question_preparation_status,
+        name="question_preparation_status",
+    ),
+    path(
+        "follow_up/<int:question_id>/",
+        views.follow_up_status,
+        name="follow_up_status",
+    ),
+    path(
+        "question_audio/<int:question_id>/",
+        views.question_audio,
+        name="question_audio",
+    ),
     path("check_camera/", views.check_camera, name="check_camera"),
     path("end_session/", views.end_interview_session, name="end_interview_session"),
     path("release_camera/", views.release_camera, name="release_camera"),
@@ -68,5 +93,30 @@ urlpatterns = [
         api_views.dashboard_stats_api,
         name="dashboard_stats_api",
     ),
+    path(
+        "api/transcription-metrics/",
+        api_views.transcription_metrics_api,
+        name="transcription_metrics_api",
+    ),
+    path(
+        "api/llm-metrics/",
+        api_views.llm_metrics_api,
+        name="llm_metrics_api",
+    ),
+    path(
+        "api/tts-metrics/",
+        api_views.tts_metrics_api,
+        name="tts_metrics_api",
+    ),
+    path(
+        "api/media-usage/",
+        api_views.media_usage_api,
+        name="media_usage_api",
+    ),
+    path(
+        "api/model-registry/",
+        api_views.model_registry_api,
+        name="model_registry_api",
+    ),
     path("api/test/", api_views.test_api, name="test_api"),
 ]
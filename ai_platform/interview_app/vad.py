@@ -0,0 +1,95 @@
+# interview_app/vad.py
+import numpy as np
+
+from django.conf import settings
+
+FRAME_SECONDS = 0.03
+
+
+def detect_speech(audio, sample_rate=16000):
+    """
+    Energy-based voice activity detection over 30 ms frames. A frame counts
+    as speech when its RMS level is above an absolute floor and clearly above
+    the noise floor of the clip (its 10th percentile level). Returns the
+    speech regions as (start_sample, end_sample) pairs.
+    """
+    frame_length = int(FRAME_SECONDS * sample_rate)
+    frame_count = len(audio) // frame_length
+    if frame_count == 0:
+        return []
+
+    frames = audio[: frame_count * frame_length].reshape(frame_count, frame_length)
+    rms = np.sqrt(np.mean(frames.astype(np.float64) ** 2, axis=1))
+    noise_floor = np.percentile(rms, 10)
+    threshold = max(
+        getattr(settings, "VAD_ENERGY_THRESHOLD", 0.01),
+        noise_floor * getattr(settings, "VAD_NOISE_RATIO", 3.0),
+    )
+    is_speech = rms > threshold
+
+    # Bridge short gaps between words so a region covers a whole phrase.
+    hangover = int(getattr(settings, "VAD_HANGOVER_SECONDS", 0.3) / FRAME_SECONDS)
+    regions = []
+    start = None
+    silent_run = 0
+    for index, speech in enumerate(is_speech):
+        if speech:
+            if start is None:
+                start = index
+            silent_run = 0
+        elif start is not None:
+            silent_run += 1
+            if silent_run > hangover:
+                regions.append((start, index - silent_run + 1))
+                start, silent_run = None, 0
+    if start is not None:
+        regions.append((start, frame_count - silent_run))
+
+    return [(s * frame_length, e * frame_length) for s, e in regions]
+
+
+def trim_silence(audio, sample_rate=16000):
+    """
+    Drop leading and trailing silence and shorten internal pauses to a small
+    padding, so the recogniser only sees speech.
+
+    Returns (trimmed_audio, regions, speech). speech is the detect_speech()
+    output; regions lists the kept spans as (start_sample_in_original,
+    end_sample_in_original, start_sample_in_trimmed), which
+    to_original_time() uses to map timestamps on the trimmed audio back onto
+    the recording. When no speech is detected, e.g. on a quiet microphone,
+    the audio is returned untrimmed with regions and speech None, so the
+    recogniser still hears it.
+    """
+    speech = detect_speech(audio, sample_rate)
+    if not speech:
+        return audio, None, None
+
+    padding = int(getattr(settings, "VAD_PADDING_SECONDS", 0.2) * sample_rate)
+
+    # Pad every region, merging those whose padding overlaps.
+    kept = []
+    for start, end in speech:
+        start, end = max(0, start - padding), min(len(audio), end + padding)
+        if kept and start <= kept[-1][1]:
+            kept[-1] = (kept[-1][0], end)
+        else:
+            kept.append((start, end))
+
+    pieces, regions, position = [], [], 0
+    for start, end in kept:
+        pieces.append(audio[start:end])
+        regions.append((start, end, position))
+        position += end - start
+    return np.concatenate(pieces), regions, speech
+
+
+def to_original_time(seconds, regions, sample_rate=16000):
+    """Map a time on the trimmed audio back onto the original recording."""
+    sample = seconds * sample_rate
+    for start, end, trimmed_start in regions:
+        if sample <= trimmed_start + (end - start):
+            return (start + max(0.0, sample - trimmed_start)) / sample_rate
+    if regions:
+        return regions[-1][1] / sample_rate
+    return 0.0
@@ -1,29 +1,19 @@
-import whisper
-import threading
+from django.conf import settings
 
-# Global Whisper model instance
-_whisper_model = None
-_whisper_lock = threading.Lock()
+from .model_registry import registry
+from .transcription_backends import get_backend
 
 
 def get_whisper_model():
     """
-    Get or create the Whisper model instance (singleton pattern).
-    This prevents loading the model multiple times.
+    Get the Whisper model configured by settings.WHISPER_MODEL_NAME from the
+    shared model registry (loaded on first use).
     """
-    global _whisper_model
-
-    if _whisper_model is None:
-        with _whisper_lock:
-            if _whisper_model is None:  # Double-check locking
-                try:
-                    _whisper_model = whisper.load_model("small")
-                    print("Whisper model 'small' loaded (singleton).")
-                except Exception as e:
-                    print(f"Error loading Whisper model: {e}")
-                    _whisper_model = None
-
-    return _whisper_model
+    try:
+        return registry.get("whisper")
+    except Exception as e:
+        print(f"Error loading Whisper model: {e}")
+        return None
 
 
 def is_whisper_available():
@@ -31,3 +21,12 @@ def is_whisper_available():
     Check if Whisper model is available.
     """
     return get_whisper_model() is not None
+
+
+def get_transcription_backend():
+    """
+    Get the speech-to-text backend selected by settings.TRANSCRIPTION_BACKEND
+    ("openai-whisper", "whisper-int8" or "faster-whisper"). Its model is
+    loaded through the shared registry on first use.
+    """
+    return get_backend(getattr(settings, "TRANSCRIPTION_BACKEND", "openai-whisper"))
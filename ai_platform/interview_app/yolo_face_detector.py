@@ -1,11 +1,16 @@
 # interview_app/yolo_face_detector.py
-from ultralytics import YOLO
+import importlib.util
 
-# Load the YOLOv8 model specialized for face detection.
-# You can also use the generic 'yolov8n.pt' if a specialized one isn't available,
-# but a face-specific model is generally better.
-# Let's use the generic one for simplicity as it's already part of the project.
-model = YOLO("yolov8n.pt")
+import cv2
+
+from .model_registry import get_model
+
+# Fail at import time, as before, so callers can fall back to a placeholder.
+if importlib.util.find_spec("ultralytics") is None:
+    raise ImportError("ultralytics is not installed.")
+
+# The YOLOv8 model (settings.YOLO_MODEL_PATH, the generic 'yolov8n.pt' by
+# default) is loaded lazily through the shared model registry.
 
 
 def detect_face_with_yolo(image_input):
@@ -20,5 +25,5 @@ def detect_face_with_yolo(image_input):
     if img is None:
         raise ValueError("Image not found or invalid format.")
 
-    results = model(img)
+    results = get_model("yolo")(img)
     return results
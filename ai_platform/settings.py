@@ -1,6 +1,6 @@
 import os
 from pathlib import Path
-from decouple import config
+from decouple import Csv, config
 import dj_database_url
 
 # Base directory
@@ -185,8 +185,202 @@ AI_MODEL_API_KEY = config("AI_MODEL_API_KEY", default=None)
 # Gemini API Configuration
 GEMINI_API_KEY = config("GEMINI_API_KEY", default=None)
 
+# LLM Gateway Configuration (every LLM call goes through llm_gateway)
+# LLM_BACKEND is "gemini", or "offline" for the deterministic local stand-in
+# used in load tests and CI (no network access needed).
+LLM_BACKEND = config("LLM_BACKEND", default="gemini")
+LLM_MAX_CONCURRENCY = config("LLM_MAX_CONCURRENCY", default=8, cast=int)
+# Optional per-call-type limits, e.g. {"question_set": 4, "id_ocr": 2}
+LLM_CALL_TYPE_CONCURRENCY = {}
+LLM_TIMEOUT_SECONDS = config("LLM_TIMEOUT_SECONDS", default=30, cast=float)
+LLM_QUEUE_TIMEOUT_SECONDS = config("LLM_QUEUE_TIMEOUT_SECONDS", default=10, cast=float)
+LLM_MAX_RETRIES = config("LLM_MAX_RETRIES", default=3, cast=int)
+LLM_CIRCUIT_FAILURE_THRESHOLD = config(
+    "LLM_CIRCUIT_FAILURE_THRESHOLD", default=5, cast=int
+)
+LLM_CIRCUIT_RESET_SECONDS = config("LLM_CIRCUIT_RESET_SECONDS", default=30, cast=int)
+# Offline stand-in: artificial latency per call, fraction of calls failing
+# with a retryable error, and the name it "reads" from ID cards.
+LLM_OFFLINE_LATENCY_SECONDS = config(
+    "LLM_OFFLINE_LATENCY_SECONDS", default=0.0, cast=float
+)
+LLM_OFFLINE_LATENCY_JITTER_SECONDS = config(
+    "LLM_OFFLINE_LATENCY_JITTER_SECONDS", default=0.0, cast=float
+)
+LLM_OFFLINE_ERROR_RATE = config("LLM_OFFLINE_ERROR_RATE", default=0.0, cast=float)
+LLM_OFFLINE_ID_NAME = config("LLM_OFFLINE_ID_NAME", default="Test Candidate")
+
 # Whisper Model Configuration
 WHISPER_MODEL_NAME = config("WHISPER_MODEL_NAME", default="small")
+# Speech-to-text engine: "openai-whisper" (fp32 PyTorch), "whisper-int8"
+# (PyTorch dynamic quantization) or "faster-whisper" (CTranslate2 int8).
+TRANSCRIPTION_BACKEND = config("TRANSCRIPTION_BACKEND", default="openai-whisper")
+# Decode profiles: "fast" for live answers (greedy, no fallback), "accurate"
+# for offline re-transcription (beam search with temperature fallback).
+TRANSCRIPTION_DEFAULT_PROFILE = config("TRANSCRIPTION_DEFAULT_PROFILE", default="fast")
+TRANSCRIPTION_DECODE_PROFILES = {
+    "fast": {
+        "beam_size": config("TRANSCRIPTION_FAST_BEAM_SIZE", default=1, cast=int),
+        "temperature": [0.0],
+        "condition_on_previous_text": False,
+    },
+    "accurate": {
+        "beam_size": config("TRANSCRIPTION_ACCURATE_BEAM_SIZE", default=5, cast=int),
+        "temperature": [0.0, 0.2, 0.4, 0.6, 0.8, 1.0],
+        "condition_on_previous_text": True,
+    },
+}
+
+# Model Registry Configuration
+# Models are loaded lazily per process; when the loaded total exceeds the
+# budget the least recently used model is unloaded (0 disables eviction).
+YOLO_MODEL_PATH = config("YOLO_MODEL_PATH", default="yolov8n.pt")
+MODEL_MEMORY_BUDGET_MB = config("MODEL_MEMORY_BUDGET_MB", default=0, cast=int)
+
+# Transcription Worker Pool Configuration
+# Each worker process holds its own Whisper model; the queue bounds how many
+# answers may wait before uploads are rejected with HTTP 503. The pool is
+# started per web worker (gunicorn process), so the models loaded are web
+# workers x TRANSCRIPTION_WORKER_PROCESSES; raise it only with few web workers.
+TRANSCRIPTION_WORKER_PROCESSES = config(
+    "TRANSCRIPTION_WORKER_PROCESSES", default=1, cast=int
+)
+TRANSCRIPTION_QUEUE_SIZE = config("TRANSCRIPTION_QUEUE_SIZE", default=16, cast=int)
+# Clips arriving within the batch window are decoded together in one pass.
+TRANSCRIPTION_BATCH_WINDOW_MS = config(
+    "TRANSCRIPTION_BATCH_WINDOW_MS", default=100, cast=int
+)
+TRANSCRIPTION_MAX_BATCH_SIZE = config("TRANSCRIPTION_MAX_BATCH_SIZE", default=8, cast=int)
+# Jobs still queued this long after reaching the pool (e.g. lost in a
+# restart) are failed when polled, so the client uploads the answer again.
+TRANSCRIPTION_JOB_TIMEOUT_SECONDS = config(
+    "TRANSCRIPTION_JOB_TIMEOUT_SECONDS", default=120, cast=int
+)
+# Transcripts are cached by audio content, engine, model and language, so
+# retried uploads are answered without decoding again.
+TRANSCRIPTION_CACHE_ENABLED = config(
+    "TRANSCRIPTION_CACHE_ENABLED", default=True, cast=bool
+)
+TRANSCRIPTION_CACHE_MAX_ENTRIES = config(
+    "TRANSCRIPTION_CACHE_MAX_ENTRIES", default=5000, cast=int
+)
+# Voice activity detection trims silence before transcription and measures
+# speaking time for the pace (WPM) metrics.
+VAD_ENABLED = config("VAD_ENABLED", default=True, cast=bool)
+VAD_ENERGY_THRESHOLD = config("VAD_ENERGY_THRESHOLD", default=0.01, cast=float)
+# Answers are uploaded in chunks of this length while the candidate speaks;
+# streams with no new chunk for the idle limit are discarded.
+TRANSCRIPTION_CHUNK_MS = config("TRANSCRIPTION_CHUNK_MS", default=3000, cast=int)
+TRANSCRIPTION_STREAM_IDLE_SECONDS = config(
+    "TRANSCRIPTION_STREAM_IDLE_SECONDS", default=300, cast=int
+)
+# Follow-up questions are generated after the transcript is returned; one
+# not ready this many seconds after the answer is skipped.
+FOLLOW_UP_DEADLINE_SECONDS = config("FOLLOW_UP_DEADLINE_SECONDS", default=10, cast=int)
+
+# Background Task Configuration
+BACKGROUND_TASK_WORKERS = config("BACKGROUND_TASK_WORKERS", default=4, cast=int)
+
+# LLM Response Cache Configuration
+# Condensed job descriptions and resume-vs-JD scores are cached; override
+# per call type with LLM_CACHE_TTLS = {"resume_evaluation": seconds, ...}
+# (0 disables).
+LLM_CACHE_ENABLED = config("LLM_CACHE_ENABLED", default=True, cast=bool)
+LLM_CACHE_MAX_ENTRIES = config("LLM_CACHE_MAX_ENTRIES", default=2000, cast=int)
+
+# TTS Audio Cache Configuration
+# Question audio is stored once per text, voice and engine and shared by
+# every session; files no question uses are evicted above this size.
+TTS_CACHE_MAX_MB = config("TTS_CACHE_MAX_MB", default=1024, cast=int)
+# The questions of a session are synthesized in parallel, by at most this
+# many threads; a question whose audio takes longer is shown as text only.
+TTS_SYNTHESIS_CONCURRENCY = config("TTS_SYNTHESIS_CONCURRENCY", default=4, cast=int)
+TTS_SYNTHESIS_TIMEOUT_SECONDS = config(
+    "TTS_SYNTHESIS_TIMEOUT_SECONDS", default=15, cast=int
+)
+# Only the first questions of a session are synthesized in advance; the
+# portal requests the others' audio when it reaches them.
+TTS_PRESYNTHESIZE_QUESTIONS = config("TTS_PRESYNTHESIZE_QUESTIONS", default=1, cast=int)
+
+# TTS Engine Configuration
+# Engines are tried in this order: google_cloud, gtts, espeak (local
+# espeak-ng, encoded by ffmpeg) and silent (silence, for load tests). An
+# engine failing TTS_ENGINE_FAILURE_THRESHOLD times in a row is skipped for
+# TTS_ENGINE_RESET_SECONDS.
+TTS_ENGINE_ORDER = config(
+    "TTS_ENGINE_ORDER", default="google_cloud,gtts,espeak", cast=Csv()
+)
+TTS_ENGINE_TIMEOUT_SECONDS = config("TTS_ENGINE_TIMEOUT_SECONDS", default=10, cast=float)
+TTS_ENGINE_FAILURE_THRESHOLD = config("TTS_ENGINE_FAILURE_THRESHOLD", default=3, cast=int)
+TTS_ENGINE_RESET_SECONDS = config("TTS_ENGINE_RESET_SECONDS", default=60, cast=int)
+
+# Media Lifecycle Configuration
+# The sweep_media command applies per-category retention to MEDIA_ROOT:
+# MEDIA_RETENTION_DAYS = {"tts": 7, "id_card": 30, ...} overrides
+# media_lifecycle's defaults. MEDIA_ARCHIVE_AFTER_DAYS = {"upload": 90, ...}
+# compresses cold files no model refers to into MEDIA_ARCHIVE_ROOT (off by
+# default).
+MEDIA_RETENTION_DAYS = {}
+MEDIA_ARCHIVE_AFTER_DAYS = {}
+MEDIA_ARCHIVE_ROOT = config("MEDIA_ARCHIVE_ROOT", default=str(BASE_DIR / "media_archive"))
+MEDIA_SWEEP_BATCH_SIZE = config("MEDIA_SWEEP_BATCH_SIZE", default=500, cast=int)
+
+# Public AI Interview Configuration
+# Feedback on public AI interview answers is generated in the background,
+# for up to ANSWER_FEEDBACK_BATCH_SIZE answers of a session per AI call;
+# answers submitted within the window share a batch.
+ANSWER_FEEDBACK_BATCH_SIZE = config("ANSWER_FEEDBACK_BATCH_SIZE", default=5, cast=int)
+ANSWER_FEEDBACK_BATCH_WINDOW_SECONDS = config(
+    "ANSWER_FEEDBACK_BATCH_WINDOW_SECONDS", default=2, cast=float
+)
+# Finished AI interviews are scored in the background by one structured
+# call: total attempts including repairs of invalid JSON, and how long a
+# running evaluation may take before a retry may take it over. A failed
+# evaluation is retried up to INTERVIEW_EVALUATION_RETRIES times, waiting
+# INTERVIEW_EVALUATION_RETRY_BACKOFF_SECONDS, doubled on each retry.
+INTERVIEW_EVALUATION_MAX_ATTEMPTS = config(
+    "INTERVIEW_EVALUATION_MAX_ATTEMPTS", default=2, cast=int
+)
+INTERVIEW_EVALUATION_TIMEOUT_SECONDS = config(
+    "INTERVIEW_EVALUATION_TIMEOUT_SECONDS", default=300, cast=int
+)
+INTERVIEW_EVALUATION_RETRIES = config(
+    "INTERVIEW_EVALUATION_RETRIES", default=3, cast=int
+)
+INTERVIEW_EVALUATION_RETRY_BACKOFF_SECONDS = config(
+    "INTERVIEW_EVALUATION_RETRY_BACKOFF_SECONDS", default=30, cast=int
+)
+
+# Prompt Budget Configuration
+# Token budgets per call type override prompt_builder's defaults, e.g.
+# PROMPT_TOKEN_BUDGETS = {"answers_evaluation": 4000}. Job descriptions
+# longer than PROMPT_JD_SUMMARY_MIN_TOKENS are condensed (and cached).
+PROMPT_TOKEN_BUDGETS = {}
+PROMPT_JD_SUMMARY_MIN_TOKENS = config(
+    "PROMPT_JD_SUMMARY_MIN_TOKENS", default=400, cast=int
+)
+
+# Question Preparation Configuration
+# Structured question generation: total attempts, including repairs of
+# responses that fail schema validation.
+QUESTION_GENERATION_MAX_ATTEMPTS = config(
+    "QUESTION_GENERATION_MAX_ATTEMPTS", default=3, cast=int
+)
+
+# How long a preparation may run while the candidate is waiting before the
+# portal starts another, and when a preparation counts as stuck otherwise.
+QUESTION_PREPARATION_WAIT_SECONDS = config(
+    "QUESTION_PREPARATION_WAIT_SECONDS", default=30, cast=int
+)
+QUESTION_PREPARATION_TIMEOUT_SECONDS = config(
+    "QUESTION_PREPARATION_TIMEOUT_SECONDS", default=300, cast=int
+)
+
+# AI Evaluation Pipeline Configuration
+# Evaluation stages stuck in RUNNING longer than this are retried.
+EVALUATION_STAGE_TIMEOUT_SECONDS = config(
+    "EVALUATION_STAGE_TIMEOUT_SECONDS", default=300, cast=int
+)
 
 # Proctoring Configuration
 PROCTORING_ENABLED = config("PROCTORING_ENABLED", default=True, cast=bool)
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Compare transcription backends on a fixture corpus.
+
+For every backend and clip this reports the real-time factor (inference time
+divided by audio duration; below 1.0 is faster than real time) and the word
+error rate against the clip's reference transcript. Clips without a
+reference are scored against the openai-whisper transcript, which then
+measures agreement with the default backend rather than true accuracy.
+
+Usage:
+    python compare_transcription_backends.py
+    python compare_transcription_backends.py --backends openai-whisper faster-whisper
+    python compare_transcription_backends.py --corpus my_corpus.json --json results.json
+    python compare_transcription_backends.py --profile accurate --language en
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from pathlib import Path
+
+import django
+
+BASE_DIR = Path(__file__).resolve().parent
+sys.path.append(str(BASE_DIR))
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "ai_platform.settings")
+django.setup()
+
+from ai_platform.interview_app.audio_decode import decode_audio_bytes, SAMPLE_RATE
+from ai_platform.interview_app.transcription_backends import BACKENDS, get_backend
+
+DEFAULT_BACKEND = "openai-whisper"
+
+
+def normalize_words(text):
+    return re.sub(r"[^\w\s']", " ", text.lower()).split()
+
+
+def word_error_rate(reference, hypothesis):
+    """Word-level Levenshtein distance divided by the reference length."""
+    ref, hyp = normalize_words(reference), normalize_words(hypothesis)
+    if not ref:
+        return 0.0 if not hyp else 1.0
+    previous = list(range(len(hyp) + 1))
+    for i, ref_word in enumerate(ref, start=1):
+        current = [i] + [0] * len(hyp)
+        for j, hyp_word in enumerate(hyp, start=1):
+            current[j] = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (ref_word != hyp_word),
+            )
+        previous = current
+    return previous[-1] / len(ref)
+
+
+def load_corpus(path):
+    with open(path) as f:
+        manifest = json.load(f)
+    clips = []
+    for clip in manifest["clips"]:
+        audio_path = BASE_DIR / clip["audio"]
+        with open(audio_path, "rb") as f:
+            audio = decode_audio_bytes(f.read())
+        clips.append(
+            {
+                "name": clip["audio"],
+                "audio": audio,
+                "duration": len(audio) / SAMPLE_RATE,
+                "reference": clip.get("reference") or "",
+            }
+        )
+    return clips
+
+
+def run_backend(name, clips, language=None, profile=None):
+    backend = get_backend(name)
+    started_at = time.time()
+    backend.load()
+    load_seconds = time.time() - started_at
+
+    results = []
+    for clip in clips:
+        started_at = time.time()
+        text = backend.transcribe(clip["audio"], language, profile)["text"].strip()
+        inference_seconds = time.time() - started_at
+        results.append(
+            {
+                "clip": clip["name"],
+                "duration": round(clip["duration"], 2),
+                "inference_seconds": round(inference_seconds, 3),
+                "rtf": round(inference_seconds / clip["duration"], 3)
+                if clip["duration"]
+                else None,
+                "text": text,
+            }
+        )
+    return {"backend": name, "load_seconds": round(load_seconds, 2), "clips": results}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--corpus",
+        default=str(BASE_DIR / "test_files" / "transcription_corpus.json"),
+        help="JSON manifest listing clips and optional reference transcripts",
+    )
+    parser.add_argument(
+        "--backends",
+        nargs="+",
+        default=list(BACKENDS),
+        choices=list(BACKENDS),
+        help="Backends to compare (default: all)",
+    )
+    parser.add_argument(
+        "--profile", default=None, help="Decode profile, e.g. fast or accurate"
+    )
+    parser.add_argument(
+        "--language", default=None, help="Pin the language (default: detect)"
+    )
+    parser.add_argument("--json", help="Also write the full results to this file")
+    args = parser.parse_args()
+
+    clips = load_corpus(args.corpus)
+    print(f"Loaded {len(clips)} clip(s) from {args.corpus}")
+
+    # The default backend runs first so its transcripts can stand in for
+    # missing references.
+    backends = sorted(args.backends, key=lambda name: name != DEFAULT_BACKEND)
+    runs = []
+    for name in backends:
+        print(f"\nRunning {name}...")
+        try:
+            runs.append(run_backend(name, clips, args.language, args.profile))
+        except Exception as e:
+            print(f"  Skipped: {e}")
+
+    baseline = next((run for run in runs if run["backend"] == DEFAULT_BACKEND), None)
+    for run in runs:
+        for index, result in enumerate(run["clips"]):
+            reference = clips[index]["reference"]
+            result["reference"] = "fixture" if reference else DEFAULT_BACKEND
+            if not reference and baseline:
+                reference = baseline["clips"][index]["text"]
+            result["wer"] = (
+                round(word_error_rate(reference, result["text"]), 3)
+                if reference
+                else None
+            )
+
+    print(f"\n{'Backend':<16} {'Clip':<28} {'RTF':>7} {'WER':>7}  Reference")
+    for run in runs:
+        for result in run["clips"]:
+            wer = "-" if result["wer"] is None else f"{result['wer']:.3f}"
+            print(
+                f"{run['backend']:<16} {result['clip'][:28]:<28} "
+                f"{result['rtf']:>7} {wer:>7}  {result['reference']}"
+            )
+        clip_rtfs = [r["rtf"] for r in run["clips"] if r["rtf"] is not None]
+        if clip_rtfs:
+            print(
+                f"{run['backend']:<16} {'(mean)':<28} "
+                f"{sum(clip_rtfs) / len(clip_rtfs):>7.3f}"
+            )
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(runs, f, indent=2)
+        print(f"\nResults written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
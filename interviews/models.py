@@ -4,7 +4,7 @@ import hashlib
 import hmac
 import base64
 from datetime import datetime, timedelta, date, time
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
 from django.core.exceptions import ValidationError
 from django.utils.translation import gettext_lazy as _
@@ -396,8 +396,11 @@ class Interview(models.Model):
 
         # Create or update the InterviewSession
         from ai_platform.interview_app.models import InterviewSession
+        from ai_platform.interview_app.question_preparation import (
+            start_question_preparation,
+        )
 
-        InterviewSession.objects.get_or_create(
+        interview_session, created = InterviewSession.objects.get_or_create(
             session_key=session_key,
             defaults={
                 "candidate_name": self.candidate.full_name,
@@ -413,6 +416,11 @@ class Interview(models.Model):
                 "status": "SCHEDULED",
             },
         )
+        if created:
+            # Prepare questions and audio before the candidate opens the link.
+            transaction.on_commit(
+                lambda: start_question_preparation(interview_session)
+            )
 
         return link_token
 
@@ -194,11 +194,11 @@ class PublicInterviewAccessView(APIView):
             from django.shortcuts import redirect
             from ai_platform.interview_app.models import InterviewSession
 
-            # Create or get the AI interview session with a proper session key
-            # Generate a short session key for the interview portal
+            # Reuse the session created with the link, so refreshing the page
+            # doesn't start (and pay for) a fresh session every time
             import uuid
 
-            short_session_key = uuid.uuid4().hex
+            short_session_key = interview.session_key or uuid.uuid4().hex
 
             ai_session, created = InterviewSession.objects.get_or_create(
                 session_key=short_session_key,